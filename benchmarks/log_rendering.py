@@ -0,0 +1,64 @@
+"""Benchmark rendering a large page of container logs to the terminal.
+
+Compares the old path, one console.print per event with markup parsing and a datetime
+conversion each, against rendering the page as one Text written in a single print. Output
+goes to an in-memory terminal so only rendering cost is measured. Run with:
+
+    uv run python benchmarks/log_rendering.py
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from datetime import datetime
+
+from rich.console import Console
+
+from lazy_ecs.features.container.render import render_log_events
+
+EVENT_COUNT = 10_000
+BASE_TIMESTAMP_MS = 1_700_000_000_000
+
+
+def _events() -> list[dict]:
+    return [
+        {
+            "timestamp": BASE_TIMESTAMP_MS + i * 37,
+            "message": f"INFO request id=req-{i:06d} path=/api/orders/{i % 500} status=200 duration_ms={i % 250}\n",
+        }
+        for i in range(EVENT_COUNT)
+    ]
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=160, force_terminal=True, color_system="truecolor")
+
+
+def _per_event(console: Console, events: list[dict]) -> None:
+    """The rendering loop show_container_logs used before batching."""
+    for event in events:
+        timestamp = datetime.fromtimestamp(event["timestamp"] / 1000)
+        console.print(f"[{timestamp.strftime('%H:%M:%S')}] {event['message'].rstrip()}")
+
+
+def _batched(console: Console, events: list[dict]) -> None:
+    console.print(render_log_events(events), soft_wrap=True)
+
+
+def main() -> None:
+    events = _events()
+    results = {}
+    for name, render in (("per-event print", _per_event), ("batched page", _batched)):
+        console = _console()
+        start = time.perf_counter()
+        render(console, events)
+        seconds = time.perf_counter() - start
+        results[name] = EVENT_COUNT / seconds
+        print(f"{name}: {EVENT_COUNT} lines in {seconds:.2f}s ({results[name]:,.0f} lines/s)")
+
+    print(f"speedup: {results['batched page'] / results['per-event print']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
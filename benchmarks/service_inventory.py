@@ -0,0 +1,66 @@
+"""Benchmark service inventory loading against a moto-backed cluster with 1,000 services.
+
+Moto answers in-process, so a fixed per-request delay is injected to model the network
+round trip to the ECS API. Run with:
+
+    uv run python benchmarks/service_inventory.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import boto3
+from moto import mock_aws
+
+from lazy_ecs.core.batching import chunked
+from lazy_ecs.features.service.service import DESCRIBE_SERVICES_CHUNK_SIZE, ServiceService
+
+SERVICE_COUNT = 1000
+SIMULATED_LATENCY_SECONDS = 0.05
+
+
+def _add_latency(**_kwargs: Any) -> None:  # noqa: ANN401
+    time.sleep(SIMULATED_LATENCY_SECONDS)
+
+
+def _sequential_inventory(service: ServiceService, cluster_name: str) -> int:
+    """Describe services one chunk at a time, as a single-threaded loop would."""
+    names = service.get_services(cluster_name)
+    count = 0
+    for chunk in chunked(names, DESCRIBE_SERVICES_CHUNK_SIZE):
+        response = service.ecs_client.describe_services(cluster=cluster_name, services=chunk)
+        count += len(response.get("services", []))
+    return count
+
+
+def main() -> None:
+    with mock_aws():
+        client = boto3.client("ecs", region_name="us-east-1")
+        client.create_cluster(clusterName="benchmark")
+        client.register_task_definition(
+            family="bench-task", containerDefinitions=[{"name": "app", "image": "nginx", "memory": 128}]
+        )
+        for i in range(SERVICE_COUNT):
+            client.create_service(cluster="benchmark", serviceName=f"service-{i:04d}", taskDefinition="bench-task")
+
+        client.meta.events.register("before-call.ecs.DescribeServices", _add_latency)
+        service = ServiceService(client)
+
+        start = time.perf_counter()
+        sequential_count = _sequential_inventory(service, "benchmark")
+        sequential_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel_count = len(service.get_service_info("benchmark"))
+        parallel_seconds = time.perf_counter() - start
+
+    print(f"services: {SERVICE_COUNT}, simulated latency: {SIMULATED_LATENCY_SECONDS * 1000:.0f} ms/request")
+    print(f"sequential chunks: {sequential_count} services in {sequential_seconds:.2f}s")
+    print(f"parallel chunks:   {parallel_count} services in {parallel_seconds:.2f}s")
+    print(f"speedup: {sequential_seconds / parallel_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
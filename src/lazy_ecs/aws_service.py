@@ -5,11 +5,11 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from .core.types import LogConfig, ServiceEvent, ServiceInfo, TaskDetails, TaskInfo
+from .core.types import LogConfig, LogSource, ServiceEvent, ServiceInfo, TaskDetails, TaskInfo
 from .features.cluster.cluster import ClusterService
 from .features.container.container import ContainerService
 from .features.service.actions import ServiceActions
-from .features.service.service import ServiceService
+from .features.service.service import ServiceService, ServiceSnapshot
 from .features.task.task import TaskService
 
 if TYPE_CHECKING:
@@ -17,18 +17,31 @@ if TYPE_CHECKING:
     from mypy_boto3_logs.client import CloudWatchLogsClient
     from mypy_boto3_logs.type_defs import OutputLogEventTypeDef
 
+    from .core.batching import BatchResult
+    from .core.context import TaskSession
+    from .core.disk_cache import DiskCache
+    from .features.container.logs import TaggedStream
+
 
 class ECSService:
     """Service for interacting with AWS ECS."""
 
-    def __init__(self, ecs_client: ECSClient, logs_client: CloudWatchLogsClient | None = None) -> None:
+    def __init__(
+        self,
+        ecs_client: ECSClient,
+        logs_client: CloudWatchLogsClient | None = None,
+        disk_cache: DiskCache | None = None,
+        logs_client_factory: Callable[[], CloudWatchLogsClient] | None = None,
+    ) -> None:
         self.ecs_client = ecs_client
         # Initialize feature services
-        self._cluster = ClusterService(ecs_client)
-        self._service = ServiceService(ecs_client)
+        self._cluster = ClusterService(ecs_client, disk_cache)
+        self._service = ServiceService(ecs_client, disk_cache)
         self._service_actions = ServiceActions(ecs_client)
-        self._task = TaskService(ecs_client)
-        self._container = ContainerService(ecs_client, self._task, logs_client)
+        self._task = TaskService(ecs_client, disk_cache=disk_cache)
+        self._container = ContainerService(
+            ecs_client, self._task, logs_client, logs_client_factory=logs_client_factory, disk_cache=disk_cache
+        )
 
     def get_cluster_names(self) -> list[str]:
         """Get list of ECS cluster names from AWS."""
@@ -42,33 +55,106 @@ class ECSService:
         """Get detailed service information with status."""
         return self._service.get_service_info(cluster_name)
 
+    def prefetch_service_inventory(self, cluster_name: str) -> None:
+        """Load a cluster's service inventory ahead of time for the service menu."""
+        self._service.prefetch_service_inventory(cluster_name)
+
+    def prefetch_service_tasks(self, cluster_name: str, service_name: str) -> list[str]:
+        """Load a service's tasks ahead of time and return the task definition revisions they run."""
+        tasks = self._task.prefetch_service_tasks(cluster_name, service_name)
+        return list(dict.fromkeys(task["taskDefinitionArn"] for task in tasks))
+
+    def prefetch_task_definition(self, task_definition_arn: str) -> None:
+        """Load a task definition into the memory and disk caches."""
+        self._task.get_task_definition(task_definition_arn)
+
     def get_tasks(self, cluster_name: str, service_name: str) -> list[str]:
         """Get list of task ARNs for a service."""
         return self._task.get_tasks(cluster_name, service_name)
 
+    def get_service_snapshot(self, cluster_name: str, service_name: str) -> ServiceSnapshot | None:
+        """Get a snapshot of a service from a single describe_services response."""
+        return self._service.get_service_snapshot(cluster_name, service_name)
+
+    def refresh_service_snapshot(self, cluster_name: str, service_name: str) -> ServiceSnapshot | None:
+        """Describe a service again and return a fresh snapshot."""
+        return self._service.refresh_service_snapshot(cluster_name, service_name)
+
     def _with_desired_task_definition(
-        self, cluster_name: str, service_name: str, operation: Callable[[str | None], Any]
+        self,
+        cluster_name: str,
+        service_name: str,
+        operation: Callable[[str | None], Any],
+        snapshot: ServiceSnapshot | None = None,
     ) -> Any:  # noqa: ANN401
         """Helper to reduce repetition in task operations that need desired task definition."""
-        desired_task_def_arn = self._service.get_desired_task_definition_arn(cluster_name, service_name)
+        if snapshot is not None:
+            desired_task_def_arn = snapshot.desired_task_definition_arn
+        else:
+            desired_task_def_arn = self._service.get_desired_task_definition_arn(cluster_name, service_name)
         return operation(desired_task_def_arn)
 
-    def get_task_info(self, cluster_name: str, service_name: str) -> list[TaskInfo]:
+    def get_task_info(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> list[TaskInfo]:
         """Get detailed task information with human-readable names."""
         return self._with_desired_task_definition(
-            cluster_name, service_name, lambda arn: self._task.get_task_info(cluster_name, service_name, arn)
+            cluster_name, service_name, lambda arn: self._task.get_task_info(cluster_name, service_name, arn), snapshot
         )
 
-    def get_task_details(self, cluster_name: str, service_name: str, task_arn: str) -> TaskDetails | None:
+    def get_task_inventory(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> BatchResult[TaskInfo]:
+        """Get task information along with describe_tasks chunks that failed to load."""
+        return self._with_desired_task_definition(
+            cluster_name,
+            service_name,
+            lambda arn: self._task.get_task_inventory(cluster_name, service_name, arn),
+            snapshot,
+        )
+
+    def get_task_details(
+        self, cluster_name: str, service_name: str, task_arn: str, snapshot: ServiceSnapshot | None = None
+    ) -> TaskDetails | None:
         """Get comprehensive task details."""
         return self._with_desired_task_definition(
-            cluster_name, service_name, lambda arn: self._task.get_task_details(cluster_name, task_arn, arn)
+            cluster_name,
+            service_name,
+            lambda arn: self._task.get_task_details(cluster_name, service_name, task_arn, arn),
+            snapshot,
+        )
+
+    def get_task_session(
+        self, cluster_name: str, service_name: str, task_arn: str, snapshot: ServiceSnapshot | None = None
+    ) -> TaskSession | None:
+        """Load a task and its task definition once for all task and container actions."""
+        return self._with_desired_task_definition(
+            cluster_name,
+            service_name,
+            lambda arn: self._task.get_task_session(cluster_name, service_name, task_arn, arn),
+            snapshot,
         )
 
     def get_log_config(self, cluster_name: str, task_arn: str, container_name: str) -> LogConfig | None:
         """Get log configuration for a container."""
         return self._container.get_log_config(cluster_name, task_arn, container_name)
 
+    def get_service_log_sources(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> list[LogSource]:
+        """Get the log group and stream prefix of each container in the service's desired task definition."""
+
+        def log_sources(task_definition_arn: str | None) -> list[LogSource]:
+            if not task_definition_arn:
+                return []
+            return self._container.get_log_sources(self._task.get_task_definition(task_definition_arn))
+
+        return self._with_desired_task_definition(cluster_name, service_name, log_sources, snapshot)
+
+    def get_service_log_streams(self, cluster_name: str, service_name: str) -> list[TaggedStream]:
+        """Get the log stream of every container in every running task of a service."""
+        return self._container.get_service_log_streams(cluster_name, service_name)
+
     def get_container_logs(self, log_group: str, log_stream: str, lines: int = 50) -> list[OutputLogEventTypeDef]:
         """Get container logs from CloudWatch."""
         return self._container.get_container_logs(log_group, log_stream, lines)
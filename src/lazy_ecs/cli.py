@@ -0,0 +1,213 @@
+"""Interactive session: AWS setup and the cluster, service and task navigation loops."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import time
+
+from rich.console import Console
+
+from .aws_service import ECSService
+from .core.clients import AWSClientFactory
+from .core.context import TaskSession
+from .core.disk_cache import DiskCache, cached_account_id
+from .core.navigation import handle_navigation, parse_selection
+from .features.service.service import ServiceSnapshot
+from .ui import ECSNavigator
+
+console = Console()
+
+
+def run(args: argparse.Namespace, started_at: float) -> None:
+    """Run the interactive navigator with parsed command line arguments."""
+    console.print("🚀 Welcome to lazy-ecs!", style="bold cyan")
+    console.print("Interactive AWS ECS cluster navigator\n", style="dim")
+
+    def report_first_menu() -> None:
+        console.print(f"⏱️ First menu ready in {time.perf_counter() - started_at:.2f}s", style="dim")
+
+    try:
+        clients = AWSClientFactory(args.profile)
+        disk_cache = None if args.no_cache else _create_disk_cache(clients)
+        # The logs client is only built if a log view is opened
+        ecs_service = ECSService(clients.ecs(), disk_cache=disk_cache, logs_client_factory=clients.logs)
+        navigator = ECSNavigator(ecs_service, on_first_menu=report_first_menu if args.timings else None)
+
+        try:
+            _navigate_clusters(navigator, ecs_service)
+        finally:
+            navigator.close()
+
+    except Exception as e:
+        console.print(f"\n❌ Error: {e}", style="red")
+        console.print("Make sure your AWS credentials are configured.", style="dim")
+
+
+def _create_disk_cache(clients: AWSClientFactory) -> DiskCache | None:
+    """Create the on-disk metadata cache, partitioned by profile, region and account.
+
+    The account ID is remembered per credential identity, so STS is only called the first time.
+    """
+    try:
+        account_id = cached_account_id(_credential_identity(clients), clients.account_id)
+    except Exception:
+        # Caching is an optimization; run uncached rather than fail if the account cannot be resolved
+        return None
+    return DiskCache.for_account(clients.profile_name, clients.region_name, account_id)
+
+
+def _credential_identity(clients: AWSClientFactory) -> str:
+    """Key for the account the credentials belong to, built without any AWS call."""
+    # Credentials from the environment (e.g. aws-vault) can belong to any account whatever the profile
+    access_key_id = os.environ.get("AWS_ACCESS_KEY_ID", "")
+    key_digest = hashlib.sha256(access_key_id.encode()).hexdigest()[:16] if access_key_id else "-"
+    return "/".join([clients.session.profile_name or "default", clients.region_name or "default-region", key_digest])
+
+
+def _navigate_clusters(navigator: ECSNavigator, ecs_service: ECSService) -> None:
+    """Handle cluster-level navigation with back support."""
+    while True:
+        selected_cluster = navigator.select_cluster()
+
+        if not selected_cluster:
+            console.print("\n❌ No cluster selected. Goodbye!", style="yellow")
+            break
+
+        console.print(f"\n✅ Selected cluster: {selected_cluster}", style="green")
+
+        if _navigate_services(navigator, ecs_service, selected_cluster):
+            continue  # Back to cluster selection
+        break  # Exit was chosen
+
+
+def _navigate_services(navigator: ECSNavigator, ecs_service: ECSService, cluster_name: str) -> bool:
+    """Handle service-level navigation. Returns True if back was chosen, False if exit."""
+    while True:
+        service_selection = navigator.select_service(cluster_name)
+
+        # Handle navigation responses (back/exit)
+        should_continue, should_exit = handle_navigation(service_selection)
+        if not should_continue:
+            return not should_exit  # True for back, False for exit
+
+        selection_type, selected_service, _ = parse_selection(service_selection)
+        if selection_type == "action" and selected_service == "bulk_deploy":
+            navigator.handle_bulk_force_deployment(cluster_name)
+            continue  # Back to the service list
+        if selection_type == "action" and selected_service == "dashboard":
+            navigator.show_cluster_dashboard(cluster_name)
+            continue
+        if selection_type != "service":
+            return True
+        break
+
+    console.print(f"\n✅ Selected service: {selected_service}", style="green")
+
+    # One describe_services response answers the desired task definition, events and counts for this screen
+    snapshot = ecs_service.get_service_snapshot(cluster_name, selected_service)
+
+    while True:
+        selection = navigator.select_service_action(cluster_name, selected_service, snapshot)
+
+        # Handle navigation responses
+        should_continue, should_exit = handle_navigation(selection)
+        if not should_continue:
+            return not should_exit  # True for back, False for exit
+
+        selection_type, action_name, task_arn = parse_selection(selection)
+        if selection_type == "task" and action_name == "show_details":
+            # Load the task and its definition once; every container action below reuses them
+            session = ecs_service.get_task_session(cluster_name, selected_service, task_arn, snapshot)
+            if session:
+                navigator.display_task_details(session.details)
+                # Navigate to task features, handle back navigation
+                if _handle_task_features(navigator, ecs_service, session, snapshot):
+                    continue  # Back to service selection
+                return False  # Exit was chosen
+            console.print(f"\n⚠️ Could not fetch task details for {task_arn}", style="yellow")
+
+        elif selection_type == "action" and action_name == "force_deployment":
+            if navigator.handle_force_deployment(cluster_name, selected_service):
+                navigator.watch_service_rollout(cluster_name, selected_service)
+            # The deployment changes the service, so the snapshot is stale from here on
+            snapshot = ecs_service.refresh_service_snapshot(cluster_name, selected_service)
+            # Continue the loop to show the menu again
+
+        elif selection_type == "action" and action_name == "watch_rollout":
+            navigator.watch_service_rollout(cluster_name, selected_service)
+            snapshot = ecs_service.refresh_service_snapshot(cluster_name, selected_service)
+
+        elif selection_type == "action" and action_name == "show_events":
+            # Events should be current, and the fresh description also serves the rest of the menu
+            snapshot = ecs_service.refresh_service_snapshot(cluster_name, selected_service)
+            navigator.show_service_events(cluster_name, selected_service, snapshot)
+            # Continue the loop to show the menu again
+
+        elif selection_type == "action" and action_name == "show_logs":
+            navigator.show_service_logs(cluster_name, selected_service)
+
+        elif selection_type == "action" and action_name == "filter_logs":
+            navigator.filter_service_logs(cluster_name, selected_service, snapshot)
+
+        elif selection_type == "action" and action_name == "insights":
+            navigator.run_service_insights(cluster_name, selected_service, snapshot)
+
+        elif selection_type == "action" and action_name == "export_logs":
+            navigator.export_service_logs(cluster_name, selected_service, snapshot)
+
+
+def _handle_task_features(
+    navigator: ECSNavigator, ecs_service: ECSService, session: TaskSession, snapshot: ServiceSnapshot | None = None
+) -> bool:
+    """Handle task feature selection and execution. Returns True if back was chosen, False if exit."""
+    cluster_name = session.cluster_name
+    service_name = session.service_name
+    task_arn = session.task_arn
+
+    while True:
+        selection = navigator.select_task_feature(session.details)
+
+        # Handle navigation responses
+        should_continue, should_exit = handle_navigation(selection)
+        if not should_continue:
+            return not should_exit  # True for back, False for exit
+
+        selection_type, action_name, container_name = parse_selection(selection)
+        if selection_type == "container_action":
+            # Map action names to methods
+            action_methods = {
+                "show_logs": navigator.show_container_logs,
+                "page_logs": navigator.page_container_logs,
+                "follow_logs": navigator.follow_container_logs,
+                "browse_logs": navigator.browse_container_logs,
+                "filter_logs": navigator.filter_container_logs,
+                "export_logs": navigator.export_container_logs,
+                "insights": navigator.run_container_insights,
+                "show_env": navigator.show_container_environment_variables,
+                "show_secrets": navigator.show_container_secrets,
+                "show_ports": navigator.show_container_port_mappings,
+                "show_volumes": navigator.show_container_volume_mounts,
+            }
+
+            if action_name in action_methods:
+                action_methods[action_name](cluster_name, task_arn, container_name, session=session)
+
+        elif selection_type == "task_action":
+            if action_name == "show_history":
+                navigator.show_task_history(cluster_name, service_name)
+            elif action_name == "show_details":
+                navigator.display_task_details(session.details)
+            elif action_name == "show_logs":
+                navigator.show_task_logs(session)
+            elif action_name == "follow_logs":
+                navigator.follow_task_logs(session)
+            elif action_name == "refresh":
+                # The session is only reloaded on request, so the menu stays instant otherwise
+                refreshed = ecs_service.get_task_session(cluster_name, service_name, task_arn, snapshot)
+                if refreshed:
+                    session = refreshed
+                    navigator.display_task_details(session.details)
+                else:
+                    console.print(f"\n⚠️ Could not refresh task {task_arn}", style="yellow")
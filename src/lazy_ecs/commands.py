@@ -0,0 +1,167 @@
+"""Non-interactive commands that print ECS inventory and rollout progress as NDJSON, one JSON object per line.
+
+Records are written as soon as each page or describe chunk arrives, so a script piping the
+output sees the first lines early and memory stays flat on large accounts. Nothing here
+imports rich or questionary.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .core.clients import AWSClientFactory
+from .features.cluster.cluster import ClusterService
+from .features.service.rollout import IN_PROGRESS, ROLLOUT_EXIT_STATUSES, watch_rollout
+from .features.service.service import ServiceService
+from .features.task.task import TaskService
+
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import TextIO
+
+    from mypy_boto3_ecs.client import ECSClient
+
+Record = dict[str, Any]
+
+
+class CommandError(Exception):
+    """A command cannot run as asked, e.g. the service does not exist."""
+
+
+def iter_clusters(ecs_client: ECSClient) -> Iterator[Record]:
+    """One record per cluster."""
+    for name in ClusterService(ecs_client).iter_cluster_names():
+        yield {"cluster": name}
+
+
+def iter_services(ecs_client: ECSClient, cluster: str) -> Iterator[Record]:
+    """One record per service in a cluster, with its status and task counts."""
+    for snapshot in ServiceService(ecs_client).iter_service_snapshots(cluster):
+        info = snapshot.info
+        yield {
+            "cluster": cluster,
+            "service": snapshot.service_name,
+            "status": info["status"],
+            "running_count": info["running_count"],
+            "desired_count": info["desired_count"],
+            "pending_count": info["pending_count"],
+            "task_definition": snapshot.desired_task_definition_arn,
+        }
+
+
+def iter_tasks(ecs_client: ECSClient, cluster: str, service: str) -> Iterator[Record]:
+    """One record per running task of a service."""
+    snapshot = ServiceService(ecs_client).refresh_service_snapshot(cluster, service)
+    if snapshot is None:
+        raise CommandError(f"service {service!r} not found in cluster {cluster!r}")
+
+    task_service = TaskService(ecs_client)
+    tasks = task_service.iter_described_tasks(cluster, task_service.iter_task_arns(cluster, service))
+    for task in tasks:
+        yield {
+            "cluster": cluster,
+            "service": service,
+            "task_arn": task["taskArn"],
+            "task_definition": task["taskDefinitionArn"],
+            "is_desired": task["taskDefinitionArn"] == snapshot.desired_task_definition_arn,
+            "last_status": task.get("lastStatus"),
+            "health_status": task.get("healthStatus"),
+            "created_at": task.get("createdAt"),
+            "started_at": task.get("startedAt"),
+        }
+
+
+def iter_events(ecs_client: ECSClient, cluster: str, service: str) -> Iterator[Record]:
+    """One record per recent service event, most recent first."""
+    snapshot = ServiceService(ecs_client).refresh_service_snapshot(cluster, service)
+    if snapshot is None:
+        raise CommandError(f"service {service!r} not found in cluster {cluster!r}")
+
+    for event in snapshot.events:
+        yield {"cluster": cluster, "service": service, **event}
+
+
+def wait_for_rollout(ecs_client: ECSClient, cluster: str, service: str, timeout: float, out: TextIO) -> int:
+    """Write new events and rollout status until the service is steady or failed; return the exit status.
+
+    Exits 0 when steady, 1 when the deployment failed and 2 when `timeout` seconds pass first.
+    """
+    service_service = ServiceService(ecs_client)
+    snapshot = service_service.refresh_service_snapshot(cluster, service)
+    if snapshot is None:
+        raise CommandError(f"service {service!r} not found in cluster {cluster!r}")
+
+    progress = None
+    for progress in watch_rollout(service_service, snapshot, timeout=timeout):
+        records = [{"cluster": cluster, "service": service, "kind": "event", **event} for event in progress.new_events]
+        current = progress.snapshot
+        records.append(
+            {
+                "cluster": cluster,
+                "service": service,
+                "kind": "status",
+                "state": progress.state,
+                "running_count": current.running_count,
+                "desired_count": current.desired_count,
+                "pending_count": current.pending_count,
+                "deployments": [
+                    {
+                        "id": deployment.get("id"),
+                        "status": deployment.get("status"),
+                        "rollout_state": deployment.get("rolloutState"),
+                        "running_count": deployment.get("runningCount", 0),
+                        "desired_count": deployment.get("desiredCount", 0),
+                    }
+                    for deployment in current.deployments
+                ],
+            }
+        )
+        write_records(records, out)
+    if progress is None:
+        # Nothing was reported, so the rollout counts as unfinished, like a timeout
+        return ROLLOUT_EXIT_STATUSES[IN_PROGRESS]
+    return progress.exit_status
+
+
+COMMANDS: dict[str, Callable[[ECSClient, argparse.Namespace], Iterator[Record]]] = {
+    "clusters": lambda client, _args: iter_clusters(client),
+    "services": lambda client, args: iter_services(client, args.cluster),
+    "tasks": lambda client, args: iter_tasks(client, args.cluster, args.service),
+    "events": lambda client, args: iter_events(client, args.cluster, args.service),
+}
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run a scripting command and return the process exit status."""
+    try:
+        ecs_client = AWSClientFactory(args.profile).ecs()
+        if args.command == "wait":
+            return wait_for_rollout(ecs_client, args.cluster, args.service, args.timeout, sys.stdout)
+        write_records(COMMANDS[args.command](ecs_client, args), sys.stdout)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); point stdout at devnull so the exit flush stays quiet
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"lazy-ecs {args.command}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def write_records(records: Iterable[Record], out: TextIO) -> None:
+    """Write each record as a line of JSON, flushing so readers get it right away."""
+    for record in records:
+        out.write(json.dumps(record, default=_json_default) + "\n")
+        out.flush()
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
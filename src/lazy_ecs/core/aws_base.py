@@ -0,0 +1,15 @@
+"""Base class for AWS services, kept free of UI imports so scripted commands can use the services."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mypy_boto3_ecs.client import ECSClient
+
+
+class BaseAWSService:
+    """Base class for AWS service interactions with common patterns."""
+
+    def __init__(self, ecs_client: ECSClient) -> None:
+        self.ecs_client = ecs_client
@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from rich.console import Console
 
+from .aws_base import BaseAWSService
 from .navigation import select_with_navigation
 
-if TYPE_CHECKING:
-    from mypy_boto3_ecs.client import ECSClient
+__all__ = ["BaseAWSService", "BaseUIComponent"]
 
+T = TypeVar("T")
 
-class BaseAWSService:
-    """Base class for AWS service interactions with common patterns."""
-
-    def __init__(self, ecs_client: ECSClient) -> None:
-        self.ecs_client = ecs_client
+_background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lazy-ecs-background")
 
 
 class BaseUIComponent:
@@ -25,9 +24,19 @@ class BaseUIComponent:
     def __init__(self, console: Console | None = None) -> None:
         self.console = console or Console()
 
-    def select_with_nav(self, prompt: str, choices: list[dict[str, str]], back_text: str) -> str | None:
+    def select_with_nav(
+        self,
+        prompt: str,
+        choices: list[dict[str, str]],
+        back_text: str,
+        refresh: Future[list[dict[str, str]]] | None = None,
+    ) -> str | None:
         """Standard selection with back/exit navigation."""
-        return select_with_navigation(prompt, choices, back_text)
+        return select_with_navigation(prompt, choices, back_text, refresh)
+
+    def run_in_background(self, operation: Callable[[], T]) -> Future[T]:
+        """Run an operation on the shared background pool, e.g. refreshing a menu shown from cache."""
+        return _background_executor.submit(operation)
 
     def display_table(self, data: list[dict[str, Any]], title: str | None = None) -> None:
         """Display data in a formatted table (placeholder for future rich table)."""
@@ -0,0 +1,94 @@
+"""Helpers for splitting AWS calls into size-limited chunks and running them concurrently."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class ChunkFailure:
+    """A chunk of items whose request failed."""
+
+    items: list[str]
+    reason: str
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    """Results of a chunked fetch, in input order, plus any per-chunk failures."""
+
+    results: list[R] = field(default_factory=list)
+    failures: list[ChunkFailure] = field(default_factory=list)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def fetch_in_chunks(
+    items: list[str],
+    chunk_size: int,
+    fetch: Callable[[list[str]], list[R]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BatchResult[R]:
+    """Run `fetch` over chunks of `items` on a bounded thread pool, keeping input order."""
+    chunks = list(chunked(items, chunk_size))
+    if not chunks:
+        return BatchResult()
+
+    def run(chunk: list[str]) -> tuple[list[str], list[R] | None, str | None]:
+        try:
+            return chunk, fetch(chunk), None
+        except Exception as e:
+            return chunk, None, str(e)
+
+    batch: BatchResult[R] = BatchResult()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        # executor.map yields in submission order, so results stay stable regardless of completion order
+        for chunk, results, error in executor.map(run, chunks):
+            if results is None:
+                batch.failures.append(ChunkFailure(items=chunk, reason=error or "unknown error"))
+            else:
+                batch.results.extend(results)
+    return batch
+
+
+def stream_chunks(
+    chunks: Iterable[list[str]],
+    fetch: Callable[[list[str]], list[R]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[R]:
+    """Run `fetch` over chunks as they are produced and yield results as each chunk completes.
+
+    Chunks are pulled lazily, so a paginated producer keeps paging while earlier chunks are in
+    flight. At most `max_workers` chunks are outstanding at once. Errors propagate to the caller.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: set[Future[list[R]]] = set()
+    try:
+        for chunk in chunks:
+            # Block only when the pool is saturated; otherwise just drain what has already finished
+            timeout = None if len(pending) >= max_workers else 0
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+            pending.add(executor.submit(fetch, chunk))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
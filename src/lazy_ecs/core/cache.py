@@ -0,0 +1,78 @@
+"""In-process caches for immutable ECS data."""
+
+from __future__ import annotations
+
+import re
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mypy_boto3_ecs.client import ECSClient
+    from mypy_boto3_ecs.type_defs import TaskDefinitionTypeDef, TaskTypeDef
+
+# A task definition ARN pinned to a revision, e.g. arn:aws:ecs:us-east-1:123:task-definition/web:42
+_REVISION_ARN = re.compile(r"^arn:[^:]+:ecs:[^:]*:\d*:task-definition/[^:]+:\d+$")
+
+
+def is_revision_arn(task_definition: str) -> bool:
+    """Whether a task definition reference names a specific, immutable revision."""
+    return bool(_REVISION_ARN.match(task_definition))
+
+
+class TaskDefinitionStore:
+    """Process-wide store of task definitions keyed by full revision ARN.
+
+    A `family:revision` task definition can never change, so entries never expire. The store also
+    remembers which revision each task runs, which is equally immutable for the life of a task.
+    """
+
+    def __init__(self) -> None:
+        self._definitions: dict[str, TaskDefinitionTypeDef] = {}
+        self._task_definition_arns: dict[str, str] = {}
+        self._lock = Lock()
+
+    def get(self, task_definition_arn: str) -> TaskDefinitionTypeDef | None:
+        """Return a cached task definition, or None if it has not been seen yet."""
+        return self._definitions.get(task_definition_arn)
+
+    def put(self, task_definition: TaskDefinitionTypeDef) -> None:
+        """Store a task definition from any describe_task_definition response."""
+        arn = task_definition.get("taskDefinitionArn")
+        if arn:
+            with self._lock:
+                self._definitions[arn] = task_definition
+
+    def get_or_fetch(self, ecs_client: ECSClient, task_definition: str) -> TaskDefinitionTypeDef:
+        """Return a task definition, calling describe_task_definition only on a miss.
+
+        References without a revision (a bare family name) can point at a new revision at any time,
+        so they are always fetched, but the response still fills the store.
+        """
+        if is_revision_arn(task_definition):
+            cached = self.get(task_definition)
+            if cached is not None:
+                return cached
+
+        response = ecs_client.describe_task_definition(taskDefinition=task_definition)
+        definition = response["taskDefinition"]
+        self.put(definition)
+        return definition
+
+    def remember_task(self, task: TaskTypeDef) -> None:
+        """Record the task definition revision a task runs."""
+        with self._lock:
+            self._task_definition_arns[task["taskArn"]] = task["taskDefinitionArn"]
+
+    def get_for_task(self, task_arn: str) -> TaskDefinitionTypeDef | None:
+        """Return the cached task definition for a task, if both the task and its revision are known."""
+        task_definition_arn = self._task_definition_arns.get(task_arn)
+        return self.get(task_definition_arn) if task_definition_arn else None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._definitions.clear()
+            self._task_definition_arns.clear()
+
+
+task_definition_store = TaskDefinitionStore()
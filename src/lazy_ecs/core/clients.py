@@ -0,0 +1,79 @@
+"""Shared boto3 session and lazily created AWS service clients."""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import boto3
+from botocore.config import Config
+
+if TYPE_CHECKING:
+    from mypy_boto3_ecs.client import ECSClient
+    from mypy_boto3_logs.client import CloudWatchLogsClient
+
+# Sized for the concurrent describe chunks plus background refresh and prefetch workers,
+# so parallel calls do not queue on (or discard) pooled connections
+MAX_POOL_CONNECTIONS = 16
+
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={
+        "max_attempts": 2,  # Reduce from default 3 for faster failure
+        "mode": "adaptive",
+    },
+)
+
+
+class AWSClientFactory:
+    """Creates AWS clients from one boto3 session, each on first use.
+
+    Every client shares the session, so credentials (including SSO or assume-role lookups)
+    are resolved once per run. Clients nobody asks for, such as CloudWatch Logs in a run that
+    never opens logs, are never built.
+    """
+
+    def __init__(self, profile_name: str | None = None, config: Config = CLIENT_CONFIG) -> None:
+        self.profile_name = profile_name
+        self.config = config
+        self._session: boto3.Session | None = None
+        self._clients: dict[str, Any] = {}
+        # boto3 sessions are not safe to create clients from concurrently
+        self._lock = Lock()
+
+    @property
+    def session(self) -> boto3.Session:
+        """The boto3 session shared by every client."""
+        with self._lock:
+            return self._get_session()
+
+    @property
+    def region_name(self) -> str | None:
+        """Region the session resolved from the profile or environment."""
+        return self.session.region_name
+
+    def client(self, service_name: str) -> Any:  # noqa: ANN401
+        """Return the client for a service, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                client = self._get_session().client(service_name, config=self.config)
+                self._clients[service_name] = client
+            return client
+
+    def ecs(self) -> ECSClient:
+        """ECS client."""
+        return self.client("ecs")
+
+    def logs(self) -> CloudWatchLogsClient:
+        """CloudWatch Logs client."""
+        return self.client("logs")
+
+    def account_id(self) -> str:
+        """AWS account ID of the resolved credentials."""
+        return self.client("sts").get_caller_identity()["Account"]
+
+    def _get_session(self) -> boto3.Session:
+        if self._session is None:
+            self._session = boto3.Session(profile_name=self.profile_name) if self.profile_name else boto3.Session()
+        return self._session
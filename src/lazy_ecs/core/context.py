@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from mypy_boto3_ecs.type_defs import ContainerDefinitionOutputTypeDef, TaskDefinitionTypeDef
+    from mypy_boto3_ecs.type_defs import ContainerDefinitionOutputTypeDef, TaskDefinitionTypeDef, TaskTypeDef
+
+    from .types import TaskDetails
 
 
 @dataclass
@@ -29,3 +31,33 @@ class ContainerContext:
     def short_task_id(self) -> str:
         """Extract short task ID for display."""
         return self.task_id[:8]
+
+
+@dataclass
+class TaskSession:
+    """A task and its task definition, loaded once and shared by every action on the task."""
+
+    cluster_name: str
+    service_name: str
+    task: TaskTypeDef
+    task_definition: TaskDefinitionTypeDef
+    details: TaskDetails
+
+    @property
+    def task_arn(self) -> str:
+        """ARN of the task this session was loaded for."""
+        return self.task["taskArn"]
+
+    def container_context(self, container_name: str) -> ContainerContext | None:
+        """Build a container context from the loaded task definition without calling AWS."""
+        for container_def in self.task_definition["containerDefinitions"]:
+            if container_def["name"] == container_name:
+                return ContainerContext(
+                    cluster_name=self.cluster_name,
+                    service_name=self.service_name,
+                    task_arn=self.task_arn,
+                    container_name=container_name,
+                    task_definition=self.task_definition,
+                    container_definition=container_def,
+                )
+        return None
@@ -0,0 +1,179 @@
+"""Persistent on-disk cache for ECS metadata that survives between runs."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CACHE_DIR_NAME = "lazy-ecs"
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+# Evict down to this fraction of the cap, leaving room for many writes before the next eviction
+EVICTION_TARGET_RATIO = 0.8
+ENTRY_SUFFIX = ".json.z"
+# Account IDs per credential identity, kept at the cache root so a launch skips the STS call
+ACCOUNT_IDS_FILE_NAME = "account-ids.json"
+# Temporary credentials (e.g. aws-vault) add an identity per session, so only the newest are kept
+MAX_ACCOUNT_IDS = 100
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def default_cache_root() -> Path:
+    """Return the XDG cache directory for lazy-ecs."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / CACHE_DIR_NAME
+
+
+def cached_account_id(identity: str, resolve: Callable[[], str], root: Path | None = None) -> str:
+    """Return the account ID recorded for `identity`, calling `resolve` only when none is recorded yet."""
+    path = (root or default_cache_root()) / ACCOUNT_IDS_FILE_NAME
+    try:
+        account_ids = json.loads(path.read_text())
+    except (OSError, ValueError):
+        account_ids = {}
+    if not isinstance(account_ids, dict):
+        account_ids = {}
+
+    account_id = account_ids.get(identity)
+    if isinstance(account_id, str):
+        return account_id
+
+    account_id = resolve()
+    account_ids[identity] = account_id
+    kept = dict(list(account_ids.items())[-MAX_ACCOUNT_IDS:])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(kept))
+        tmp_path.replace(path)
+    except OSError:
+        pass
+    return account_id
+
+
+def _encode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_value(value: dict[str, Any]) -> Any:  # noqa: ANN401
+    if "__datetime__" in value and len(value) == 1:
+        return datetime.fromisoformat(value["__datetime__"])
+    return value
+
+
+def serialize(value: Any) -> bytes:  # noqa: ANN401
+    """Serialize a JSON-like value (datetimes allowed) into compact compressed bytes."""
+    text = json.dumps(value, default=_encode_value, separators=(",", ":"))
+    return zlib.compress(text.encode(), level=6)
+
+
+def deserialize(data: bytes) -> Any:  # noqa: ANN401
+    """Inverse of `serialize`."""
+    return json.loads(zlib.decompress(data), object_hook=_decode_value)
+
+
+class DiskCache:
+    """Key/value cache stored as one compressed file per key, capped in size with LRU eviction.
+
+    Entries carry the time they were stored, so callers choose per read how old is too old:
+    immutable data is read without an age limit, listings with a TTL.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Running size of the directory, so writes only scan it once the cap may have been crossed.
+        # Overwrites count twice, which only makes the next scan (and correction) come sooner.
+        self._estimated_bytes: int | None = None
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def for_account(
+        cls, profile_name: str | None, region: str | None, account_id: str, root: Path | None = None
+    ) -> DiskCache:
+        """Create a cache partitioned by profile, region and account."""
+        parts = [profile_name or "default", region or "default-region", account_id]
+        directory = (root or default_cache_root()).joinpath(*(_UNSAFE_PATH_CHARS.sub("_", part) for part in parts))
+        return cls(directory)
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}{ENTRY_SUFFIX}"
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:  # noqa: ANN401
+        """Return the cached value, or None if missing, unreadable or older than `max_age` seconds."""
+        path = self._path_for(key)
+        try:
+            entry = deserialize(path.read_bytes())
+        except (OSError, ValueError, zlib.error):
+            return None
+
+        if entry.get("key") != key:
+            return None
+        if max_age is not None and time.time() - entry.get("stored_at", 0) > max_age:
+            return None
+
+        # Reads refresh the modification time, which is what LRU eviction orders by
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry.get("value")
+
+    def put(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a value, evicting least recently used entries if the cache is over its size cap."""
+        path = self._path_for(key)
+        data = serialize({"key": key, "stored_at": time.time(), "value": value})
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError:
+            return
+
+        with self._size_lock:
+            if self._estimated_bytes is not None:
+                self._estimated_bytes += len(data)
+                if self._estimated_bytes <= self.max_bytes:
+                    return
+            self._estimated_bytes = self._evict_if_needed()
+
+    def _evict_if_needed(self) -> int | None:
+        """Scan the directory, evict down to the target if it is over the cap, and return its size."""
+        entries: list[tuple[float, int, str]] = []
+        try:
+            for entry in os.scandir(self.directory):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return None
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        for _, size, entry_path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                Path(entry_path).unlink()
+                total -= size
+            except OSError:
+                continue
+        return total
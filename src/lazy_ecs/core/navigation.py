@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+
 import questionary
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.key_binding.key_processor import KeyPressEvent
 from prompt_toolkit.keys import Keys
+from questionary.prompts.common import InquirerControl
 from rich.console import Console
 
+REFRESH_VALUE = "navigation:refresh"
+REFRESH_TEXT = "🔄 Refresh list (r)"
+REFRESH_CHANGED_TEXT = "🔄 List changed, press r to refresh (r)"
+
 
 def parse_selection(selected: str | None) -> tuple[str, str, str]:
     """Parse selection into (type, value, extra). Returns ('unknown', selected, '') if no colon."""
@@ -79,13 +86,35 @@ def add_navigation_choices_with_shortcuts(choices: list[dict[str, str]], back_te
     return nav_choices
 
 
-def select_with_navigation(prompt: str, choices: list[dict[str, str]], back_text: str | None) -> str | None:
-    """Standard selection with back/exit navigation and ESC key support."""
+def select_with_navigation(
+    prompt: str,
+    choices: list[dict[str, str]],
+    back_text: str | None,
+    refresh: Future[list[dict[str, str]]] | None = None,
+) -> str | None:
+    """Standard selection with back/exit navigation and ESC key support.
+
+    When `refresh` is given, `choices` are a cached snapshot and the future resolves to the fresh
+    choices. The prompt offers an 'r' refresh entry whose label changes if the fresh list differs.
+    """
     # Use the shortcut version for 'b' and 'q' keys
     nav_choices = add_navigation_choices_with_shortcuts(choices, back_text)
 
+    refresh_choice = None
+    if refresh is not None:
+        refresh_choice = questionary.Choice(REFRESH_TEXT, REFRESH_VALUE, shortcut_key="r")
+        nav_choices.insert(len(choices), refresh_choice)
+
+    # questionary can only assign shortcut keys to a limited number of choices
+    use_shortcuts = len(nav_choices) <= len(InquirerControl.SHORTCUT_KEYS)
+
     # Create a questionary select question
-    question = questionary.select(prompt, choices=nav_choices, style=get_questionary_style(), use_shortcuts=True)
+    question = questionary.select(
+        prompt, choices=nav_choices, style=get_questionary_style(), use_shortcuts=use_shortcuts
+    )
+
+    if refresh is not None and refresh_choice is not None:
+        _watch_refresh(question, refresh, refresh_choice, choices)
 
     # Add ESC key binding by accessing the underlying application
     if hasattr(question, "application"):
@@ -97,6 +126,12 @@ def select_with_navigation(prompt: str, choices: list[dict[str, str]], back_text
             """Handle ESC key press by setting result to navigation:back."""
             event.app.exit(result="navigation:back")
 
+        if not use_shortcuts:
+            # questionary ignores shortcut keys on long lists, so bind the navigation ones (b, q, r) directly
+            for choice in nav_choices:
+                if isinstance(choice.shortcut_key, str):
+                    _bind_shortcut(custom_bindings, choice.shortcut_key, choice.value)
+
         # Get the existing bindings and merge them
         if hasattr(question.application, "key_bindings") and question.application.key_bindings:
             # Create a new key bindings object that includes both
@@ -113,3 +148,27 @@ def select_with_navigation(prompt: str, choices: list[dict[str, str]], back_text
             question.application.key_bindings = merged_bindings
 
     return question.ask()
+
+
+def _bind_shortcut(bindings: KeyBindings, key: str, value: str) -> None:
+    @bindings.add(key)
+    def _(event: KeyPressEvent) -> None:
+        event.app.exit(result=value)
+
+
+def _watch_refresh(
+    question: questionary.Question,
+    refresh: Future[list[dict[str, str]]],
+    refresh_choice: questionary.Choice,
+    shown_choices: list[dict[str, str]],
+) -> None:
+    """Relabel the refresh entry of an open prompt once fresh choices arrive and differ."""
+
+    def on_refreshed(future: Future[list[dict[str, str]]]) -> None:
+        if future.cancelled() or future.exception() is not None or future.result() == shown_choices:
+            return
+        refresh_choice.title = REFRESH_CHANGED_TEXT
+        if hasattr(question, "application"):
+            question.application.invalidate()
+
+    refresh.add_done_callback(on_refreshed)
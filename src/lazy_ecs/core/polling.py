@@ -0,0 +1,79 @@
+"""Helpers for live views that poll AWS and stop on a key press."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Event, Thread
+
+# How often the key watcher checks for input; short enough that ESC feels immediate
+KEY_POLL_SECONDS = 0.05
+
+
+@dataclass
+class AdaptiveInterval:
+    """Poll interval that backs off while nothing changes and snaps back once something does."""
+
+    minimum: float = 1.0
+    maximum: float = 10.0
+    factor: float = 2.0
+    current: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.current = self.minimum
+
+    def reset(self) -> float:
+        """Go back to the shortest interval, e.g. after new data arrived."""
+        self.current = self.minimum
+        return self.current
+
+    def back_off(self) -> float:
+        """Lengthen the interval after a poll that returned nothing new."""
+        self.current = min(self.current * self.factor, self.maximum)
+        return self.current
+
+
+@contextmanager
+def stop_on_escape(stop: Event) -> Iterator[None]:
+    """Set `stop` when ESC, q or Ctrl-C is pressed while the block runs, or when the block raises.
+
+    A block that finishes normally leaves `stop` as it was, so callers can tell a completed run
+    from a cancelled one. Does nothing when stdin is not a terminal, so callers can always wrap
+    their loop in it.
+    """
+    if not sys.stdin.isatty():
+        yield
+        return
+
+    from prompt_toolkit.input import create_input
+    from prompt_toolkit.keys import Keys
+
+    stop_keys = {Keys.Escape, Keys.ControlC, "q"}
+    terminal_input = create_input()
+    # Ends the watcher without touching the caller's event
+    done = Event()
+
+    def watch() -> None:
+        # Raw mode delivers single key presses without echo; Ctrl-C arrives as a key, not a signal
+        with terminal_input.raw_mode():
+            while not done.is_set() and not stop.is_set():
+                # A lone ESC is only reported once flushed, since it may start an escape sequence
+                key_presses = terminal_input.read_keys() + terminal_input.flush_keys()
+                if any(key_press.key in stop_keys for key_press in key_presses):
+                    stop.set()
+                done.wait(KEY_POLL_SECONDS)
+
+    watcher = Thread(target=watch, name="lazy-ecs-keys", daemon=True)
+    watcher.start()
+    try:
+        yield
+    except BaseException:
+        # Let background work tied to `stop` wind down when the block fails
+        stop.set()
+        raise
+    finally:
+        done.set()
+        # Wait for the watcher so the terminal is out of raw mode before the next prompt
+        watcher.join(timeout=1)
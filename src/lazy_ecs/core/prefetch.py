@@ -0,0 +1,141 @@
+"""Speculative background fetching of the next navigation level."""
+
+from __future__ import annotations
+
+import contextlib
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+DEFAULT_PREFETCH_WORKERS = 4
+DEFAULT_API_BUDGET = 2
+# Jobs make one AWS call at a time, so the per-API budget bounds the calls in flight rather than the jobs
+PREFETCH_MAX_WORKERS = 1
+# How long a foreground call waits for an in-flight prefetch of the same data before fetching itself
+SETTLE_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass
+class _Job:
+    key: str
+    api: str
+    scope: str
+    operation: Callable[[], Any]
+    future: Future[Any] = field(default_factory=Future)
+    started: bool = False
+
+
+class Prefetcher:
+    """Runs prefetch jobs on a bounded pool, with at most a fixed number in flight per AWS API.
+
+    Jobs are keyed, so scheduling the same data twice is a no-op, and belong to a scope such as
+    `cluster` or `cluster/service`. Jobs should fetch with `PREFETCH_MAX_WORKERS` threads so a
+    budget slot stands for one AWS call. Queued jobs outside the scope the user is in can be cancelled;
+    jobs that already started run to completion, since an in-flight AWS call cannot be interrupted.
+    Results are not returned to the UI directly: jobs fill the service caches the UI reads from.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        api_budget: dict[str, int] | None = None,
+        default_budget: int = DEFAULT_API_BUDGET,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lazy-ecs-prefetch")
+        self._api_budget = api_budget or {}
+        self._default_budget = default_budget
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._queued: dict[str, deque[_Job]] = defaultdict(deque)
+        self._jobs: dict[str, _Job] = {}
+        self._lock = Lock()
+        self._closed = False
+
+    def schedule(self, key: str, api: str, operation: Callable[[], Any], scope: str = "") -> Future[Any]:
+        """Schedule `operation` unless a job for `key` is already queued or running."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                return job.future
+
+            job = _Job(key=key, api=api, scope=scope, operation=operation)
+            if self._closed:
+                job.future.cancel()
+                return job.future
+
+            self._jobs[key] = job
+            if self._in_flight[api] < self._budget(api):
+                self._start(job)
+            else:
+                self._queued[api].append(job)
+            return job.future
+
+    def settle(self, key: str, timeout: float = SETTLE_TIMEOUT_SECONDS) -> None:
+        """Prepare for a foreground fetch of `key`: wait for a running prefetch, drop a queued one."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+            if not job.started:
+                self._cancel(job)
+                return
+        wait([job.future], timeout=timeout)
+
+    def cancel_outside(self, scope: str) -> None:
+        """Cancel queued jobs that do not belong to `scope` or one of its sub-scopes."""
+        with self._lock:
+            for queue in self._queued.values():
+                for job in list(queue):
+                    if not _in_scope(job.scope, scope):
+                        self._cancel(job)
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop accepting new ones without waiting for running jobs."""
+        with self._lock:
+            self._closed = True
+            for queue in self._queued.values():
+                for job in list(queue):
+                    self._cancel(job)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _budget(self, api: str) -> int:
+        return self._api_budget.get(api, self._default_budget)
+
+    def _start(self, job: _Job) -> None:
+        job.started = True
+        self._in_flight[job.api] += 1
+        self._executor.submit(self._run, job)
+
+    def _cancel(self, job: _Job) -> None:
+        with contextlib.suppress(ValueError):
+            self._queued[job.api].remove(job)
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        job.future.cancel()
+
+    def _run(self, job: _Job) -> None:
+        try:
+            if job.future.set_running_or_notify_cancel():
+                try:
+                    job.future.set_result(job.operation())
+                except Exception as e:
+                    # Prefetching is best effort; the foreground call will fetch and report errors itself
+                    job.future.set_exception(e)
+        finally:
+            self._finish(job)
+
+    def _finish(self, job: _Job) -> None:
+        with self._lock:
+            self._in_flight[job.api] -= 1
+            # Finished jobs are forgotten so the same key can be warmed again once caches expire
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+            queue = self._queued[job.api]
+            if queue and not self._closed:
+                self._start(queue.popleft())
+
+
+def _in_scope(job_scope: str, scope: str) -> bool:
+    return job_scope == scope or job_scope.startswith(f"{scope}/")
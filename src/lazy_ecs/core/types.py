@@ -43,6 +43,12 @@ class LogConfig(TypedDict):
     log_stream: str
 
 
+class LogSource(TypedDict):
+    container_name: str
+    log_group: str
+    stream_prefix: str  # Matches the streams of every task running the container, or one exact stream
+
+
 class ContainerHistoryInfo(TypedDict):
     name: str
     exit_code: int | None
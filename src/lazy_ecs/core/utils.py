@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from rich.console import Console
+from functools import cache
+from typing import TYPE_CHECKING
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def _console() -> Console:
+    # Created on first message, so importing the helpers below does not load rich
+    from rich.console import Console
+
+    return Console()
 
 
 def extract_name_from_arn(arn: str) -> str:
@@ -24,16 +34,16 @@ def determine_service_status(running_count: int, desired_count: int, pending_cou
 
 
 def print_error(message: str) -> None:
-    console.print(f"❌ {message}", style="red")
+    _console().print(f"❌ {message}", style="red")
 
 
 def print_success(message: str) -> None:
-    console.print(f"✅ {message}", style="green")
+    _console().print(f"✅ {message}", style="green")
 
 
 def print_warning(message: str) -> None:
-    console.print(f"⚠️ {message}", style="yellow")
+    _console().print(f"⚠️ {message}", style="yellow")
 
 
 def print_info(message: str) -> None:
-    console.print(message, style="blue")
+    _console().print(message, style="blue")
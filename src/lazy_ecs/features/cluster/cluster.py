@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ...core.base import BaseAWSService
+from ...core.aws_base import BaseAWSService
 from ...core.utils import extract_name_from_arn
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from mypy_boto3_ecs.client import ECSClient
 
+    from ...core.disk_cache import DiskCache
+
+CLUSTER_NAMES_CACHE_KEY = "cluster-names"
+CLUSTER_NAMES_TTL_SECONDS = 300
+
 
 class ClusterService(BaseAWSService):
     """Service for ECS cluster operations."""
 
-    def __init__(self, ecs_client: ECSClient) -> None:
+    def __init__(self, ecs_client: ECSClient, disk_cache: DiskCache | None = None) -> None:
         super().__init__(ecs_client)
+        self.disk_cache = disk_cache
 
     def get_cluster_names(self) -> list[str]:
-        """Get list of ECS cluster names from AWS."""
-        response = self.ecs_client.list_clusters()
-        cluster_arns = response.get("clusterArns", [])
-        return [extract_name_from_arn(arn) for arn in cluster_arns]
+        """Get list of ECS cluster names, from the disk cache when it is fresh enough."""
+        if self.disk_cache:
+            cached = self.disk_cache.get(CLUSTER_NAMES_CACHE_KEY, max_age=CLUSTER_NAMES_TTL_SECONDS)
+            if cached is not None:
+                return cached
+        return self.fetch_cluster_names()
+
+    def get_cached_cluster_names(self) -> list[str] | None:
+        """Get the last-known cluster names regardless of age, or None if none are cached."""
+        return self.disk_cache.get(CLUSTER_NAMES_CACHE_KEY) if self.disk_cache else None
+
+    def fetch_cluster_names(self) -> list[str]:
+        """Get list of ECS cluster names from AWS and refresh the disk cache."""
+        cluster_names = list(self.iter_cluster_names())
+        if self.disk_cache:
+            self.disk_cache.put(CLUSTER_NAMES_CACHE_KEY, cluster_names)
+        return cluster_names
+
+    def iter_cluster_names(self) -> Iterator[str]:
+        """Yield cluster names from AWS as each list_clusters page arrives."""
+        params: dict[str, Any] = {}
+        while True:
+            response = self.ecs_client.list_clusters(**params)
+            yield from (extract_name_from_arn(arn) for arn in response.get("clusterArns", []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                return
+            params["nextToken"] = next_token
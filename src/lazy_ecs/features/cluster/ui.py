@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 
 from ...core.base import BaseUIComponent
-from ...core.navigation import handle_navigation, select_with_navigation
+from ...core.navigation import REFRESH_VALUE, handle_navigation, select_with_navigation
+from ...core.utils import print_warning
 from .cluster import ClusterService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
 console = Console()
 
 
@@ -18,22 +25,43 @@ class ClusterUI(BaseUIComponent):
         super().__init__()
         self.cluster_service = cluster_service
 
-    def select_cluster(self) -> str:
-        """Interactive cluster selection."""
-        cluster_names = self.cluster_service.get_cluster_names()
+    def select_cluster(self, on_choices: Callable[[list[str]], None] | None = None) -> str:
+        """Interactive cluster selection.
+
+        If a snapshot of the cluster list is cached it is shown immediately while the list is
+        refreshed in the background; the prompt offers 'r' to switch to the fresh list.
+        `on_choices` is called with the cluster names each time a list is about to be shown.
+        """
+        refresh: Future[list[dict[str, str]]] | None = None
+        cluster_names = self.cluster_service.get_cached_cluster_names()
+        if cluster_names:
+            refresh = self._refresh_choices()
+        else:
+            cluster_names = self.cluster_service.get_cluster_names()
 
         if not cluster_names:
             console.print("❌ No ECS clusters found", style="red")
             return ""
 
         # Convert cluster names to choice format
-        choices = [{"name": name, "value": name} for name in cluster_names]
+        choices = _cluster_choices(cluster_names)
 
-        selected = select_with_navigation(
-            "Select an ECS cluster:",
-            choices,
-            None,  # No back option for top-level menu
-        )
+        while True:
+            if on_choices:
+                on_choices([choice["value"] for choice in choices])
+            selected = select_with_navigation(
+                "Select an ECS cluster:",
+                choices,
+                None,  # No back option for top-level menu
+                refresh,
+            )
+            if selected != REFRESH_VALUE or refresh is None:
+                break
+            try:
+                choices = refresh.result()
+            except Exception as e:
+                print_warning(f"Could not refresh cluster list: {e}")
+            refresh = self._refresh_choices()
 
         # Handle navigation responses
         should_continue, _should_exit = handle_navigation(selected)
@@ -41,3 +69,10 @@ class ClusterUI(BaseUIComponent):
             return ""  # Exit was chosen
 
         return selected or ""
+
+    def _refresh_choices(self) -> Future[list[dict[str, str]]]:
+        return self.run_in_background(lambda: _cluster_choices(self.cluster_service.fetch_cluster_names()))
+
+
+def _cluster_choices(cluster_names: list[str]) -> list[dict[str, str]]:
+    return [{"name": name, "value": name} for name in cluster_names]
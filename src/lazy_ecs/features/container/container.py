@@ -2,38 +2,96 @@
 
 from __future__ import annotations
 
+import re
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-from ...core.base import BaseAWSService
-from ...core.context import ContainerContext
-from ...core.types import LogConfig
+from ...core.aws_base import BaseAWSService
+from ...core.cache import TaskDefinitionStore, task_definition_store
+from ...core.context import ContainerContext, TaskSession
+from ...core.types import LogConfig, LogSource
+from .export import ExportResult, ExportSource, export_logs
+from .insights import InsightsResult, InsightsResultCache, run_insights_query
+from .logs import (
+    LogPage,
+    LogPager,
+    TaggedStream,
+    follow_log_events,
+    follow_merged_log_events,
+    iter_filtered_log_events,
+    iter_merged_tail,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from threading import Event
+
     from mypy_boto3_ecs.client import ECSClient
     from mypy_boto3_ecs.type_defs import ContainerDefinitionOutputTypeDef, TaskDefinitionTypeDef
     from mypy_boto3_logs.client import CloudWatchLogsClient
-    from mypy_boto3_logs.type_defs import OutputLogEventTypeDef
+    from mypy_boto3_logs.type_defs import FilteredLogEventTypeDef, OutputLogEventTypeDef
 
+    from ...core.disk_cache import DiskCache
     from ..task.task import TaskService
 
 
+# Candidates listed when a container has no awslogs configuration
+LOG_GROUP_CANDIDATES = 10
+LOG_GROUP_MAX_PAGES = 5
+LOG_GROUPS_TTL_SECONDS = 600
+_LOG_GROUP_PATTERN_UNSAFE = re.compile(r"[^A-Za-z0-9._/#-]")
+
+
 class ContainerService(BaseAWSService):
     """Service for ECS container operations."""
 
     def __init__(
-        self, ecs_client: ECSClient, task_service: TaskService, logs_client: CloudWatchLogsClient | None = None
+        self,
+        ecs_client: ECSClient,
+        task_service: TaskService,
+        logs_client: CloudWatchLogsClient | None = None,
+        task_definitions: TaskDefinitionStore | None = None,
+        logs_client_factory: Callable[[], CloudWatchLogsClient] | None = None,
+        disk_cache: DiskCache | None = None,
     ) -> None:
         super().__init__(ecs_client)
         self.task_service = task_service
-        self.logs_client = logs_client
+        self.disk_cache = disk_cache
+        self._logs_client = logs_client
+        self._logs_client_factory = logs_client_factory
+        self.task_definitions = task_definitions or task_definition_store
+        self._log_pager: LogPager | None = None
+        self.insights_cache = InsightsResultCache()
+
+    @property
+    def logs_client(self) -> CloudWatchLogsClient | None:
+        """CloudWatch Logs client, created the first time logs are needed."""
+        if self._logs_client is None and self._logs_client_factory is not None:
+            self._logs_client = self._logs_client_factory()
+        return self._logs_client
+
+    @logs_client.setter
+    def logs_client(self, logs_client: CloudWatchLogsClient | None) -> None:
+        self._logs_client = logs_client
+        self._log_pager = None
+
+    @property
+    def log_pager(self) -> LogPager | None:
+        """Pager over the logs client, holding the page cache for this session."""
+        if self._log_pager is None and self.logs_client is not None:
+            self._log_pager = LogPager(self.logs_client)
+        return self._log_pager
 
     def get_container_context(self, cluster_name: str, task_arn: str, container_name: str) -> ContainerContext | None:
         """Create a rich container context for operations."""
-        result = self.task_service.get_task_and_definition(cluster_name, task_arn)
-        if not result:
-            return None
-
-        _task, task_definition = result
+        # A task never changes revision, so a known task needs no API calls at all
+        task_definition = self.task_definitions.get_for_task(task_arn)
+        if task_definition is None:
+            result = self.task_service.get_task_and_definition(cluster_name, task_arn)
+            if not result:
+                return None
+            _task, task_definition = result
 
         # Find the container definition
         for container_def in task_definition["containerDefinitions"]:
@@ -63,23 +121,66 @@ class ContainerService(BaseAWSService):
         context = self.get_container_context(cluster_name, task_arn, container_name)
         if not context:
             return None
+        return self.get_log_config_for_context(context)
 
-        log_config = context.container_definition.get("logConfiguration", {})
-
-        if log_config.get("logDriver") != "awslogs":
-            return None
-
-        options = log_config.get("options") or {}
-        log_group = options.get("awslogs-group") if options else None
-        stream_prefix = options.get("awslogs-stream-prefix", "ecs") if options else "ecs"
-
-        if not log_group:
+    def get_log_config_for_context(self, context: ContainerContext) -> LogConfig | None:
+        """Get log configuration from an already loaded container context."""
+        awslogs = _awslogs_group_and_prefix(context.container_definition)
+        if not awslogs:
             return None
 
-        log_stream = f"{stream_prefix}/{container_name}/{context.task_id}"
+        log_group, stream_prefix = awslogs
+        log_stream = f"{stream_prefix}/{context.container_name}/{context.task_id}"
 
         return {"log_group": log_group, "log_stream": log_stream}
 
+    def get_log_sources(self, task_definition: TaskDefinitionTypeDef) -> list[LogSource]:
+        """Get the log group and stream prefix of every container in a task definition that uses awslogs."""
+        sources: list[LogSource] = []
+        for container_def in task_definition["containerDefinitions"]:
+            awslogs = _awslogs_group_and_prefix(container_def)
+            if awslogs:
+                log_group, stream_prefix = awslogs
+                container_name = container_def["name"]
+                sources.append(
+                    {
+                        "container_name": container_name,
+                        "log_group": log_group,
+                        # The trailing slash keeps "web" from also matching "web-sidecar" streams
+                        "stream_prefix": f"{stream_prefix}/{container_name}/",
+                    }
+                )
+        return sources
+
+    def get_service_log_streams(self, cluster_name: str, service_name: str) -> list[TaggedStream]:
+        """Resolve the log stream of every awslogs container in every running task of a service."""
+        task_arns = list(self.task_service.iter_task_arns(cluster_name, service_name))
+        tasks = self.task_service.describe_tasks(cluster_name, task_arns).results
+        # Load each distinct revision once, so get_log_config resolves every task from memory
+        for task_definition_arn in {task["taskDefinitionArn"] for task in tasks}:
+            self.task_service.get_task_definition(task_definition_arn)
+
+        container_names = {container["name"] for task in tasks for container in task.get("containers", [])}
+        streams: list[TaggedStream] = []
+        for task in tasks:
+            task_id = task["taskArn"].split("/")[-1][:8]
+            for container in task.get("containers", []):
+                log_config = self.get_log_config(cluster_name, task["taskArn"], container["name"])
+                if log_config:
+                    tag = task_id if len(container_names) == 1 else f"{task_id}/{container['name']}"
+                    streams.append(TaggedStream(tag, log_config["log_group"], log_config["log_stream"]))
+        return streams
+
+    def get_task_log_streams(self, session: TaskSession) -> list[TaggedStream]:
+        """Resolve the log stream of every awslogs container in a loaded task, tagged by container name."""
+        streams: list[TaggedStream] = []
+        for container in session.task.get("containers", []):
+            context = session.container_context(container["name"])
+            log_config = self.get_log_config_for_context(context) if context else None
+            if log_config:
+                streams.append(TaggedStream(container["name"], log_config["log_group"], log_config["log_stream"]))
+        return streams
+
     def get_environment_variables(self, context: ContainerContext) -> dict[str, str]:
         """Get environment variables for a container."""
         environment = context.container_definition.get("environment", [])
@@ -92,28 +193,123 @@ class ContainerService(BaseAWSService):
 
     def get_container_logs(self, log_group: str, log_stream: str, lines: int = 50) -> list[OutputLogEventTypeDef]:
         """Get container logs from CloudWatch."""
+        page = self.get_log_page(log_group, log_stream, lines=lines)
+        return page.events if page else []
+
+    def get_log_page(
+        self, log_group: str, log_stream: str, token: str | None = None, lines: int = 50, prefetch_older: bool = False
+    ) -> LogPage | None:
+        """Get a page of container logs: the latest with no token, older pages via nextBackwardToken."""
+        if not self.log_pager:
+            return None
+        return self.log_pager.get_page(log_group, log_stream, token, lines, prefetch_older)
+
+    def follow_container_logs(
+        self, log_group: str, log_stream: str, lines: int = 50, stop: Event | None = None
+    ) -> Iterator[list[OutputLogEventTypeDef]]:
+        """Yield the tail of a log stream, then batches of new events until `stop` is set."""
+        if not self.logs_client:
+            return iter(())
+        return follow_log_events(self.logs_client, log_group, log_stream, lines, stop)
+
+    def get_merged_logs(
+        self, streams: list[TaggedStream], lines: int = 50
+    ) -> list[tuple[TaggedStream, OutputLogEventTypeDef]]:
+        """Get the latest `lines` events across several streams, oldest first."""
         if not self.logs_client:
             return []
-        response = self.logs_client.get_log_events(
-            logGroupName=log_group, logStreamName=log_stream, limit=lines, startFromHead=False
+        latest = list(islice(iter_merged_tail(self.logs_client, streams, page_size=lines), lines))
+        latest.reverse()
+        return latest
+
+    def follow_merged_logs(
+        self, streams: list[TaggedStream], lines: int = 50, stop: Event | None = None
+    ) -> Iterator[list[tuple[TaggedStream, OutputLogEventTypeDef]]]:
+        """Yield the merged tail of several streams, then interleaved batches of new events until `stop` is set."""
+        if not self.logs_client:
+            return iter(())
+        return follow_merged_log_events(self.logs_client, streams, lines, stop)
+
+    def filter_logs(
+        self,
+        log_group: str,
+        pattern: str,
+        start_time: int,
+        end_time: int | None = None,
+        stream_prefix: str | None = None,
+        stop: Event | None = None,
+    ) -> Iterator[list[FilteredLogEventTypeDef]]:
+        """Yield pages of events matching a CloudWatch filter pattern within a time window (epoch millis)."""
+        if not self.logs_client:
+            return iter(())
+        return iter_filtered_log_events(
+            self.logs_client, log_group, pattern, start_time, end_time, stream_prefix, stop=stop
         )
-        return response.get("events", [])
 
-    def list_log_groups(self, cluster_name: str, container_name: str) -> list[str]:
-        """List available log groups for debugging."""
+    def export_logs(
+        self,
+        sources: list[ExportSource],
+        path: Path,
+        start_time: int,
+        end_time: int,
+        stop: Event | None = None,
+        on_page: Callable[[ExportResult], None] | None = None,
+    ) -> ExportResult | None:
+        """Export every event of `sources` in a time window (epoch millis) to a gzip NDJSON file, resumably."""
         if not self.logs_client:
-            return []
+            return None
+        return export_logs(self.logs_client, sources, path, start_time, end_time, stop, on_page)
 
-        response = self.logs_client.describe_log_groups(limit=50)
-        groups = response.get("logGroups", [])
+    def run_insights_query(
+        self, log_groups: list[str], query: str, start_time: int, end_time: int, stop: Event | None = None
+    ) -> Iterator[InsightsResult]:
+        """Run a Logs Insights query over a window in epoch seconds, yielding results as rows arrive."""
+        if not self.logs_client:
+            return iter(())
+        return run_insights_query(self.logs_client, log_groups, query, start_time, end_time, self.insights_cache, stop)
 
-        relevant_groups = []
-        for group in groups[:10]:
-            name = group["logGroupName"]
-            if cluster_name.lower() in name.lower() or container_name.lower() in name.lower() or "ecs" in name.lower():
-                relevant_groups.append(name)
+    def list_log_groups(self, cluster_name: str, container_name: str, limit: int = LOG_GROUP_CANDIDATES) -> list[str]:
+        """Find log groups likely to hold a container's logs, best candidates first.
 
-        return relevant_groups
+        Each search term is matched by CloudWatch (logGroupNamePattern), so the whole account
+        is searched rather than the first page of groups. Results are kept in the disk cache,
+        which is partitioned per account, for a few minutes.
+        """
+        if not self.logs_client:
+            return []
+
+        names: dict[str, None] = {}
+        for term in (container_name, cluster_name):
+            for name in self._search_log_groups(term):
+                names[name] = None
+        return sorted(names, key=lambda name: _rank_log_group(name, cluster_name, container_name))[:limit]
+
+    def _search_log_groups(self, term: str) -> list[str]:
+        """Names of the log groups whose name contains `term`, paginated up to a fixed number of pages."""
+        # logGroupNamePattern only accepts these characters
+        pattern = _LOG_GROUP_PATTERN_UNSAFE.sub("", term)
+        if not pattern or not self.logs_client:
+            return []
+
+        cache_key = f"log-groups:{pattern.lower()}"
+        if self.disk_cache:
+            cached = self.disk_cache.get(cache_key, max_age=LOG_GROUPS_TTL_SECONDS)
+            if cached is not None:
+                return cached
+
+        names: list[str] = []
+        params: dict[str, Any] = {"logGroupNamePattern": pattern, "limit": 50}
+        for _page in range(LOG_GROUP_MAX_PAGES):
+            response = self.logs_client.describe_log_groups(**params)
+            names.extend(group["logGroupName"] for group in response.get("logGroups", []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+            params["nextToken"] = next_token
+
+        if self.disk_cache:
+            self.disk_cache.put(cache_key, names)
+        return names
 
     def get_port_mappings(self, context: ContainerContext) -> list[dict[str, Any]]:
         """Get port mappings for a container."""
@@ -149,3 +345,34 @@ class ContainerService(BaseAWSService):
             volume_mounts.append(volume_mount)
 
         return volume_mounts
+
+
+def _rank_log_group(name: str, cluster_name: str, container_name: str) -> tuple[int, int, str]:
+    """Sort key for log group candidates: whole-segment matches first, then ECS groups, then shorter names."""
+    segments = {segment for segment in re.split(r"[/._#-]+", name.lower()) if segment}
+    lowered = name.lower()
+    score = 0
+    for term, weight in ((container_name.lower(), 4), (cluster_name.lower(), 3)):
+        if term in segments:
+            score += weight
+        elif term and term in lowered:
+            score += 1
+    if "ecs" in segments:
+        score += 1
+    return -score, len(name), name
+
+
+def _awslogs_group_and_prefix(container_def: ContainerDefinitionOutputTypeDef) -> tuple[str, str] | None:
+    """Return (log group, stream prefix) for a container using the awslogs driver."""
+    log_config = container_def.get("logConfiguration", {})
+
+    if log_config.get("logDriver") != "awslogs":
+        return None
+
+    options = log_config.get("options") or {}
+    log_group = options.get("awslogs-group") if options else None
+    stream_prefix = options.get("awslogs-stream-prefix", "ecs") if options else "ecs"
+
+    if not log_group:
+        return None
+    return log_group, stream_prefix
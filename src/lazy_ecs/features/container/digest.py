@@ -0,0 +1,99 @@
+"""Condense log output: collapse repeated lines and summarize the event rate."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mypy_boto3_logs.type_defs import OutputLogEventTypeDef
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+SPARKLINE_MINUTES = 60
+MINUTE_MS = 60_000
+
+# Parts of a line that differ between otherwise identical messages: UUIDs, long hex IDs
+# (request IDs, hashes, addresses) and numbers (timestamps, durations, counters)
+_VARIABLE_PARTS = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|\b(?:0x)?(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b"
+    r"|\d+(?:\.\d+)?"
+)
+
+
+def normalize_message(message: str) -> str:
+    """Reduce a message to its shape, so lines that differ only in numbers and IDs compare equal."""
+    return _VARIABLE_PARTS.sub("#", message.strip())
+
+
+@dataclass
+class CollapsedLine:
+    """A line to show and how many consecutive events with the same shape it stands for."""
+
+    event: OutputLogEventTypeDef
+    count: int = 1
+    # The run started in an earlier batch, whose first line was already shown
+    continued: bool = False
+    # Position of the event in the batch it was fed in, to find what was computed for it per page
+    index: int = 0
+
+
+class LineCollapser:
+    """Collapses runs of consecutive lines with the same normalized shape.
+
+    Only the shape of the last line is kept between calls, so feeding batches one at a time
+    (as follow mode does) collapses a run across batches without looking at history again.
+    """
+
+    def __init__(self) -> None:
+        self._last_shape: str | None = None
+
+    def feed(self, events: Iterable[OutputLogEventTypeDef]) -> list[CollapsedLine]:
+        """Collapse a batch of events, continuing the run left open by the previous batch."""
+        lines: list[CollapsedLine] = []
+        for index, event in enumerate(events):
+            shape = normalize_message(event["message"])
+            if shape != self._last_shape:
+                lines.append(CollapsedLine(event, index=index))
+                self._last_shape = shape
+            elif lines:
+                lines[-1].count += 1
+            else:
+                lines.append(CollapsedLine(event, continued=True, index=index))
+        return lines
+
+
+def collapse_repeats(events: Iterable[OutputLogEventTypeDef]) -> list[CollapsedLine]:
+    """Collapse runs of same-shaped lines in one page of events."""
+    return LineCollapser().feed(events)
+
+
+class EventRate:
+    """Per-minute event counts, updated one batch at a time."""
+
+    def __init__(self) -> None:
+        self.per_minute: Counter[int] = Counter()
+
+    def add(self, events: Iterable[OutputLogEventTypeDef]) -> None:
+        """Count a batch of events into their minutes."""
+        self.per_minute.update(event["timestamp"] // MINUTE_MS for event in events)
+
+    def sparkline(self, minutes: int = SPARKLINE_MINUTES) -> str:
+        """One block per minute from the first counted minute to the last, at most the last `minutes`."""
+        if not self.per_minute:
+            return ""
+        last = max(self.per_minute)
+        first = max(min(self.per_minute), last - minutes + 1)
+        counts = [self.per_minute.get(minute, 0) for minute in range(first, last + 1)]
+        peak = max(counts)
+        # Scale to the busiest minute; any minute with events gets at least the lowest block
+        return "".join(" " if count == 0 else SPARK_BLOCKS[(count * len(SPARK_BLOCKS) - 1) // peak] for count in counts)
+
+    @property
+    def peak(self) -> int:
+        """Most events in a single minute."""
+        return max(self.per_minute.values(), default=0)
@@ -0,0 +1,252 @@
+"""Streaming, resumable export of CloudWatch logs to gzip-compressed NDJSON."""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Queue
+from threading import Event
+from typing import TYPE_CHECKING, Any
+
+from ...core.batching import DEFAULT_MAX_WORKERS
+
+if TYPE_CHECKING:
+    from mypy_boto3_logs.client import CloudWatchLogsClient
+
+# Pages waiting to be written; bounds memory when CloudWatch is faster than the disk
+EXPORT_QUEUE_PAGES = 16
+
+
+@dataclass(frozen=True)
+class ExportSource:
+    """One log stream (read with get_log_events) or stream prefix (read with filter_log_events) to export."""
+
+    tag: str
+    log_group: str
+    log_stream: str | None = None
+    stream_prefix: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Identifies the source in the checkpoint."""
+        return f"{self.log_group}:{self.log_stream or self.stream_prefix or ''}"
+
+
+@dataclass
+class ExportResult:
+    """What an export run wrote, and whether it finished or can be resumed."""
+
+    path: Path
+    events: int = 0
+    pages: int = 0
+    resumed: bool = False
+    complete: bool = False
+
+
+@dataclass
+class _Page:
+    source: ExportSource
+    events: list[dict[str, Any]]
+    next_token: str | None
+    done: bool = False
+    # The last item a reader sends, whether it finished its source or was stopped
+    final: bool = False
+
+
+@dataclass
+class _Checkpoint:
+    start_time: int
+    end_time: int
+    size: int = 0
+    events: int = 0
+    tokens: dict[str, str | None] = field(default_factory=dict)
+    done: set[str] = field(default_factory=set)
+
+
+def checkpoint_path(path: Path) -> Path:
+    """Where the checkpoint of an export to `path` is kept while the export is unfinished."""
+    return path.with_name(f"{path.name}.checkpoint.json")
+
+
+def read_checkpoint_window(path: Path) -> tuple[int, int] | None:
+    """Time window (epoch millis) of an interrupted export to `path`, if one can be resumed."""
+    checkpoint = _load_checkpoint(path)
+    return (checkpoint.start_time, checkpoint.end_time) if checkpoint else None
+
+
+def export_logs(
+    logs_client: CloudWatchLogsClient,
+    sources: list[ExportSource],
+    path: Path,
+    start_time: int,
+    end_time: int,
+    stop: Event | None = None,
+    on_page: Callable[[ExportResult], None] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> ExportResult:
+    """Write every event of `sources` in the window to `path` as gzip-compressed NDJSON.
+
+    Sources are read in parallel and each page is appended as its own gzip member as soon
+    as it arrives, so only a bounded queue of pages is ever in memory. After each page the
+    next token of its source and the file size are saved to a checkpoint; rerunning the same
+    export after an interruption truncates any half-written member and carries on from the
+    saved tokens. Events are ordered within a source, not across sources.
+    """
+    stop = stop or Event()
+    checkpoint = _load_checkpoint(path)
+    resumed = checkpoint is not None and (checkpoint.start_time, checkpoint.end_time) == (start_time, end_time)
+    if checkpoint is None or not resumed:
+        checkpoint = _Checkpoint(start_time, end_time)
+    result = ExportResult(path=path, events=checkpoint.events, resumed=resumed)
+
+    pending = [source for source in sources if source.key not in checkpoint.done]
+    pages: Queue[_Page | BaseException] = Queue(EXPORT_QUEUE_PAGES)
+
+    def read(source: ExportSource) -> None:
+        token = checkpoint.tokens.get(source.key)
+        try:
+            while not stop.is_set():
+                events, next_token = _fetch_page(logs_client, source, start_time, end_time, token)
+                done = next_token is None
+                pages.put(_Page(source, events, next_token, done=done, final=done))
+                if done:
+                    return
+                token = next_token
+        except Exception as e:
+            pages.put(e)
+            return
+        pages.put(_Page(source, [], token, final=True))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    failure: BaseException | None = None
+    with path.open("r+b" if resumed else "wb") as output:
+        # Anything past the checkpointed size was written after the last checkpoint
+        output.truncate(checkpoint.size)
+        output.seek(checkpoint.size)
+
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(pending)), thread_name_prefix="lazy-ecs-export"
+            ) as executor:
+                for source in pending:
+                    executor.submit(read, source)
+
+                active = len(pending)
+                try:
+                    while active:
+                        page = pages.get()
+                        if isinstance(page, BaseException):
+                            # Stop the other readers, but keep writing the pages they already fetched
+                            failure = failure or page
+                            stop.set()
+                            active -= 1
+                            continue
+
+                        if page.events:
+                            output.write(gzip.compress(_to_ndjson(page.source, page.events)))
+                            output.flush()
+                            result.events += len(page.events)
+                            result.pages += 1
+                        checkpoint.tokens[page.source.key] = page.next_token
+                        if page.done:
+                            checkpoint.done.add(page.source.key)
+                        checkpoint.size = output.tell()
+                        checkpoint.events = result.events
+                        _save_checkpoint(path, checkpoint)
+                        if page.events and on_page:
+                            on_page(result)
+                        if page.final:
+                            active -= 1
+                except BaseException:
+                    # Interrupted (Ctrl-C) or failed to write: unblock the readers and discard their
+                    # pages; the checkpoint still points at the last page that reached the file
+                    stop.set()
+                    while active:
+                        page = pages.get()
+                        if isinstance(page, BaseException) or page.final:
+                            active -= 1
+                    raise
+
+    if failure is not None:
+        raise failure
+
+    result.complete = all(source.key in checkpoint.done for source in sources)
+    if result.complete:
+        with contextlib.suppress(FileNotFoundError):
+            checkpoint_path(path).unlink()
+    return result
+
+
+def _fetch_page(
+    logs_client: CloudWatchLogsClient, source: ExportSource, start_time: int, end_time: int, token: str | None
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read one page of a source; the returned token is None once the source is exhausted."""
+    params: dict[str, Any] = {"logGroupName": source.log_group, "startTime": start_time, "endTime": end_time}
+    if token:
+        params["nextToken"] = token
+
+    if source.log_stream:
+        response = logs_client.get_log_events(**params, logStreamName=source.log_stream, startFromHead=True)
+        next_token = response.get("nextForwardToken")
+        # The forward token stops changing at the end of the window
+        return list(response.get("events", [])), None if next_token in (None, token) else next_token
+
+    if source.stream_prefix:
+        params["logStreamNamePrefix"] = source.stream_prefix
+    response = logs_client.filter_log_events(**params)
+    return list(response.get("events", [])), response.get("nextToken")
+
+
+def _to_ndjson(source: ExportSource, events: list[dict[str, Any]]) -> bytes:
+    lines = [
+        json.dumps(
+            {
+                "timestamp": event["timestamp"],
+                "source": source.tag,
+                "log_group": source.log_group,
+                "log_stream": event.get("logStreamName", source.log_stream),
+                "message": event["message"].rstrip("\n"),
+            },
+            ensure_ascii=False,
+        )
+        for event in events
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _load_checkpoint(path: Path) -> _Checkpoint | None:
+    try:
+        data = json.loads(checkpoint_path(path).read_text())
+        if not path.exists() or path.stat().st_size < data["size"]:
+            return None
+        return _Checkpoint(
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            size=data["size"],
+            events=data["events"],
+            tokens=data["tokens"],
+            done=set(data["done"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_checkpoint(path: Path, checkpoint: _Checkpoint) -> None:
+    data = {
+        "start_time": checkpoint.start_time,
+        "end_time": checkpoint.end_time,
+        "size": checkpoint.size,
+        "events": checkpoint.events,
+        "tokens": checkpoint.tokens,
+        "done": sorted(checkpoint.done),
+    }
+    target = checkpoint_path(path)
+    temporary = target.with_name(f"{target.name}.tmp")
+    temporary.write_text(json.dumps(data))
+    # Replacing the file keeps the checkpoint whole even if the process dies mid-write
+    temporary.replace(target)
@@ -0,0 +1,140 @@
+"""CloudWatch Logs Insights queries: start, poll with backoff, and cache finished results."""
+
+from __future__ import annotations
+
+import contextlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from threading import Event, Lock
+from typing import TYPE_CHECKING
+
+from ...core.polling import AdaptiveInterval
+
+if TYPE_CHECKING:
+    from mypy_boto3_logs.client import CloudWatchLogsClient
+
+INSIGHTS_MIN_INTERVAL_SECONDS = 0.5
+INSIGHTS_MAX_INTERVAL_SECONDS = 5.0
+INSIGHTS_BACKOFF_FACTOR = 1.5
+# Windows are aligned to whole minutes, so reopening a query within the minute reuses its results
+INSIGHTS_WINDOW_ALIGN_SECONDS = 60
+INSIGHTS_CACHE_ENTRIES = 32
+INSIGHTS_DONE_STATUSES = frozenset({"Complete", "Failed", "Cancelled", "Timeout", "Unknown"})
+
+QueryKey = tuple[tuple[str, ...], str, int, int]
+
+
+@dataclass
+class InsightsResult:
+    """Rows of a Logs Insights query as field/value dicts, with the query's status and scan statistics."""
+
+    status: str
+    rows: list[dict[str, str]] = field(default_factory=list)
+    records_scanned: float = 0
+    bytes_scanned: float = 0
+    cached: bool = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the query will not return any more rows."""
+        return self.status in INSIGHTS_DONE_STATUSES
+
+
+class InsightsResultCache:
+    """Least-recently-used cache of completed query results, keyed by log groups, query text and window."""
+
+    def __init__(self, max_entries: int = INSIGHTS_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._results: OrderedDict[QueryKey, InsightsResult] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: QueryKey) -> InsightsResult | None:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def put(self, key: QueryKey, result: InsightsResult) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+
+def align_window(start_time: int, end_time: int) -> tuple[int, int]:
+    """Round a window in epoch seconds down to whole minutes."""
+    return (
+        start_time - start_time % INSIGHTS_WINDOW_ALIGN_SECONDS,
+        end_time - end_time % INSIGHTS_WINDOW_ALIGN_SECONDS,
+    )
+
+
+def run_insights_query(
+    logs_client: CloudWatchLogsClient,
+    log_groups: list[str],
+    query: str,
+    start_time: int,
+    end_time: int,
+    cache: InsightsResultCache | None = None,
+    stop: Event | None = None,
+    interval: AdaptiveInterval | None = None,
+) -> Iterator[InsightsResult]:
+    """Start a query over `log_groups` for a window in epoch seconds and yield results as they grow.
+
+    get_query_results is polled with an interval that backs off while no new rows arrive. A
+    result is yielded whenever the row count changes and once more when the query ends.
+    Completed results are cached; a cached query is answered without starting a new scan.
+    Setting `stop` cancels the query in CloudWatch.
+    """
+    stop = stop or Event()
+    interval = interval or AdaptiveInterval(
+        INSIGHTS_MIN_INTERVAL_SECONDS, INSIGHTS_MAX_INTERVAL_SECONDS, INSIGHTS_BACKOFF_FACTOR
+    )
+    start_time, end_time = align_window(start_time, end_time)
+    key: QueryKey = (tuple(sorted(log_groups)), query.strip(), start_time, end_time)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            yield InsightsResult(cached.status, cached.rows, cached.records_scanned, cached.bytes_scanned, cached=True)
+            return
+
+    query_id = logs_client.start_query(
+        logGroupNames=log_groups, queryString=query, startTime=start_time, endTime=end_time
+    )["queryId"]
+
+    rows_seen = -1
+    while True:
+        response = logs_client.get_query_results(queryId=query_id)
+        statistics = response.get("statistics", {})
+        result = InsightsResult(
+            status=response.get("status", "Unknown"),
+            rows=[
+                {column["field"]: column["value"] for column in row if column["field"] != "@ptr"}
+                for row in response.get("results", [])
+            ],
+            records_scanned=statistics.get("recordsScanned", 0),
+            bytes_scanned=statistics.get("bytesScanned", 0),
+        )
+
+        if result.done:
+            if cache is not None and result.status == "Complete":
+                cache.put(key, result)
+            yield result
+            return
+
+        if len(result.rows) != rows_seen:
+            rows_seen = len(result.rows)
+            interval.reset()
+            yield result
+        else:
+            interval.back_off()
+
+        if stop.wait(interval.current):
+            # The query may have finished in the meantime, in which case there is nothing to stop
+            with contextlib.suppress(Exception):
+                logs_client.stop_query(queryId=query_id)
+            return
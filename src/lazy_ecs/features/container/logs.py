@@ -0,0 +1,395 @@
+"""Streaming reads of CloudWatch Logs streams."""
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import cached_property
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any
+
+from ...core.batching import DEFAULT_MAX_WORKERS
+from ...core.polling import AdaptiveInterval
+from .structured import Level, LogRecord, find_levels, parse_records
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from mypy_boto3_logs.client import CloudWatchLogsClient
+    from mypy_boto3_logs.type_defs import FilteredLogEventTypeDef, OutputLogEventTypeDef
+
+FOLLOW_MIN_INTERVAL_SECONDS = 1.0
+FOLLOW_MAX_INTERVAL_SECONDS = 10.0
+DEFAULT_PAGE_CACHE_BYTES = 16 * 1024 * 1024
+# Rough per-event cost of the dict and timestamps on top of the message text
+EVENT_OVERHEAD_BYTES = 100
+# Stop a filter after this many matches; a broad pattern over a busy group could otherwise run for minutes
+FILTER_MAX_EVENTS = 1000
+# How often a filter waiting on a page checks whether it was stopped
+FILTER_STOP_POLL_SECONDS = 0.1
+
+PageKey = tuple[str, str, str, int]
+
+
+@dataclass(frozen=True)
+class TaggedStream:
+    """A log stream plus the short label shown next to its lines in a merged view."""
+
+    tag: str
+    log_group: str
+    log_stream: str
+
+
+@dataclass(frozen=True)
+class LogPage:
+    """One page of a log stream, oldest event first, with tokens to the neighbouring pages."""
+
+    events: list[OutputLogEventTypeDef]
+    older_token: str | None
+    newer_token: str | None
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(len(event.get("message", "")) + EVENT_OVERHEAD_BYTES for event in self.events)
+
+    @cached_property
+    def records(self) -> list[LogRecord | None]:
+        """Each event's message parsed as JSON (None for other lines), parsed once per page."""
+        return parse_records(self.events)
+
+    @cached_property
+    def levels(self) -> list[Level | None]:
+        """Each event's level and where it is in the message, found once per page."""
+        return find_levels(self.events, self.records)
+
+
+class LogPageCache:
+    """LRU cache of log pages, bounded by the approximate memory their events take."""
+
+    def __init__(self, max_bytes: int = DEFAULT_PAGE_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._pages: OrderedDict[PageKey, LogPage] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key: PageKey) -> LogPage | None:
+        """Return a cached page and mark it most recently used."""
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+            return page
+
+    def put(self, key: PageKey, page: LogPage) -> None:
+        """Store a page, evicting least recently used pages beyond the size cap."""
+        with self._lock:
+            previous = self._pages.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size_bytes
+            self._pages[key] = page
+            self._size += page.size_bytes
+            # The newest page always stays, even if it alone exceeds the cap
+            while self._size > self.max_bytes and len(self._pages) > 1:
+                _key, evicted = self._pages.popitem(last=False)
+                self._size -= evicted.size_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class LogPager:
+    """Pages backward through log streams with nextBackwardToken.
+
+    Pages reached through a backward token hold events that can no longer change, so they are
+    cached; the latest page (no token) is always fetched fresh. Fetching a page can prefetch the
+    next older one in the background, so paging back while reading does not wait on AWS.
+    """
+
+    def __init__(
+        self, logs_client: CloudWatchLogsClient, cache: LogPageCache | None = None, executor: Executor | None = None
+    ) -> None:
+        self.logs_client = logs_client
+        self.cache = cache or LogPageCache()
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="lazy-ecs-log-pages")
+        self._pending: dict[PageKey, Future[LogPage]] = {}
+        self._lock = Lock()
+
+    def get_page(
+        self, log_group: str, log_stream: str, token: str | None = None, limit: int = 50, prefetch_older: bool = False
+    ) -> LogPage:
+        """Return the page at `token` (the latest page if None), optionally prefetching the next older one."""
+        if token is None:
+            page = self._fetch(log_group, log_stream, None, limit)
+        else:
+            key = (log_group, log_stream, token, limit)
+            page = self.cache.get(key)
+            if page is None:
+                with self._lock:
+                    pending = self._pending.get(key)
+                page = pending.result() if pending is not None else self._fetch(log_group, log_stream, token, limit)
+
+        if prefetch_older and page.older_token:
+            self.prefetch(log_group, log_stream, page.older_token, limit)
+        return page
+
+    def prefetch(self, log_group: str, log_stream: str, token: str, limit: int = 50) -> None:
+        """Fetch the page at `token` in the background unless it is cached or already loading."""
+        key = (log_group, log_stream, token, limit)
+        with self._lock:
+            if key in self._pending or self.cache.get(key) is not None:
+                return
+            future = self._executor.submit(self._fetch, log_group, log_stream, token, limit)
+            self._pending[key] = future
+
+        def forget(_future: Future[LogPage]) -> None:
+            with self._lock:
+                self._pending.pop(key, None)
+
+        future.add_done_callback(forget)
+
+    def _fetch(self, log_group: str, log_stream: str, token: str | None, limit: int) -> LogPage:
+        params: dict[str, Any] = {"logGroupName": log_group, "logStreamName": log_stream, "limit": limit}
+        if token:
+            params["nextToken"] = token
+        else:
+            params["startFromHead"] = False
+        response = self.logs_client.get_log_events(**params)
+
+        events = response.get("events", [])
+        older_token = response.get("nextBackwardToken")
+        # At the start of the stream CloudWatch returns no events and hands the same token back
+        if not events or older_token == token:
+            older_token = None
+        page = LogPage(events=events, older_token=older_token, newer_token=response.get("nextForwardToken"))
+
+        if token:
+            self.cache.put((log_group, log_stream, token, limit), page)
+        return page
+
+
+def follow_log_events(
+    logs_client: CloudWatchLogsClient,
+    log_group: str,
+    log_stream: str,
+    lines: int = 50,
+    stop: Event | None = None,
+    interval: AdaptiveInterval | None = None,
+) -> Iterator[list[OutputLogEventTypeDef]]:
+    """Yield the last `lines` events, then each batch of new events until `stop` is set.
+
+    Polls with nextForwardToken so only events newer than the last batch are returned. The
+    poll interval doubles while the stream is idle and resets as soon as events arrive.
+    """
+    stop = stop or Event()
+    interval = interval or AdaptiveInterval(FOLLOW_MIN_INTERVAL_SECONDS, FOLLOW_MAX_INTERVAL_SECONDS)
+
+    response = logs_client.get_log_events(
+        logGroupName=log_group, logStreamName=log_stream, limit=lines, startFromHead=False
+    )
+    events = response.get("events", [])
+    if events:
+        yield events
+    token = response.get("nextForwardToken")
+
+    while not stop.wait(interval.current):
+        params: dict[str, Any] = {"logGroupName": log_group, "logStreamName": log_stream, "startFromHead": True}
+        if token:
+            params["nextToken"] = token
+        response = logs_client.get_log_events(**params)
+        events = response.get("events", [])
+        # An idle stream hands back the same token, so it is safe to always take the latest
+        token = response.get("nextForwardToken", token)
+        if events:
+            interval.reset()
+            yield events
+        else:
+            interval.back_off()
+
+
+def follow_merged_log_events(
+    logs_client: CloudWatchLogsClient,
+    streams: list[TaggedStream],
+    lines: int = 50,
+    stop: Event | None = None,
+    interval: AdaptiveInterval | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[list[tuple[TaggedStream, OutputLogEventTypeDef]]]:
+    """Yield the last `lines` events across several streams, then each batch of new events until `stop` is set.
+
+    A single poll loop keeps one nextForwardToken per stream and reads every stream
+    concurrently on each tick; each batch is interleaved by timestamp. The interval backs
+    off only while all streams are idle.
+    """
+    if not streams:
+        return
+    stop = stop or Event()
+    interval = interval or AdaptiveInterval(FOLLOW_MIN_INTERVAL_SECONDS, FOLLOW_MAX_INTERVAL_SECONDS)
+    tokens: dict[TaggedStream, str | None] = dict.fromkeys(streams)
+
+    def poll(stream: TaggedStream, limit: int | None) -> list[OutputLogEventTypeDef]:
+        params: dict[str, Any] = {"logGroupName": stream.log_group, "logStreamName": stream.log_stream}
+        token = tokens[stream]
+        if token:
+            params["nextToken"] = token
+            params["startFromHead"] = True
+        else:
+            params["limit"] = limit
+            params["startFromHead"] = False
+        response = logs_client.get_log_events(**params)
+        # An idle stream hands back the same token, so it is safe to always take the latest
+        tokens[stream] = response.get("nextForwardToken", token)
+        return response.get("events", [])
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(streams)), thread_name_prefix="lazy-ecs-logs-follow"
+    ) as executor:
+        pages = list(executor.map(lambda stream: poll(stream, lines), streams))
+        batch = _merge_pages(streams, pages)[-lines:]
+        if batch:
+            yield batch
+
+        while not stop.wait(interval.current):
+            pages = list(executor.map(lambda stream: poll(stream, lines), streams))
+            batch = _merge_pages(streams, pages)
+            if batch:
+                interval.reset()
+                yield batch
+            else:
+                interval.back_off()
+
+
+def _merge_pages(
+    streams: list[TaggedStream], pages: list[list[OutputLogEventTypeDef]]
+) -> list[tuple[TaggedStream, OutputLogEventTypeDef]]:
+    """Interleave per-stream pages, each already in timestamp order, into one timestamp-ordered list."""
+    ordered = (
+        [(event["timestamp"], position, sequence, event) for sequence, event in enumerate(page)]
+        for position, page in enumerate(pages)
+    )
+    return [(streams[position], event) for _timestamp, position, _sequence, event in heapq.merge(*ordered)]
+
+
+def iter_filtered_log_events(
+    logs_client: CloudWatchLogsClient,
+    log_group: str,
+    pattern: str,
+    start_time: int,
+    end_time: int | None = None,
+    stream_prefix: str | None = None,
+    max_events: int = FILTER_MAX_EVENTS,
+    stop: Event | None = None,
+) -> Iterator[list[FilteredLogEventTypeDef]]:
+    """Yield pages of events matching `pattern`, requesting the next page while the caller shows the current one.
+
+    Filtering runs in CloudWatch, so only matching events travel over the wire. CloudWatch may
+    return empty pages while it scans a long window; those are skipped rather than yielded.
+    Setting `stop` ends the scan between pages, including runs of empty ones, without
+    requesting another page.
+    """
+    stop = stop or Event()
+    params: dict[str, Any] = {"logGroupName": log_group, "startTime": start_time}
+    if pattern:
+        params["filterPattern"] = pattern
+    if end_time is not None:
+        params["endTime"] = end_time
+    if stream_prefix:
+        params["logStreamNamePrefix"] = stream_prefix
+
+    if stop.is_set():
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lazy-ecs-log-filter")
+    try:
+        pending: Future[Any] | None = executor.submit(logs_client.filter_log_events, **params)
+        remaining = max_events
+        while pending is not None:
+            # Wait in short slices so ESC is noticed while a slow page is still in flight
+            while not stop.is_set() and not wait([pending], timeout=FILTER_STOP_POLL_SECONDS).done:
+                pass
+            if stop.is_set():
+                return
+            response = pending.result()
+            events = response.get("events", [])[:remaining]
+            remaining -= len(events)
+
+            next_token = response.get("nextToken")
+            pending = None
+            if next_token and remaining > 0 and not stop.is_set():
+                pending = executor.submit(logs_client.filter_log_events, **params, nextToken=next_token)
+
+            if events:
+                yield events
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_merged_tail(
+    logs_client: CloudWatchLogsClient,
+    streams: list[TaggedStream],
+    page_size: int = 50,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[tuple[TaggedStream, OutputLogEventTypeDef]]:
+    """Yield events from many streams merged by timestamp, newest first.
+
+    Every stream's latest page is requested at once on a bounded pool; older pages are read
+    with nextBackwardToken only once the merge is halfway through a stream's current page.
+    Each stream holds at most its current page and the one being fetched, so memory grows
+    with the page size rather than with the length of the streams. Take as many events as
+    needed and stop iterating.
+    """
+    if not streams:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(streams)), thread_name_prefix="lazy-ecs-logs")
+
+    def fetch(stream: TaggedStream, token: str | None) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "logGroupName": stream.log_group,
+            "logStreamName": stream.log_stream,
+            "limit": page_size,
+        }
+        if token:
+            params["nextToken"] = token
+        else:
+            params["startFromHead"] = False
+        return dict(logs_client.get_log_events(**params))
+
+    def read_backward(
+        position: int, stream: TaggedStream, first_page: Future[dict[str, Any]]
+    ) -> Iterator[tuple[int, int, int, Any]]:
+        sequence = 0
+        pending: Future[dict[str, Any]] | None = first_page
+        token = None
+        while pending is not None:
+            response = pending.result()
+            pending = None
+            events = response.get("events", [])
+            older_token = response.get("nextBackwardToken")
+            # An empty page, or the same token back, marks the start of the stream
+            has_older = bool(events) and older_token != token
+            token = older_token
+            for index, event in enumerate(reversed(events)):
+                if has_older and index == len(events) // 2:
+                    # Halfway through a page the merge is still drawing from this stream, so fetch
+                    # the older page now; streams whose latest page is enough never request it
+                    pending = executor.submit(fetch, stream, older_token)
+                # Negated timestamps turn heapq.merge's ascending order into newest first; the
+                # position and sequence break ties so events themselves are never compared
+                sequence += 1
+                yield -event["timestamp"], position, sequence, (stream, event)
+
+    try:
+        # Submit every first page before merging starts, so they are fetched concurrently
+        readers = [
+            read_backward(position, stream, executor.submit(fetch, stream, None))
+            for position, stream in enumerate(streams)
+        ]
+        for *_order, item in heapq.merge(*readers):
+            yield item
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,166 @@
+"""Render pages of log events as single Rich renderables."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from rich.text import Span, Text
+
+from .structured import LEVEL_FIELDS, LEVEL_STYLES, find_levels, parse_records, record_field
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from mypy_boto3_logs.type_defs import OutputLogEventTypeDef
+
+    from .digest import CollapsedLine
+    from .logs import TaggedStream
+    from .structured import Level, LogRecord
+
+# How many lines the pager view loads; paging them is cheap once they are one renderable
+PAGER_LOG_LINES = 1000
+PROJECTED_COLUMN_MAX_WIDTH = 40
+REPEAT_SIGN = "\u00d7"  # multiplication sign, as in "x3"
+REPEAT_STYLE = "bold magenta"
+REPEATED_LINE_MARKER = "↳ previous line repeated"
+
+
+@lru_cache(maxsize=4096)
+def _clock(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).strftime("%H:%M:%S")
+
+
+def format_clock(timestamp_ms: int) -> str:
+    """Format an epoch-millisecond timestamp as local HH:MM:SS, converting each second only once."""
+    return _clock(timestamp_ms // 1000)
+
+
+def render_log_events(events: Sequence[OutputLogEventTypeDef], levels: Sequence[Level | None] | None = None) -> Text:
+    """Build one renderable for a page of events, with each line's level colored.
+
+    Lines are joined into one plain string, so the page is written in a single print with no
+    markup parsing or highlighting, and a message containing [brackets] is shown as is. Pass
+    the page's `levels` to reuse what was found for it instead of parsing every line again.
+    """
+    return _render_lines(events, levels if levels is not None else _find_levels(events))
+
+
+def render_collapsed_lines(lines: Sequence[CollapsedLine], levels: Sequence[Level | None] | None = None) -> Text:
+    """Like render_log_events, with a repeat count after a line that stands for a run of N same-shaped lines.
+
+    `levels` belong to the events the lines were collapsed from, such as a page's levels. A run
+    carried over from an earlier batch is shown as a marker rather than repeating its line.
+    """
+    events = [{**line.event, "message": REPEATED_LINE_MARKER} if line.continued else line.event for line in lines]
+    if levels is None:
+        line_levels = _find_levels(events)
+    else:
+        line_levels = [None if line.continued else levels[line.index] for line in lines]
+    return _render_lines(events, line_levels, [line.count for line in lines])
+
+
+def _find_levels(events: Sequence[OutputLogEventTypeDef]) -> list[Level | None]:
+    return find_levels(events, parse_records(events))
+
+
+def _render_lines(
+    events: Sequence[OutputLogEventTypeDef],
+    levels: Sequence[Level | None],
+    counts: Sequence[int] | None = None,
+) -> Text:
+    parts: list[str] = []
+    spans: list[Span] = []
+    offset = 0
+    for index, event in enumerate(events):
+        prefix = f"[{format_clock(event['timestamp'])}] "
+        message = event["message"].rstrip()
+        level = levels[index]
+        if level and level[1] >= 0:
+            spans.append(Span(offset + len(prefix) + level[1], offset + len(prefix) + level[2], LEVEL_STYLES[level[0]]))
+        line = f"{prefix}{message}"
+        count = counts[index] if counts is not None else 1
+        if count > 1:
+            suffix = f" {REPEAT_SIGN}{count}"
+            spans.append(Span(offset + len(line), offset + len(line) + len(suffix), REPEAT_STYLE))
+            line += suffix
+        line += "\n"
+        parts.append(line)
+        offset += len(line)
+    return Text("".join(parts).removesuffix("\n"), spans=spans)
+
+
+def render_projected_events(
+    events: Sequence[OutputLogEventTypeDef], records: Sequence[LogRecord | None], fields: list[str]
+) -> Text:
+    """Build one renderable showing only `fields` of JSON lines, in aligned columns.
+
+    Level fields are colored by level. Lines that are not JSON are shown as they are.
+    """
+    rows = [
+        [_field_text(record_field(record, name)) for name in fields] if record is not None else None
+        for record in records
+    ]
+    # Every column but the last is padded to the page's widest value, up to a cap
+    widths = [
+        min(max((len(row[column]) for row in rows if row is not None), default=0), PROJECTED_COLUMN_MAX_WIDTH)
+        for column in range(len(fields) - 1)
+    ]
+
+    parts: list[str] = []
+    spans: list[Span] = []
+    offset = 0
+    for event, row in zip(events, rows, strict=True):
+        line = f"[{format_clock(event['timestamp'])}] "
+        if row is None:
+            line += event["message"].rstrip()
+        else:
+            for column, value in enumerate(row):
+                style = LEVEL_STYLES.get(value.upper()) if fields[column] in LEVEL_FIELDS else None
+                if style:
+                    spans.append(Span(offset + len(line), offset + len(line) + len(value), style))
+                line += value.ljust(widths[column]) + " " if column < len(widths) else value
+        line = line.rstrip() + "\n"
+        parts.append(line)
+        offset += len(line)
+    return Text("".join(parts).removesuffix("\n"), spans=spans)
+
+
+def render_tagged_events(
+    events: list[tuple[TaggedStream, OutputLogEventTypeDef]], styles: dict[str, str], tag_width: int | None = None
+) -> Text:
+    """Build one renderable for events from several streams, with each stream's tag in its own style."""
+    width = tag_width if tag_width is not None else max((len(stream.tag) for stream, _event in events), default=0)
+    parts: list[str] = []
+    spans: list[Span] = []
+    offset = 0
+    for stream, event in events:
+        prefix = f"[{format_clock(event['timestamp'])}] "
+        tag = stream.tag.ljust(width)
+        line = f"{prefix}{tag} {event['message'].rstrip()}\n"
+        style = styles.get(stream.tag)
+        if style:
+            start = offset + len(prefix)
+            spans.append(Span(start, start + len(tag), style))
+        parts.append(line)
+        offset += len(line)
+    return Text("".join(parts).removesuffix("\n"), spans=spans)
+
+
+def _field_text(value: Any) -> str:  # noqa: ANN401
+    if value is None:
+        return "-"
+    if isinstance(value, str):
+        return value.replace("\n", " ")
+    return json.dumps(value, separators=(",", ":"))
+
+
+def render_key_values(items: Iterable[tuple[str, str]], max_value_length: int = 80) -> Text:
+    """Build one renderable of NAME=value lines, shortening long values."""
+    lines = (
+        f"{name}={value if len(value) <= max_value_length else f'{value[: max_value_length - 3]}...'}"
+        for name, value in items
+    )
+    return Text("\n".join(lines), style="white")
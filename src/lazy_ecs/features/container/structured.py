@@ -0,0 +1,96 @@
+"""Detect structured (JSON) log lines and their levels."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mypy_boto3_logs.type_defs import OutputLogEventTypeDef
+
+LogRecord = dict[str, Any]
+# A line's level and its (start, end) in the message
+Level = tuple[str, int, int]
+
+# Fields offered first when choosing a projection, if the page has them
+SUGGESTED_FIELDS = ("level", "msg", "message", "trace_id")
+# Field names loggers commonly use for the level, checked in order
+LEVEL_FIELDS = ("level", "severity", "levelname", "log.level", "lvl")
+LEVEL_STYLES = {
+    "FATAL": "bold red",
+    "CRITICAL": "bold red",
+    "ERROR": "red",
+    "WARN": "yellow",
+    "WARNING": "yellow",
+    "INFO": "green",
+    "DEBUG": "dim",
+    "TRACE": "dim",
+}
+# Plain-text lines only count upper-case levels, so words like "info" in prose are not colored
+_PLAIN_LEVEL = re.compile(r"\b(FATAL|CRITICAL|ERROR|WARN(?:ING)?|INFO|DEBUG|TRACE)\b")
+
+
+def parse_json_message(message: str) -> LogRecord | None:
+    """Parse a message that is a JSON object, or return None without parsing anything else."""
+    text = message.strip()
+    # A cheap bracket check keeps plain-text lines away from the JSON parser
+    if not (text.startswith("{") and text.endswith("}")):
+        return None
+    try:
+        record = json.loads(text)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def parse_records(events: Iterable[OutputLogEventTypeDef]) -> list[LogRecord | None]:
+    """Parse every event's message, with None for lines that are not JSON objects."""
+    return [parse_json_message(event["message"]) for event in events]
+
+
+def record_field(record: LogRecord, name: str) -> Any:  # noqa: ANN401
+    """Look up a field, accepting both flat ("log.level") and nested ({"log": {"level": ...}}) names."""
+    if name in record:
+        return record[name]
+    value: Any = record
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def find_level(message: str, record: LogRecord | None) -> Level | None:
+    """Return the level of a line and its (start, end) in the message, if it names one.
+
+    The position is (-1, -1) when a JSON record's level cannot be found verbatim in the message.
+    """
+    if record is not None:
+        for name in LEVEL_FIELDS:
+            value = record_field(record, name)
+            if isinstance(value, str) and value.upper() in LEVEL_STYLES:
+                # Look for the quoted JSON string, so a key or word spelled the same is not colored
+                quoted = message.find(json.dumps(value))
+                start = quoted + 1 if quoted >= 0 else -1
+                return value.upper(), start, (start + len(value)) if start >= 0 else -1
+        return None
+    match = _PLAIN_LEVEL.search(message)
+    return (match.group(1), match.start(1), match.end(1)) if match else None
+
+
+def find_levels(events: Iterable[OutputLogEventTypeDef], records: Iterable[LogRecord | None]) -> list[Level | None]:
+    """Find the level of every event, taking JSON levels from its parsed record."""
+    return [find_level(event["message"].rstrip(), record) for event, record in zip(events, records, strict=True)]
+
+
+def common_fields(records: Iterable[LogRecord | None]) -> list[str]:
+    """Top-level fields found in the records, most frequent first."""
+    counts: Counter[str] = Counter()
+    for record in records:
+        if record is not None:
+            counts.update(record.keys())
+    return [name for name, _count in counts.most_common()]
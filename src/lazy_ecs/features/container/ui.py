@@ -2,16 +2,63 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-
+import json
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from threading import Event
+from typing import TYPE_CHECKING
+
+import questionary
 from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
 
 from ...core.base import BaseUIComponent
+from ...core.polling import stop_on_escape
 from ...core.utils import print_error
 from .container import ContainerService
+from .digest import EventRate, LineCollapser, collapse_repeats
+from .export import ExportSource, read_checkpoint_window
+from .render import (
+    format_clock,
+    render_collapsed_lines,
+    render_key_values,
+    render_log_events,
+    render_projected_events,
+    render_tagged_events,
+)
+from .structured import SUGGESTED_FIELDS, common_fields
+
+if TYPE_CHECKING:
+    from mypy_boto3_logs.type_defs import FilteredLogEventTypeDef
+
+    from ...core.context import ContainerContext, TaskSession
+    from ...core.types import LogConfig, LogSource
+    from .insights import InsightsResult
+    from .logs import TaggedStream
 
 console = Console()
 
+# Tag colors for merged views, assigned to streams in order
+TAG_COLORS = ["cyan", "magenta", "green", "yellow", "blue", "bright_red", "bright_cyan", "bright_magenta"]
+
+FILTER_WINDOWS = [
+    ("Last 15 minutes", 15 * 60),
+    ("Last hour", 60 * 60),
+    ("Last 6 hours", 6 * 60 * 60),
+    ("Last 24 hours", 24 * 60 * 60),
+    ("Last 7 days", 7 * 24 * 60 * 60),
+]
+
+
+INSIGHTS_QUERIES = [
+    ("Errors per minute", "filter @message like /(?i)(error|exception)/ | stats count(*) as errors by bin(1m)"),
+    ("Latest 100 messages", "fields @timestamp, @logStream, @message | sort @timestamp desc | limit 100"),
+    ("Events per stream", "stats count(*) as events by @logStream | sort events desc"),
+]
+
 
 class ContainerUI(BaseUIComponent):
     """UI component for container display."""
@@ -20,43 +67,409 @@ class ContainerUI(BaseUIComponent):
         super().__init__()
         self.container_service = container_service
 
-    def show_container_logs(self, cluster_name: str, task_arn: str, container_name: str, lines: int = 50) -> None:
-        """Display the last N lines of logs for a container."""
-        log_config = self.container_service.get_log_config(cluster_name, task_arn, container_name)
+    def _get_context(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None
+    ) -> ContainerContext | None:
+        """Use the loaded task session when it covers this task, otherwise look the container up."""
+        if session is not None and session.task_arn == task_arn:
+            return session.container_context(container_name)
+        return self.container_service.get_container_context(cluster_name, task_arn, container_name)
+
+    def show_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+        pager: bool = False,
+    ) -> None:
+        """Display the last N lines of logs for a container, optionally in the system pager."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
         if not log_config:
-            print_error(f"Could not find log configuration for container '{container_name}'")
-            console.print("Available log groups:", style="dim")
-            log_groups = self.container_service.list_log_groups(cluster_name, container_name)
-            for group in log_groups:
-                console.print(f"  • {group}", style="cyan")
             return
 
         log_group_name = log_config["log_group"]
         log_stream_name = log_config["log_stream"]
 
-        events = self.container_service.get_container_logs(log_group_name, log_stream_name, lines)
+        page = self.container_service.get_log_page(log_group_name, log_stream_name, lines=lines)
 
-        if not events:
+        if page is None or not page.events:
             console.print(
                 f"📝 No logs found for container '{container_name}' in stream '{log_stream_name}'", style="yellow"
             )
             return
 
-        console.print(f"\n📋 Last {len(events)} log entries for container '{container_name}':", style="bold cyan")
-        console.print(f"Log group: {log_group_name}", style="dim")
-        console.print(f"Log stream: {log_stream_name}", style="dim")
+        with console.pager(styles=True) if pager else nullcontext():
+            console.print(
+                f"\n📋 Last {len(page.events)} log entries for container '{container_name}':", style="bold cyan"
+            )
+            console.print(f"Log group: {log_group_name}", style="dim")
+            console.print(f"Log stream: {log_stream_name}", style="dim")
+            console.print("=" * 80, style="dim")
+            # One renderable per page, written in a single flush; the terminal wraps long lines
+            console.print(render_collapsed_lines(collapse_repeats(page.events), page.levels), soft_wrap=True)
+            console.print("=" * 80, style="dim")
+            rate = EventRate()
+            rate.add(page.events)
+            _print_event_rate(rate)
+
+    def show_merged_logs(self, title: str, streams: list[TaggedStream], lines: int = 100) -> None:
+        """Display the latest N log lines across several streams, interleaved by timestamp."""
+        if not streams:
+            print_error(f"No CloudWatch log configuration found for {title}")
+            return
+
+        events = self.container_service.get_merged_logs(streams, lines)
+        if not events:
+            console.print(f"📝 No logs found for {title}", style="yellow")
+            return
+
+        console.print(
+            f"\n📋 Last {len(events)} log entries for {title} across {len(streams)} streams:", style="bold cyan"
+        )
+        console.print("=" * 80, style="dim")
+        console.print(render_tagged_events(events, _tag_styles(streams)), soft_wrap=True)
+        console.print("=" * 80, style="dim")
+
+    def follow_merged_logs(self, title: str, streams: list[TaggedStream], lines: int = 50) -> None:
+        """Print the merged tail of several streams, then new events from all of them until ESC is pressed."""
+        if not streams:
+            print_error(f"No CloudWatch log configuration found for {title}")
+            return
+
+        console.print(f"\n📡 Following logs for {title} (press ESC to stop)", style="bold cyan")
+        console.print(f"Streams: {', '.join(stream.tag for stream in streams)}", style="dim")
+        console.print("=" * 80, style="dim")
+
+        styles = _tag_styles(streams)
+        stop = Event()
+        try:
+            with stop_on_escape(stop):
+                for batch in self.container_service.follow_merged_logs(streams, lines, stop):
+                    console.print(render_tagged_events(batch, styles), soft_wrap=True)
+        except KeyboardInterrupt:
+            pass
+
+        console.print("=" * 80, style="dim")
+        console.print("⏹️ Stopped following logs", style="dim")
+
+    def show_task_logs(self, session: TaskSession, lines: int = 50) -> None:
+        """Display the latest N log lines of every container in a task, interleaved by timestamp."""
+        streams = self.container_service.get_task_log_streams(session)
+        self.show_merged_logs(_task_title(session), streams, lines)
+
+    def follow_task_logs(self, session: TaskSession, lines: int = 50) -> None:
+        """Follow every container of a task live in one interleaved view until ESC is pressed."""
+        streams = self.container_service.get_task_log_streams(session)
+        self.follow_merged_logs(_task_title(session), streams, lines)
+
+    def follow_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+    ) -> None:
+        """Print the tail of a container's logs, then new events as they arrive until ESC is pressed."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
+        if not log_config:
+            return
+
+        console.print(f"\n📡 Following logs for container '{container_name}' (press ESC to stop)", style="bold cyan")
+        console.print(f"Log group: {log_config['log_group']}", style="dim")
+        console.print(f"Log stream: {log_config['log_stream']}", style="dim")
         console.print("=" * 80, style="dim")
 
-        for event in events:
-            timestamp = datetime.fromtimestamp(event["timestamp"] / 1000)
-            message = event["message"].rstrip()
-            console.print(f"[{timestamp.strftime('%H:%M:%S')}] {message}")
+        # Both only look at each new batch, so following for hours costs the same per batch
+        collapser = LineCollapser()
+        rate = EventRate()
+        stop = Event()
+        try:
+            with stop_on_escape(stop):
+                batches = self.container_service.follow_container_logs(
+                    log_config["log_group"], log_config["log_stream"], lines, stop
+                )
+                for batch in batches:
+                    rate.add(batch)
+                    # One write per batch keeps redraws cheap when a stream bursts
+                    console.print(render_collapsed_lines(collapser.feed(batch)), soft_wrap=True)
+        except KeyboardInterrupt:
+            pass
 
         console.print("=" * 80, style="dim")
+        _print_event_rate(rate)
+        console.print("⏹️ Stopped following logs", style="dim")
+
+    def browse_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+    ) -> None:
+        """Page backward through a container's log history, starting from the latest events."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
+        if not log_config:
+            return
+
+        log_group = log_config["log_group"]
+        log_stream = log_config["log_stream"]
+        # Tokens of the pages on the way back; None is the latest page
+        tokens: list[str | None] = [None]
+        # Fields of JSON lines to show as columns; empty shows lines as they are
+        projection: list[str] = []
+
+        while True:
+            page = self.container_service.get_log_page(log_group, log_stream, tokens[-1], lines, prefetch_older=True)
+            if page is None:
+                return
+
+            console.print(
+                f"\n📜 Log history for container '{container_name}' - page {len(tokens)} "
+                f"({len(page.events)} entries, newest page is 1)",
+                style="bold cyan",
+            )
+            console.print("=" * 80, style="dim")
+            if page.events and projection:
+                console.print(render_projected_events(page.events, page.records, projection), soft_wrap=True)
+            elif page.events:
+                console.print(render_log_events(page.events, page.levels), soft_wrap=True)
+            else:
+                console.print("📝 No log entries on this page", style="yellow")
+            console.print("=" * 80, style="dim")
+
+            fields = common_fields(page.records)
+            choices = []
+            if page.older_token:
+                choices.append(questionary.Choice("⬆️ Older entries", value="older"))
+            if len(tokens) > 1:
+                choices.append(questionary.Choice("⬇️ Newer entries", value="newer"))
+            if fields:
+                choices.append(questionary.Choice("🔣 Choose JSON fields to show", value="fields"))
+            choices.append(questionary.Choice("⬅️ Done", value="done"))
+
+            action = questionary.select("Log history:", choices=choices).ask()
+            if action == "older" and page.older_token:
+                tokens.append(page.older_token)
+            elif action == "newer":
+                tokens.pop()
+            elif action == "fields":
+                # The page keeps its parsed records, so showing it with other fields does not parse again
+                projection = _choose_fields(fields, projection)
+            else:
+                return
+
+    def filter_container_logs(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Search one container's logs with a CloudWatch filter pattern."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
+        if not log_config:
+            return
+
+        # An exact stream name is its own prefix
+        source: LogSource = {
+            "container_name": container_name,
+            "log_group": log_config["log_group"],
+            "stream_prefix": log_config["log_stream"],
+        }
+        self.filter_logs(f"container '{container_name}'", [source])
+
+    def filter_logs(self, title: str, sources: list[LogSource]) -> None:
+        """Prompt for a pattern and time window, then stream matching events from each log source."""
+        if not sources:
+            print_error(f"No CloudWatch log configuration found for {title}")
+            return
 
-    def show_container_environment_variables(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+        pattern = questionary.text("Filter pattern (CloudWatch syntax, empty for all events):").ask()
+        if pattern is None:
+            return
+        window = questionary.select(
+            "Time window:", choices=[questionary.Choice(label, value=seconds) for label, seconds in FILTER_WINDOWS]
+        ).ask()
+        if window is None:
+            return
+
+        end_time = int(time.time() * 1000)
+        start_time = end_time - window * 1000
+
+        console.print(f"\n🔍 Filtering logs for {title} (press ESC to stop)", style="bold cyan")
+        console.print(f"Pattern: {pattern or '(all events)'}", style="dim")
+        console.print("=" * 80, style="dim")
+
+        matches = 0
+        stop = Event()
+        with stop_on_escape(stop):
+            for source in sources:
+                pages = self.container_service.filter_logs(
+                    source["log_group"], pattern, start_time, end_time, source["stream_prefix"], stop
+                )
+                for page in pages:
+                    console.print(
+                        Text("\n".join(_format_filtered_event(source, event) for event in page)), soft_wrap=True
+                    )
+                    matches += len(page)
+                if stop.is_set():
+                    break
+
+        console.print("=" * 80, style="dim")
+        console.print(f"🔎 {matches} matching log entries", style="blue")
+
+    def export_container_logs(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Export one container's logs to a gzip-compressed NDJSON file."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
+        if not log_config:
+            return
+
+        source = ExportSource(container_name, log_config["log_group"], log_stream=log_config["log_stream"])
+        task_id = task_arn.split("/")[-1][:8]
+        self.export_logs(f"container '{container_name}'", [source], f"{container_name}-{task_id}-logs.ndjson.gz")
+
+    def export_logs(self, title: str, sources: list[ExportSource], default_file: str) -> None:
+        """Prompt for a file and time window, then export, offering to resume an interrupted export to that file."""
+        if not sources:
+            print_error(f"No CloudWatch log configuration found for {title}")
+            return
+
+        answer = questionary.path("Export to file:", default=default_file).ask()
+        if not answer:
+            return
+        path = Path(answer).expanduser()
+
+        window = read_checkpoint_window(path)
+        if window and questionary.confirm(f"Resume the interrupted export to {path}?", default=True).ask():
+            start_time, end_time = window
+        else:
+            seconds = questionary.select(
+                "Time window:", choices=[questionary.Choice(label, value=seconds) for label, seconds in FILTER_WINDOWS]
+            ).ask()
+            if seconds is None:
+                return
+            end_time = int(time.time() * 1000)
+            start_time = end_time - seconds * 1000
+
+        console.print(f"\n💾 Exporting logs for {title} to {path} (press ESC to stop)", style="bold cyan")
+        stop = Event()
+        try:
+            with stop_on_escape(stop), console.status("Exporting log entries...") as status:
+                result = self.container_service.export_logs(
+                    sources,
+                    path,
+                    start_time,
+                    end_time,
+                    stop,
+                    on_page=lambda progress: status.update(f"Exported {progress.events} log entries..."),
+                )
+        except Exception as e:
+            print_error(f"Export failed: {e}. Export to the same file again to resume.")
+            return
+
+        if result is None:
+            print_error("CloudWatch Logs is not available")
+        elif result.complete:
+            console.print(f"✅ Exported {result.events} log entries to {path}", style="green")
+        else:
+            console.print(
+                f"⏸️ Export stopped after {result.events} log entries. Export to the same file again to resume.",
+                style="yellow",
+            )
+
+    def run_container_insights(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Run a Logs Insights query over one container's log stream."""
+        log_config = self._get_log_config(cluster_name, task_arn, container_name, session)
+        if not log_config:
+            return
+        stream_filter = f"filter @logStream = {json.dumps(log_config['log_stream'])}"
+        self.run_insights(f"container '{container_name}'", [log_config["log_group"]], stream_filter)
+
+    def run_insights(self, title: str, log_groups: list[str], scope_filter: str | None = None) -> None:
+        """Prompt for a query and time window, then show its results as they arrive.
+
+        `scope_filter` is prepended to the query to restrict it to the streams of the container or service.
+        """
+        if not log_groups:
+            print_error(f"No CloudWatch log configuration found for {title}")
+            return
+
+        query = questionary.select(
+            "Logs Insights query:",
+            choices=[questionary.Choice(label, value=text) for label, text in INSIGHTS_QUERIES]
+            + [questionary.Choice("Custom query...", value="")],
+        ).ask()
+        if query == "":
+            query = questionary.text("Query:").ask()
+        if not query:
+            return
+        window = questionary.select(
+            "Time window:", choices=[questionary.Choice(label, value=seconds) for label, seconds in FILTER_WINDOWS]
+        ).ask()
+        if window is None:
+            return
+
+        end_time = int(time.time())
+        full_query = f"{scope_filter} | {query}" if scope_filter else query
+        console.print(f"\n📊 Logs Insights for {title} (press ESC to cancel)", style="bold cyan")
+        console.print(f"Query: {query}", style="dim")
+
+        result = None
+        cancelled = False
+        stop = Event()
+        try:
+            with stop_on_escape(stop), Live(console=console, auto_refresh=False) as live:
+                for result in self.container_service.run_insights_query(
+                    log_groups, full_query, end_time - window, end_time, stop
+                ):
+                    live.update(_insights_table(result), refresh=True)
+                # Decided inside the block, while only a key press can have set `stop`
+                cancelled = stop.is_set()
+        except Exception as e:
+            print_error(f"Logs Insights query failed: {e}")
+            return
+
+        if result is None or cancelled:
+            console.print("⏹️ Query cancelled", style="dim")
+        elif result.cached:
+            console.print(f"♻️ {len(result.rows)} rows (cached result, no new scan)", style="blue")
+        elif result.status != "Complete":
+            print_error(f"Query ended with status {result.status}")
+        else:
+            console.print(
+                f"📊 {len(result.rows)} rows, {result.records_scanned:.0f} records "
+                f"({result.bytes_scanned / 1_000_000:.1f} MB) scanned",
+                style="blue",
+            )
+
+    def _get_log_config(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None
+    ) -> LogConfig | None:
+        """Find where a container logs, listing candidate log groups if it has no awslogs configuration."""
+        if session is not None and session.task_arn == task_arn:
+            context = session.container_context(container_name)
+            log_config = self.container_service.get_log_config_for_context(context) if context else None
+        else:
+            log_config = self.container_service.get_log_config(cluster_name, task_arn, container_name)
+        if log_config:
+            return log_config
+
+        print_error(f"Could not find log configuration for container '{container_name}'")
+        console.print("Available log groups:", style="dim")
+        log_groups = self.container_service.list_log_groups(cluster_name, container_name)
+        for group in log_groups:
+            console.print(f"  • {group}", style="cyan")
+        return None
+
+    def show_container_environment_variables(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display environment variables for a container."""
-        context = self.container_service.get_container_context(cluster_name, task_arn, container_name)
+        context = self._get_context(cluster_name, task_arn, container_name, session)
         if not context:
             print_error(f"Could not find container '{container_name}'")
             return
@@ -70,18 +483,16 @@ class ContainerUI(BaseUIComponent):
         console.print(f"\n🔧 Environment variables for container '{container_name}':", style="bold cyan")
         console.print("=" * 60, style="dim")
 
-        sorted_vars = sorted(env_vars.items())
-
-        for name, value in sorted_vars:
-            display_value = value if len(value) <= 80 else f"{value[:77]}..."
-            console.print(f"{name}={display_value}", style="white")
+        console.print(render_key_values(sorted(env_vars.items())))
 
         console.print("=" * 60, style="dim")
         console.print(f"📊 Total: {len(env_vars)} environment variables", style="blue")
 
-    def show_container_secrets(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_secrets(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display secrets configuration for a container."""
-        context = self.container_service.get_container_context(cluster_name, task_arn, container_name)
+        context = self._get_context(cluster_name, task_arn, container_name, session)
         if not context:
             print_error(f"Could not find container '{container_name}'")
             return
@@ -119,9 +530,11 @@ class ContainerUI(BaseUIComponent):
         console.print("=" * 60, style="dim")
         console.print(f"🔒 Total: {len(secrets)} secrets configured", style="magenta")
 
-    def show_container_port_mappings(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_port_mappings(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display port mappings for a container."""
-        context = self.container_service.get_container_context(cluster_name, task_arn, container_name)
+        context = self._get_context(cluster_name, task_arn, container_name, session)
         if not context:
             print_error(f"Could not find container '{container_name}'")
             return
@@ -144,9 +557,11 @@ class ContainerUI(BaseUIComponent):
         console.print("=" * 50, style="dim")
         console.print(f"🔗 Total: {len(port_mappings)} port mappings", style="blue")
 
-    def show_container_volume_mounts(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_volume_mounts(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display volume mounts for a container."""
-        context = self.container_service.get_container_context(cluster_name, task_arn, container_name)
+        context = self._get_context(cluster_name, task_arn, container_name, session)
         if not context:
             print_error(f"Could not find container '{container_name}'")
             return
@@ -171,3 +586,46 @@ class ContainerUI(BaseUIComponent):
 
         console.print("=" * 70, style="dim")
         console.print(f"📂 Total: {len(volume_mounts)} volume mounts", style="blue")
+
+
+def _print_event_rate(rate: EventRate) -> None:
+    sparkline = rate.sparkline()
+    if sparkline:
+        console.print(f"📈 Events per minute: {sparkline} (peak {rate.peak}/min)", style="dim", markup=False)
+
+
+def _choose_fields(fields: list[str], current: list[str]) -> list[str]:
+    """Ask which JSON fields to show as columns, suggesting common ones the first time."""
+    selected = set(current) or {name for name in SUGGESTED_FIELDS if name in fields}
+    ordered = sorted(fields, key=lambda name: (name not in SUGGESTED_FIELDS, fields.index(name)))
+    answer = questionary.checkbox(
+        "Fields to show (none for raw lines):",
+        choices=[questionary.Choice(name, value=name, checked=name in selected) for name in ordered],
+    ).ask()
+    return current if answer is None else answer
+
+
+def _format_filtered_event(source: LogSource, event: FilteredLogEventTypeDef) -> str:
+    task_id = event.get("logStreamName", "").split("/")[-1][:8]
+    return f"[{format_clock(event['timestamp'])}] {source['container_name']}/{task_id} {event['message'].rstrip()}"
+
+
+def _insights_table(result: InsightsResult) -> Table:
+    """Render query rows as a table with a column for every field any row has."""
+    columns = list(dict.fromkeys(name for row in result.rows for name in row))
+    table = Table(title=f"{result.status} · {len(result.rows)} rows", title_justify="left")
+    for column in columns:
+        table.add_column(column, overflow="fold")
+    for row in result.rows:
+        table.add_row(*(row.get(column, "") for column in columns))
+    return table
+
+
+def _task_title(session: TaskSession) -> str:
+    return f"task {session.task_arn.split('/')[-1][:8]}"
+
+
+def _tag_styles(streams: list[TaggedStream]) -> dict[str, str]:
+    """Give each stream's tag its own color, cycling through the palette."""
+    tags = list(dict.fromkeys(stream.tag for stream in streams))
+    return {tag: TAG_COLORS[index % len(TAG_COLORS)] for index, tag in enumerate(tags)}
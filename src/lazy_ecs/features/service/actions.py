@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Event
 from typing import TYPE_CHECKING
 
-from ...core.base import BaseAWSService
+from ...core.aws_base import BaseAWSService
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from mypy_boto3_ecs.client import ECSClient
 
+DEFAULT_DEPLOY_CONCURRENCY = 5
+DEPLOY_MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 10.0
+# Error codes AWS uses when a request was rejected only because of its rate, so retrying later succeeds
+THROTTLING_ERROR_CODES = frozenset(
+    {"ThrottlingException", "Throttling", "TooManyRequestsException", "RequestLimitExceeded"}
+)
+
+
+@dataclass
+class DeploymentOutcome:
+    """Progress of one service's forced deployment in a bulk redeploy."""
+
+    service_name: str
+    status: str = "queued"  # "queued", "deploying", "retrying", "succeeded", "failed", "cancelled"
+    attempts: int = 0
+    error: str | None = None
+
 
 class ServiceActions(BaseAWSService):
     """Service actions for ECS services."""
@@ -23,3 +48,64 @@ class ServiceActions(BaseAWSService):
             return True
         except Exception:
             return False
+
+    def force_new_deployments(
+        self,
+        cluster_name: str,
+        service_names: list[str],
+        max_concurrency: int = DEFAULT_DEPLOY_CONCURRENCY,
+        on_update: Callable[[DeploymentOutcome], None] | None = None,
+        stop: Event | None = None,
+    ) -> list[DeploymentOutcome]:
+        """Force a new deployment for many services, at most `max_concurrency` update_service calls at a time.
+
+        Throttled calls are retried with jittered exponential backoff; other errors fail the service
+        straight away. `on_update` is called from worker threads each time a service's outcome
+        changes. Once `stop` is set, services that have not started are cancelled.
+        """
+        stop = stop or Event()
+        outcomes = [DeploymentOutcome(name) for name in service_names]
+
+        def report(outcome: DeploymentOutcome, status: str, error: str | None = None) -> None:
+            outcome.status = status
+            outcome.error = error
+            if on_update:
+                on_update(outcome)
+
+        def deploy(outcome: DeploymentOutcome) -> None:
+            if stop.is_set():
+                report(outcome, "cancelled")
+                return
+            report(outcome, "deploying")
+            while True:
+                outcome.attempts += 1
+                try:
+                    self.ecs_client.update_service(
+                        cluster=cluster_name, service=outcome.service_name, forceNewDeployment=True
+                    )
+                except Exception as e:
+                    if _error_code(e) not in THROTTLING_ERROR_CODES or outcome.attempts >= DEPLOY_MAX_ATTEMPTS:
+                        report(outcome, "failed", str(e))
+                        return
+                    report(outcome, "retrying", str(e))
+                    # Full jitter spreads the retries of services throttled together
+                    delay = random.uniform(
+                        0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**outcome.attempts)
+                    )
+                    if stop.wait(delay):
+                        report(outcome, "cancelled", str(e))
+                        return
+                else:
+                    report(outcome, "succeeded")
+                    return
+
+        if outcomes:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(outcomes)))) as executor:
+                list(executor.map(deploy, outcomes))
+        return outcomes
+
+
+def _error_code(error: Exception) -> str | None:
+    """The AWS error code of a botocore ClientError, or None for any other exception."""
+    response = getattr(error, "response", None)
+    return response.get("Error", {}).get("Code") if isinstance(response, dict) else None
@@ -0,0 +1,140 @@
+"""State behind the live cluster dashboard: one row per service, refreshed with batched describe calls."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from ...core.polling import AdaptiveInterval
+from ...core.utils import determine_service_status
+from .rollout import IN_PROGRESS, primary_deployment, rollout_state
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ...core.batching import ChunkFailure
+    from .service import ServiceService, ServiceSnapshot
+
+DASHBOARD_MIN_INTERVAL_SECONDS = 5.0
+DASHBOARD_MAX_INTERVAL_SECONDS = 30.0
+DASHBOARD_BACKOFF_FACTOR = 1.5
+# Services are added and removed rarely, so the list is fetched again only this often
+SERVICE_LIST_TTL_SECONDS = 60.0
+# A failure event this recent is flagged on its row
+RECENT_FAILURE_WINDOW = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class DashboardRow:
+    """What the dashboard shows for one service; rows compare equal when nothing visible changed."""
+
+    service_name: str
+    icon: str
+    status: str
+    running_count: int
+    desired_count: int
+    pending_count: int
+    rollout_state: str | None  # The primary deployment's rolloutState, when ECS reports one
+    deployments: int
+    rolling_out: bool
+    failed_tasks: int
+    last_failure_at: datetime | None  # Most recent failure event
+    # Part of the row so that a poll after the failure ages out reports the row as changed
+    recent_failure: bool
+
+    @property
+    def needs_attention(self) -> bool:
+        return self.status != "HEALTHY" or self.rolling_out or self.failed_tasks > 0
+
+
+def dashboard_row(snapshot: ServiceSnapshot, now: datetime | None = None) -> DashboardRow:
+    """Build a service's row from one describe_services result."""
+    icon, status = determine_service_status(snapshot.running_count, snapshot.desired_count, snapshot.pending_count)
+    primary = primary_deployment(snapshot)
+    last_failure = next((event for event in snapshot.events if event["event_type"] == "failure"), None)
+    last_failure_at = last_failure["created_at"] if last_failure else None
+    return DashboardRow(
+        service_name=snapshot.service_name,
+        icon=icon,
+        status=status,
+        running_count=snapshot.running_count,
+        desired_count=snapshot.desired_count,
+        pending_count=snapshot.pending_count,
+        rollout_state=primary.get("rolloutState") if primary else None,
+        deployments=len(snapshot.deployments),
+        rolling_out=rollout_state(snapshot) == IN_PROGRESS,
+        failed_tasks=primary.get("failedTasks", 0) if primary else 0,
+        last_failure_at=last_failure_at,
+        recent_failure=last_failure_at is not None and _is_recent(last_failure_at, now),
+    )
+
+
+def _is_recent(moment: datetime, now: datetime | None) -> bool:
+    return (now or datetime.now(moment.tzinfo)) - moment <= RECENT_FAILURE_WINDOW
+
+
+@dataclass
+class DashboardUpdate:
+    """What one poll changed."""
+
+    changed: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    failures: list[ChunkFailure] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class ClusterDashboard:
+    """Keeps one row per service in a cluster up to date, tracking which rows each poll changed.
+
+    Each poll describes every service in chunks of 10 in parallel; the service list itself is
+    only fetched again once it is `SERVICE_LIST_TTL_SECONDS` old. Rows of services whose chunk
+    failed keep their last known state.
+    """
+
+    def __init__(
+        self, service_service: ServiceService, cluster_name: str, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.service_service = service_service
+        self.cluster_name = cluster_name
+        self.rows: dict[str, DashboardRow] = {}
+        self.interval = AdaptiveInterval(
+            DASHBOARD_MIN_INTERVAL_SECONDS, DASHBOARD_MAX_INTERVAL_SECONDS, DASHBOARD_BACKOFF_FACTOR
+        )
+        self._clock = clock
+        self._service_names: list[str] = []
+        self._listed_at: float | None = None
+
+    def poll(self) -> DashboardUpdate:
+        """Describe the cluster's services and update the rows that changed."""
+        now = self._clock()
+        if self._listed_at is None or now - self._listed_at >= SERVICE_LIST_TTL_SECONDS:
+            self._service_names = self.service_service.fetch_services(self.cluster_name)
+            self._listed_at = now
+
+        batch = self.service_service.describe_service_snapshots(self.cluster_name, self._service_names)
+        update = DashboardUpdate(failures=batch.failures)
+        for snapshot in batch.results:
+            row = dashboard_row(snapshot)
+            if self.rows.get(row.service_name) != row:
+                self.rows[row.service_name] = row
+                update.changed.add(row.service_name)
+
+        listed = set(self._service_names)
+        update.removed = {name for name in self.rows if name not in listed}
+        for name in update.removed:
+            del self.rows[name]
+        return update
+
+    def next_interval(self, update: DashboardUpdate) -> float:
+        """Seconds until the next poll: short while anything changes or rolls out, backing off while quiet."""
+        if update or any(row.rolling_out for row in self.rows.values()):
+            return self.interval.reset()
+        return self.interval.back_off()
+
+    def sorted_rows(self) -> list[DashboardRow]:
+        """Rows that need attention first, then by service name."""
+        return sorted(self.rows.values(), key=lambda row: (not row.needs_attention, row.service_name))
@@ -0,0 +1,158 @@
+"""Watch a service rollout until the service is steady or the deployment has failed."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from threading import Event
+from typing import TYPE_CHECKING
+
+from ...core.polling import AdaptiveInterval
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from mypy_boto3_ecs.type_defs import DeploymentTypeDef
+
+    from ...core.types import ServiceEvent
+    from .service import ServiceService, ServiceSnapshot
+
+ROLLOUT_MIN_INTERVAL_SECONDS = 2.0
+ROLLOUT_MAX_INTERVAL_SECONDS = 15.0
+ROLLOUT_BACKOFF_FACTOR = 1.5
+DEFAULT_ROLLOUT_TIMEOUT_SECONDS = 30 * 60
+
+STEADY = "STEADY"
+FAILED = "FAILED"
+IN_PROGRESS = "IN_PROGRESS"
+# Exit statuses for scripts: steady, failed, and still rolling out when the watch ended
+ROLLOUT_EXIT_STATUSES = {STEADY: 0, FAILED: 1, IN_PROGRESS: 2}
+
+
+@dataclass(frozen=True)
+class RolloutProgress:
+    """One poll of a rollout: the service as described, its state and the events seen for the first time."""
+
+    snapshot: ServiceSnapshot
+    state: str
+    new_events: list[ServiceEvent] = field(default_factory=list)  # Oldest first
+
+    @property
+    def finished(self) -> bool:
+        return self.state != IN_PROGRESS
+
+    @property
+    def exit_status(self) -> int:
+        return ROLLOUT_EXIT_STATUSES[self.state]
+
+
+def primary_deployment(snapshot: ServiceSnapshot) -> DeploymentTypeDef | None:
+    """The deployment the service is rolling out to."""
+    return next((deployment for deployment in snapshot.deployments if deployment.get("status") == "PRIMARY"), None)
+
+
+def rollout_state(snapshot: ServiceSnapshot, deployment_id: str | None = None) -> str:
+    """Whether a service has finished rolling out, failed, or is still in progress.
+
+    Any deployment whose rolloutState is FAILED fails the rollout: with the deployment circuit
+    breaker's rollback, the failed deployment stays ACTIVE while the rollback becomes PRIMARY.
+    When `deployment_id` names the deployment being watched, the rollout has also failed once
+    another deployment is primary, which covers the rollback after the failed one is gone.
+    Otherwise the primary deployment's rolloutState decides when ECS reports one (the ECS
+    deployment controller does), and the service counts as steady once only one deployment is
+    left and its running count matches the desired count with nothing pending.
+    """
+    if any(deployment.get("rolloutState") == "FAILED" for deployment in snapshot.deployments):
+        return FAILED
+    primary = primary_deployment(snapshot)
+    if deployment_id is not None and primary is not None and primary.get("id") != deployment_id:
+        return FAILED
+    rollout = primary.get("rolloutState") if primary else None
+    only_deployment = len(snapshot.deployments) <= 1
+    counts_settled = snapshot.running_count == snapshot.desired_count and snapshot.pending_count == 0
+    if only_deployment and counts_settled and rollout in (None, "COMPLETED"):
+        return STEADY
+    return IN_PROGRESS
+
+
+def rollout_fraction(snapshot: ServiceSnapshot) -> float:
+    """How many of the primary deployment's desired tasks are running, from 0.0 to 1.0."""
+    primary = primary_deployment(snapshot)
+    if primary is None or not primary.get("desiredCount"):
+        return 1.0
+    return min(primary.get("runningCount", 0) / primary["desiredCount"], 1.0)
+
+
+def new_events_since(events: list[ServiceEvent], last_seen_id: str | None) -> list[ServiceEvent]:
+    """Events (given most recent first) newer than the last seen event ID, oldest first."""
+    newer: list[ServiceEvent] = []
+    for event in events:
+        if event["id"] == last_seen_id:
+            break
+        newer.append(event)
+    return newer[::-1]
+
+
+def watch_rollout(
+    service_service: ServiceService,
+    snapshot: ServiceSnapshot,
+    stop: Event | None = None,
+    timeout: float = DEFAULT_ROLLOUT_TIMEOUT_SECONDS,
+    interval: AdaptiveInterval | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[RolloutProgress]:
+    """Poll describe_services until the rollout finishes, yielding progress whenever something changed.
+
+    The deployment that is primary in `snapshot` is the one being watched, so a rollback to an
+    earlier deployment ends the watch as failed. Events already in `snapshot` count as seen, so
+    only those that happen during the watch are reported. The interval shortens after every
+    change and as more of the new tasks are running, when the end is near; it backs off while
+    nothing happens. The last progress is still in progress if the watch was stopped or timed out.
+    """
+    stop = stop or Event()
+    interval = interval or AdaptiveInterval(
+        ROLLOUT_MIN_INTERVAL_SECONDS, ROLLOUT_MAX_INTERVAL_SECONDS, ROLLOUT_BACKOFF_FACTOR
+    )
+    deadline = clock() + timeout
+    last_seen_id = snapshot.events[0]["id"] if snapshot.events else None
+    watched = primary_deployment(snapshot)
+    watched_id = watched.get("id") if watched else None
+    previous = None
+
+    while True:
+        events = snapshot.events
+        state = rollout_state(snapshot, watched_id)
+        progress = RolloutProgress(snapshot, state, new_events_since(events, last_seen_id))
+        if events:
+            last_seen_id = events[0]["id"]
+
+        current = _progress_key(snapshot)
+        changed = progress.new_events or current != previous
+        if changed or progress.finished:
+            yield progress
+        if progress.finished:
+            return
+        previous = current
+
+        delay = interval.reset() if changed else interval.back_off()
+        # Early on, tasks are still being placed and pulled; near the end only draining is left
+        delay = min(delay, max(interval.minimum, interval.maximum * (1 - rollout_fraction(snapshot))))
+        if stop.wait(min(delay, max(deadline - clock(), 0))) or clock() >= deadline:
+            return
+
+        refreshed = service_service.refresh_service_snapshot(snapshot.cluster_name, snapshot.service_name)
+        if refreshed is None:
+            # The service was deleted while being watched; nothing further to wait for
+            return
+        snapshot = refreshed
+
+
+def _progress_key(snapshot: ServiceSnapshot) -> tuple:
+    return (
+        snapshot.running_count,
+        snapshot.pending_count,
+        tuple(
+            (deployment.get("id"), deployment.get("rolloutState"), deployment.get("runningCount"))
+            for deployment in snapshot.deployments
+        ),
+    )
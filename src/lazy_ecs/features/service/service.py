@@ -2,62 +2,244 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ...core.base import BaseAWSService
+from ...core.aws_base import BaseAWSService
+from ...core.batching import DEFAULT_MAX_WORKERS, BatchResult, ChunkFailure, chunked, fetch_in_chunks, stream_chunks
+from ...core.prefetch import PREFETCH_MAX_WORKERS
 from ...core.types import ServiceEvent, ServiceInfo
 from ...core.utils import determine_service_status, extract_name_from_arn
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Iterator
 
     from mypy_boto3_ecs.client import ECSClient
-    from mypy_boto3_ecs.type_defs import ServiceTypeDef
+    from mypy_boto3_ecs.type_defs import DeploymentTypeDef, FailureTypeDef, ServiceTypeDef
+
+    from ...core.disk_cache import DiskCache
+
+# describe_services accepts at most 10 services per call
+DESCRIBE_SERVICES_CHUNK_SIZE = 10
+SERVICE_NAMES_TTL_SECONDS = 60
+# A prefetched inventory older than this is discarded instead of shown
+PREFETCH_MAX_AGE_SECONDS = 30
+# A description kept from an earlier listing is reused for a service's screen only while this fresh
+DESCRIPTION_MAX_AGE_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class ServiceSnapshot:
+    """Point-in-time view of one service, built from a single describe_services response."""
+
+    cluster_name: str
+    service: ServiceTypeDef
+
+    @property
+    def service_name(self) -> str:
+        return self.service["serviceName"]
+
+    @property
+    def desired_task_definition_arn(self) -> str | None:
+        return self.service.get("taskDefinition")
+
+    @property
+    def running_count(self) -> int:
+        return self.service.get("runningCount", 0)
+
+    @property
+    def desired_count(self) -> int:
+        return self.service.get("desiredCount", 0)
+
+    @property
+    def pending_count(self) -> int:
+        return self.service.get("pendingCount", 0)
+
+    @property
+    def deployments(self) -> list[DeploymentTypeDef]:
+        return list(self.service.get("deployments", []))
+
+    @property
+    def info(self) -> ServiceInfo:
+        return _create_service_info(self.service)
+
+    @property
+    def events(self) -> list[ServiceEvent]:
+        """Service events, most recent first."""
+        service_events = [_create_service_event(dict(event)) for event in self.service.get("events", [])]
+        # Sort by creation time, most recent first (handle None values)
+        return sorted(service_events, key=lambda x: x["created_at"] or datetime.min, reverse=True)
 
 
 class ServiceService(BaseAWSService):
     """Service for ECS service operations."""
 
-    def __init__(self, ecs_client: ECSClient) -> None:
+    def __init__(self, ecs_client: ECSClient, disk_cache: DiskCache | None = None) -> None:
         super().__init__(ecs_client)
+        self.disk_cache = disk_cache
+        # Latest full description per (cluster, service), kept from every describe_services response
+        self._descriptions: dict[tuple[str, str], tuple[float, ServiceTypeDef]] = {}
+        # Inventories fetched ahead of time, each handed out once to the next foreground read
+        self._prefetched: dict[str, tuple[float, BatchResult[ServiceInfo]]] = {}
 
     def get_services(self, cluster_name: str) -> list[str]:
-        """Get list of service names in a cluster."""
-        response = self.ecs_client.list_services(cluster=cluster_name)
-        service_arns = response.get("serviceArns", [])
-        return [extract_name_from_arn(arn) for arn in service_arns]
+        """Get list of service names in a cluster, from the disk cache when it is fresh enough."""
+        if self.disk_cache:
+            cached = self.disk_cache.get(_service_names_key(cluster_name), max_age=SERVICE_NAMES_TTL_SECONDS)
+            if cached is not None:
+                return cached
+        return self.fetch_services(cluster_name)
+
+    def fetch_services(self, cluster_name: str) -> list[str]:
+        """Get list of service names in a cluster from AWS and refresh the disk cache."""
+        service_names = list(self.iter_service_names(cluster_name))
+        if self.disk_cache:
+            self.disk_cache.put(_service_names_key(cluster_name), service_names)
+        return service_names
+
+    def iter_service_names(self, cluster_name: str) -> Iterator[str]:
+        """Yield service names from AWS as each list_services page arrives."""
+        paginator = self.ecs_client.get_paginator("list_services")
+        for page in paginator.paginate(cluster=cluster_name):
+            yield from (extract_name_from_arn(arn) for arn in page.get("serviceArns", []))
 
     def get_service_info(self, cluster_name: str) -> list[ServiceInfo]:
         """Get detailed service information with status."""
+        return self.get_service_inventory(cluster_name).results
+
+    def get_service_inventory(self, cluster_name: str) -> BatchResult[ServiceInfo]:
+        """Get service information for every service in a cluster, along with chunks that failed to load."""
+        prefetched = self.take_prefetched_inventory(cluster_name)
+        if prefetched is not None:
+            return prefetched
+
         service_names = self.get_services(cluster_name)
-        if not service_names:
-            return []
+        return self._save_inventory(cluster_name, self.describe_services(cluster_name, service_names))
+
+    def refresh_service_inventory(
+        self, cluster_name: str, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BatchResult[ServiceInfo]:
+        """Like get_service_inventory, but always lists services from AWS instead of the cache."""
+        service_names = self.fetch_services(cluster_name)
+        return self._save_inventory(cluster_name, self.describe_services(cluster_name, service_names, max_workers))
+
+    def prefetch_service_inventory(self, cluster_name: str) -> None:
+        """Load a cluster's service inventory ahead of time for the next get_service_inventory call."""
+        inventory = self.refresh_service_inventory(cluster_name, max_workers=PREFETCH_MAX_WORKERS)
+        if not inventory.failures:
+            self._prefetched[cluster_name] = (time.monotonic(), inventory)
+
+    def take_prefetched_inventory(self, cluster_name: str) -> BatchResult[ServiceInfo] | None:
+        """Hand out the cluster's prefetched inventory if it is still fresh; each one is handed out once."""
+        prefetched = self._prefetched.pop(cluster_name, None)
+        if prefetched is not None and time.monotonic() - prefetched[0] <= PREFETCH_MAX_AGE_SECONDS:
+            return prefetched[1]
+        return None
+
+    def get_cached_service_info(self, cluster_name: str) -> list[ServiceInfo] | None:
+        """Get the last-known service information for a cluster regardless of age, or None if none is cached."""
+        return self.disk_cache.get(_service_info_key(cluster_name)) if self.disk_cache else None
+
+    def _save_inventory(self, cluster_name: str, inventory: BatchResult[ServiceInfo]) -> BatchResult[ServiceInfo]:
+        # A partial listing would hide services on the next start, so only complete ones become the snapshot
+        if self.disk_cache and not inventory.failures:
+            self.disk_cache.put(_service_info_key(cluster_name), inventory.results)
+        return inventory
+
+    def describe_services(
+        self, cluster_name: str, service_names: list[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BatchResult[ServiceInfo]:
+        """Describe services in parallel chunks of 10, preserving the order of `service_names`."""
+
+        missing: list[ChunkFailure] = []
 
+        def describe_chunk(chunk: list[str]) -> list[ServiceInfo]:
+            return [_create_service_info(service) for service in self._describe_chunk(cluster_name, chunk, missing)]
+
+        batch = fetch_in_chunks(service_names, DESCRIBE_SERVICES_CHUNK_SIZE, describe_chunk, max_workers)
+        batch.failures.extend(missing)
+        return batch
+
+    def describe_service_snapshots(self, cluster_name: str, service_names: list[str]) -> BatchResult[ServiceSnapshot]:
+        """Like describe_services, returning a full snapshot of each service."""
+
+        missing: list[ChunkFailure] = []
+
+        def describe_chunk(chunk: list[str]) -> list[ServiceSnapshot]:
+            services = self._describe_chunk(cluster_name, chunk, missing)
+            return [ServiceSnapshot(cluster_name, service) for service in services]
+
+        batch = fetch_in_chunks(service_names, DESCRIBE_SERVICES_CHUNK_SIZE, describe_chunk)
+        batch.failures.extend(missing)
+        return batch
+
+    def iter_service_snapshots(self, cluster_name: str) -> Iterator[ServiceSnapshot]:
+        """Describe every service in a cluster, yielding snapshots as each chunk of 10 arrives.
+
+        Listing keeps paging while earlier chunks are being described, and results come in
+        completion order rather than listing order.
+        """
+        chunks = chunked(self.iter_service_names(cluster_name), DESCRIBE_SERVICES_CHUNK_SIZE)
+        for service in stream_chunks(chunks, lambda chunk: self._describe_chunk(cluster_name, chunk)):
+            yield ServiceSnapshot(cluster_name, service)
+
+    def _describe_chunk(
+        self, cluster_name: str, service_names: list[str], failures: list[ChunkFailure] | None = None
+    ) -> list[ServiceTypeDef]:
         response = self.ecs_client.describe_services(cluster=cluster_name, services=service_names)
+        if failures is not None:
+            # Missing or inaccessible services come back in "failures" rather than as an error
+            failures.extend(_describe_failures(response.get("failures", [])))
         services = response.get("services", [])
-        return [_create_service_info(service) for service in services]
+        for service in services:
+            self._descriptions[(cluster_name, service["serviceName"])] = (time.monotonic(), service)
+        return services
 
-    def get_desired_task_definition_arn(self, cluster_name: str, service_name: str) -> str | None:
-        """Get the desired task definition ARN for a service."""
+    def get_service_snapshot(self, cluster_name: str, service_name: str) -> ServiceSnapshot | None:
+        """Get a snapshot of a service, reusing the description from a recent service listing if there is one."""
+        described = self._descriptions.get((cluster_name, service_name))
+        if described is not None and time.monotonic() - described[0] <= DESCRIPTION_MAX_AGE_SECONDS:
+            return ServiceSnapshot(cluster_name, described[1])
+        return self.refresh_service_snapshot(cluster_name, service_name)
+
+    def refresh_service_snapshot(self, cluster_name: str, service_name: str) -> ServiceSnapshot | None:
+        """Describe a service again and return a fresh snapshot."""
         response = self.ecs_client.describe_services(cluster=cluster_name, services=[service_name])
         services = response.get("services", [])
-        if services:
-            return services[0].get("taskDefinition")
-        return None
+        if not services:
+            return None
+
+        self._descriptions[(cluster_name, service_name)] = (time.monotonic(), services[0])
+        return ServiceSnapshot(cluster_name, services[0])
+
+    def get_desired_task_definition_arn(self, cluster_name: str, service_name: str) -> str | None:
+        """Get the desired task definition ARN for a service."""
+        snapshot = self.refresh_service_snapshot(cluster_name, service_name)
+        return snapshot.desired_task_definition_arn if snapshot else None
 
     def get_service_events(self, cluster_name: str, service_name: str) -> list[ServiceEvent]:
         """Get recent events for a service."""
-        response = self.ecs_client.describe_services(cluster=cluster_name, services=[service_name])
-        services = response.get("services", [])
-        if not services:
-            return []
+        snapshot = self.refresh_service_snapshot(cluster_name, service_name)
+        return snapshot.events if snapshot else []
 
-        events = services[0].get("events", [])
-        service_events = [_create_service_event(dict(event)) for event in events]
 
-        # Sort by creation time, most recent first (handle None values)
-        return sorted(service_events, key=lambda x: x["created_at"] or datetime.min, reverse=True)
+def _describe_failures(failures: list[FailureTypeDef]) -> list[ChunkFailure]:
+    """Group the per-service failures of one describe_services response by reason."""
+    by_reason: dict[str, list[str]] = {}
+    for failure in failures:
+        name = extract_name_from_arn(failure.get("arn", ""))
+        by_reason.setdefault(failure.get("reason", "unknown error"), []).append(name)
+    return [ChunkFailure(items=names, reason=reason) for reason, names in by_reason.items()]
+
+
+def _service_names_key(cluster_name: str) -> str:
+    return f"service-names/{cluster_name}"
+
+
+def _service_info_key(cluster_name: str) -> str:
+    return f"service-info/{cluster_name}"
 
 
 def _create_service_info(service: ServiceTypeDef) -> ServiceInfo:
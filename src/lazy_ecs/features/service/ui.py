@@ -2,17 +2,56 @@
 
 from __future__ import annotations
 
+import fnmatch
+from datetime import datetime
+from threading import Event
+from typing import TYPE_CHECKING
+
 import questionary
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
+from rich.text import Text
 
 from ...core.base import BaseUIComponent
-from ...core.types import TaskInfo
-from .actions import ServiceActions
-from .service import ServiceService
+from ...core.navigation import REFRESH_VALUE
+from ...core.polling import stop_on_escape
+from ...core.types import ServiceInfo, TaskInfo
+from ...core.utils import print_warning
+from .actions import DEFAULT_DEPLOY_CONCURRENCY, DeploymentOutcome, ServiceActions
+from .dashboard import ClusterDashboard, DashboardRow, DashboardUpdate
+from .rollout import (
+    FAILED,
+    IN_PROGRESS,
+    ROLLOUT_EXIT_STATUSES,
+    STEADY,
+    RolloutProgress,
+    primary_deployment,
+    watch_rollout,
+)
+from .service import ServiceService, ServiceSnapshot
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from ...core.batching import ChunkFailure
 
 console = Console()
 
+MAX_DEPLOY_CONCURRENCY = 20
+BULK_DEPLOY_VALUE = "action:bulk_deploy"
+DASHBOARD_VALUE = "action:dashboard"
+# Lines the dashboard needs around its rows: title, header, borders and caption
+DASHBOARD_CHROME_LINES = 8
+DEPLOYMENT_STATUS_STYLES = {
+    "queued": ("⏳", "dim"),
+    "deploying": ("🚀", "blue"),
+    "retrying": ("🔁", "yellow"),
+    "succeeded": ("✅", "green"),
+    "failed": ("❌", "red"),
+    "cancelled": ("⏹️", "dim"),
+}
+
 
 class ServiceUI(BaseUIComponent):
     """UI component for service selection and display."""
@@ -23,16 +62,49 @@ class ServiceUI(BaseUIComponent):
         self.service_actions = service_actions
 
     def select_service(self, cluster_name: str) -> str | None:
-        """Interactive service selection with status information and navigation."""
-        service_info = self.service_service.get_service_info(cluster_name)
+        """Interactive service selection with status information and navigation.
+
+        An inventory prefetched moments ago is shown as is. Otherwise a cached snapshot of the service
+        list is shown immediately when available while fresh status is loaded in the background; the
+        prompt offers 'r' to switch to the fresh list.
+        """
+        refresh_failures: list[ChunkFailure] = []
+        refresh: Future[list[dict[str, str]]] | None = None
+        inventory = self.service_service.take_prefetched_inventory(cluster_name)
+        service_info = self.service_service.get_cached_service_info(cluster_name) if inventory is None else None
+        if service_info:
+            refresh = self._refresh_choices(cluster_name, refresh_failures)
+        else:
+            if inventory is None:
+                inventory = self.service_service.get_service_inventory(cluster_name)
+            service_info = inventory.results
+            _report_failures(inventory.failures)
 
         if not service_info:
             console.print(f"❌ No services found in cluster '{cluster_name}'", style="red")
             return "navigation:back"
 
-        choices = [{"name": info["name"], "value": f"service:{info['name'].split(' ')[1]}"} for info in service_info]
+        choices = _service_choices(service_info)
+
+        while True:
+            selected = self.select_with_nav("Select a service:", choices, "Back to cluster selection", refresh)
+            if selected != REFRESH_VALUE or refresh is None:
+                return selected
+            try:
+                choices = refresh.result()
+            except Exception as e:
+                print_warning(f"Could not refresh service list: {e}")
+            _report_failures(refresh_failures)
+            refresh_failures = []
+            refresh = self._refresh_choices(cluster_name, refresh_failures)
+
+    def _refresh_choices(self, cluster_name: str, failures: list[ChunkFailure]) -> Future[list[dict[str, str]]]:
+        def refresh() -> list[dict[str, str]]:
+            inventory = self.service_service.refresh_service_inventory(cluster_name)
+            failures.extend(inventory.failures)
+            return _service_choices(inventory.results)
 
-        return self.select_with_nav("Select a service:", choices, "Back to cluster selection")
+        return self.run_in_background(refresh)
 
     def select_service_action(self, service_name: str, task_info: list[TaskInfo]) -> str | None:
         """Present service action menu."""
@@ -42,14 +114,19 @@ class ServiceUI(BaseUIComponent):
             choices.append({"name": task["name"], "value": f"task:show_details:{task['value']}"})
 
         choices.append({"name": "📋 Show service events", "value": "action:show_events"})
+        choices.append({"name": "📜 Show logs for all tasks", "value": "action:show_logs"})
+        choices.append({"name": "🔍 Filter service logs", "value": "action:filter_logs"})
+        choices.append({"name": "📊 Logs Insights query", "value": "action:insights"})
+        choices.append({"name": "💾 Export service logs", "value": "action:export_logs"})
         choices.append({"name": "🚀 Force new deployment", "value": "action:force_deployment"})
+        choices.append({"name": "👀 Watch rollout until steady", "value": "action:watch_rollout"})
 
         return self.select_with_nav(
             f"Select action for service '{service_name}':", choices, "Back to cluster selection"
         )
 
-    def handle_force_deployment(self, cluster_name: str, service_name: str) -> None:
-        """Handle force deployment confirmation and execution."""
+    def handle_force_deployment(self, cluster_name: str, service_name: str) -> bool:
+        """Handle force deployment confirmation and execution. Returns True if a deployment was started."""
         confirm = questionary.confirm(
             f"Force new deployment for service '{service_name}' in cluster '{cluster_name}'?"
         ).ask()
@@ -58,12 +135,111 @@ class ServiceUI(BaseUIComponent):
             success = self.service_actions.force_new_deployment(cluster_name, service_name)
             if success:
                 console.print(f"✅ Successfully triggered deployment for '{service_name}'", style="green")
-            else:
-                console.print(f"❌ Failed to trigger deployment for '{service_name}'", style="red")
+                return True
+            console.print(f"❌ Failed to trigger deployment for '{service_name}'", style="red")
+        return False
+
+    def watch_rollout(self, cluster_name: str, service_name: str) -> int:
+        """Print new service events and rollout progress until the service is steady or the rollout fails.
+
+        Returns the rollout's exit status: 0 when steady, 1 when failed, 2 when stopped before either.
+        """
+        snapshot = self.service_service.refresh_service_snapshot(cluster_name, service_name)
+        if snapshot is None:
+            print_warning(f"Service '{service_name}' not found in cluster '{cluster_name}'")
+            return ROLLOUT_EXIT_STATUSES[IN_PROGRESS]
+
+        console.print(f"👀 Watching rollout of '{service_name}' (press ESC or q to stop)", style="bold cyan")
+        progress = None
+        stop = Event()
+        with stop_on_escape(stop):
+            for progress in watch_rollout(self.service_service, snapshot, stop):
+                for event in progress.new_events:
+                    time_str = event["created_at"].strftime("%H:%M:%S") if event["created_at"] else "--:--:--"
+                    console.print(
+                        f"[{time_str}] {event['message']}",
+                        style=_get_event_type_style(event["event_type"]),
+                        markup=False,
+                    )
+                console.print(_rollout_status_line(progress), style="dim", markup=False)
+
+        if progress is not None and progress.state == STEADY:
+            console.print(f"✅ '{service_name}' reached a steady state", style="green")
+        elif progress is not None and progress.state == FAILED:
+            console.print(f"❌ Deployment of '{service_name}' failed", style="red")
+        else:
+            console.print("⏹️ Stopped watching; the rollout is still in progress", style="yellow")
+        return progress.exit_status if progress is not None else ROLLOUT_EXIT_STATUSES[IN_PROGRESS]
+
+    def handle_bulk_force_deployment(self, cluster_name: str) -> None:
+        """Pick services by hand or by name pattern, then force new deployments for them in parallel."""
+        # Only names are needed, so the (usually cached) service list avoids describing every service again
+        service_names = self.service_service.get_services(cluster_name)
+        selected = _choose_services(service_names)
+        if not selected:
+            return
 
-    def display_service_events(self, cluster_name: str, service_name: str) -> None:
-        """Display service events in a Rich table."""
-        events = self.service_service.get_service_events(cluster_name, service_name)
+        concurrency = questionary.text(
+            "How many deployments to start at once?",
+            default=str(DEFAULT_DEPLOY_CONCURRENCY),
+            validate=_validate_concurrency,
+        ).ask()
+        if concurrency is None:
+            return
+        confirm = questionary.confirm(
+            f"Force new deployment for {len(selected)} services in cluster '{cluster_name}'?", default=False
+        ).ask()
+        if not confirm:
+            return
+
+        # Rows are filled in up front and updated in place by the workers, so the table never changes size
+        rows = {name: DeploymentOutcome(name) for name in selected}
+
+        def on_update(outcome: DeploymentOutcome) -> None:
+            rows[outcome.service_name] = outcome
+
+        stop = Event()
+        console.print("Press ESC or q to cancel services that have not started", style="dim")
+        with (
+            stop_on_escape(stop),
+            Live(get_renderable=lambda: _deployment_table(cluster_name, list(rows.values())), console=console),
+        ):
+            outcomes = self.service_actions.force_new_deployments(
+                cluster_name, selected, int(concurrency), on_update, stop
+            )
+        _print_deployment_summary(outcomes)
+
+    def show_dashboard(self, cluster_name: str) -> None:
+        """Show every service of a cluster in a table that refreshes until ESC is pressed.
+
+        The screen is only redrawn after a poll that changed something, and only the changed
+        rows are formatted again.
+        """
+        dashboard = ClusterDashboard(self.service_service, cluster_name)
+        renderer = _DashboardRenderer(cluster_name)
+        stop = Event()
+        console.print(f"📊 Live dashboard for '{cluster_name}' (press ESC or q to stop)", style="bold cyan")
+        try:
+            with stop_on_escape(stop), Live(console=console, auto_refresh=False) as live:
+                first = True
+                while not stop.is_set():
+                    update = dashboard.poll()
+                    if first or update or update.failures:
+                        max_rows = max(console.size.height - DASHBOARD_CHROME_LINES, 5)
+                        live.update(renderer.render(dashboard, update, max_rows), refresh=True)
+                    first = False
+                    stop.wait(dashboard.next_interval(update))
+        except Exception as e:
+            print_warning(f"Dashboard stopped: {e}")
+
+    def display_service_events(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> None:
+        """Display service events in a Rich table, from the snapshot when one is given."""
+        if snapshot is not None:
+            events = snapshot.events
+        else:
+            events = self.service_service.get_service_events(cluster_name, service_name)
 
         if not events:
             console.print(f"No events found for service '{service_name}'", style="blue")
@@ -106,6 +282,159 @@ class ServiceUI(BaseUIComponent):
         console.print(table)
 
 
+def _service_choices(service_info: list[ServiceInfo]) -> list[dict[str, str]]:
+    choices = [{"name": info["name"], "value": f"service:{_service_name(info)}"} for info in service_info]
+    if len(service_info) > 1:
+        choices.append({"name": "📊 Live cluster dashboard", "value": DASHBOARD_VALUE})
+        choices.append({"name": "🚀 Force new deployment for several services", "value": BULK_DEPLOY_VALUE})
+    return choices
+
+
+def _service_name(info: ServiceInfo) -> str:
+    return info["name"].split(" ")[1]
+
+
+def _deployment_table(cluster_name: str, outcomes: list[DeploymentOutcome]) -> Table:
+    table = Table(title=f"Force new deployment in '{cluster_name}'", show_header=True, header_style="bold magenta")
+    table.add_column("Service", style="cyan")
+    table.add_column("Status")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Last error", style="dim", max_width=60)
+    for outcome in outcomes:
+        icon, style = DEPLOYMENT_STATUS_STYLES[outcome.status]
+        table.add_row(
+            outcome.service_name,
+            f"[{style}]{icon} {outcome.status}[/{style}]",
+            str(outcome.attempts or ""),
+            outcome.error or "",
+        )
+    return table
+
+
+def _report_failures(failures: list[ChunkFailure]) -> None:
+    for failure in failures:
+        print_warning(f"Could not load {len(failure.items)} services: {failure.reason}")
+
+
+def _choose_services(service_names: list[str]) -> list[str]:
+    how = questionary.select(
+        "Choose services to redeploy:",
+        choices=[
+            questionary.Choice("☑️ Pick from a list", "pick"),
+            questionary.Choice("🔎 Match a name pattern (e.g. api-*)", "pattern"),
+        ],
+    ).ask()
+    if how == "pick":
+        return questionary.checkbox("Select services:", choices=service_names).ask() or []
+    if how != "pattern":
+        return []
+
+    pattern = questionary.text("Service name pattern:").ask()
+    if not pattern:
+        return []
+    matched = fnmatch.filter(service_names, pattern)
+    if not matched:
+        print_warning(f"No services match '{pattern}'")
+        return []
+    console.print(f"{len(matched)} services match '{pattern}': {', '.join(matched)}", style="dim")
+    return matched
+
+
+class _DashboardRenderer:
+    """Builds the dashboard table, formatting again only the rows a poll changed."""
+
+    def __init__(self, cluster_name: str) -> None:
+        self.cluster_name = cluster_name
+        self._cells: dict[str, tuple[Text, ...]] = {}
+
+    def render(self, dashboard: ClusterDashboard, update: DashboardUpdate, max_rows: int) -> Table:
+        for name in update.removed:
+            self._cells.pop(name, None)
+        rows = dashboard.sorted_rows()
+        table = Table(title=f"Cluster '{self.cluster_name}'", show_header=True, header_style="bold magenta")
+        table.add_column("", width=2)
+        table.add_column("Service", style="cyan")
+        table.add_column("Running", justify="right")
+        table.add_column("Desired", justify="right")
+        table.add_column("Pending", justify="right")
+        table.add_column("Rollout")
+        table.add_column("Failures")
+        for row in rows[:max_rows]:
+            if row.service_name in update.changed or row.service_name not in self._cells:
+                self._cells[row.service_name] = _dashboard_cells(row)
+            table.add_row(*self._cells[row.service_name])
+
+        caption = f"{len(rows)} services"
+        if len(rows) > max_rows:
+            caption += f", {len(rows) - max_rows} more not shown"
+        if update.failures:
+            caption += f", {sum(len(failure.items) for failure in update.failures)} could not be refreshed"
+        table.caption = f"{caption} · updated {datetime.now().strftime('%H:%M:%S')}"
+        return table
+
+
+def _dashboard_cells(row: DashboardRow) -> tuple[Text, ...]:
+    rollout = row.rollout_state or ("IN_PROGRESS" if row.rolling_out else "-")
+    if row.deployments > 1:
+        rollout += f" ({row.deployments} deployments)"
+    rollout_style = {"FAILED": "red", "IN_PROGRESS": "yellow"}.get(row.rollout_state or "", "dim")
+    if row.rolling_out and rollout_style == "dim":
+        rollout_style = "yellow"
+
+    failures = []
+    if row.failed_tasks:
+        failures.append(f"{row.failed_tasks} failed tasks")
+    if row.last_failure_at and row.recent_failure:
+        failures.append(f"❗ {row.last_failure_at.strftime('%H:%M')}")
+    return (
+        Text(row.icon),
+        Text(row.service_name),
+        Text(str(row.running_count), style="green" if row.running_count >= row.desired_count else "yellow"),
+        Text(str(row.desired_count)),
+        Text(str(row.pending_count), style="yellow" if row.pending_count else "dim"),
+        Text(rollout, style=rollout_style),
+        Text(", ".join(failures), style="red"),
+    )
+
+
+def _rollout_status_line(progress: RolloutProgress) -> str:
+    snapshot = progress.snapshot
+    primary = primary_deployment(snapshot)
+    line = (
+        f"  {progress.state.lower().replace('_', ' ')}: {snapshot.running_count}/{snapshot.desired_count} running, "
+        f"{snapshot.pending_count} pending, {len(snapshot.deployments)} deployments"
+    )
+    if primary is not None:
+        line += f"; new tasks {primary.get('runningCount', 0)}/{primary.get('desiredCount', 0)}"
+        if primary.get("rolloutState"):
+            line += f" ({primary['rolloutState']})"
+    return line
+
+
+def _validate_concurrency(text: str) -> bool | str:
+    if text.isdigit() and 1 <= int(text) <= MAX_DEPLOY_CONCURRENCY:
+        return True
+    return f"Enter a number from 1 to {MAX_DEPLOY_CONCURRENCY}"
+
+
+def _print_deployment_summary(outcomes: list[DeploymentOutcome]) -> None:
+    succeeded = sum(outcome.status == "succeeded" for outcome in outcomes)
+    failed = [outcome for outcome in outcomes if outcome.status == "failed"]
+    cancelled = sum(outcome.status == "cancelled" for outcome in outcomes)
+    retried = sum(outcome.attempts > 1 for outcome in outcomes)
+
+    summary = f"✅ {succeeded} deployments started"
+    if failed:
+        summary += f", ❌ {len(failed)} failed"
+    if cancelled:
+        summary += f", ⏹️ {cancelled} cancelled"
+    if retried:
+        summary += f" ({retried} needed retries after throttling)"
+    console.print(summary, style="red" if failed else "green")
+    for outcome in failed:
+        console.print(f"  {outcome.service_name}: {outcome.error}", style="red")
+
+
 def _get_event_type_style(event_type: str) -> str:
     """Get Rich style for event type."""
     event_styles = {
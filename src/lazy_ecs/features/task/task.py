@@ -2,48 +2,140 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from ...core.base import BaseAWSService
+import time
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from ...core.aws_base import BaseAWSService
+from ...core.batching import DEFAULT_MAX_WORKERS, BatchResult, chunked, fetch_in_chunks, stream_chunks
+from ...core.cache import TaskDefinitionStore, is_revision_arn, task_definition_store
+from ...core.context import TaskSession
+from ...core.prefetch import PREFETCH_MAX_WORKERS
 from ...core.types import TaskDetails, TaskHistoryDetails, TaskInfo
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from mypy_boto3_ecs.client import ECSClient
+    from mypy_boto3_ecs.literals import DesiredStatusType
     from mypy_boto3_ecs.type_defs import TaskDefinitionTypeDef, TaskTypeDef
 
+    from ...core.disk_cache import DiskCache
+
+# describe_tasks accepts at most 100 task ARNs per call
+DESCRIBE_TASKS_CHUNK_SIZE = 100
+# Task status changes quickly, so a prefetched task list is only used if it is this fresh
+PREFETCH_MAX_AGE_SECONDS = 15
+
 
 class TaskService(BaseAWSService):
     """Service for ECS task operations."""
 
-    def __init__(self, ecs_client: ECSClient) -> None:
+    def __init__(
+        self,
+        ecs_client: ECSClient,
+        task_definitions: TaskDefinitionStore | None = None,
+        disk_cache: DiskCache | None = None,
+    ) -> None:
         super().__init__(ecs_client)
+        self.task_definitions = task_definitions or task_definition_store
+        self.disk_cache = disk_cache
+        # Task lists fetched ahead of time, each handed out once to the next foreground read
+        self._prefetched: dict[tuple[str, str], tuple[float, list[TaskTypeDef]]] = {}
 
     def get_tasks(self, cluster_name: str, service_name: str) -> list[str]:
         """Get list of task ARNs for a service."""
-        response = self.ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
-        return response.get("taskArns", [])
+        return list(self.iter_task_arns(cluster_name, service_name))
 
     def get_task_info(self, cluster_name: str, service_name: str, desired_task_def_arn: str | None) -> list[TaskInfo]:
         """Get detailed task information with human-readable names."""
-        task_arns = self.get_tasks(cluster_name, service_name)
-        if not task_arns:
-            return []
-
+        return self.get_task_inventory(cluster_name, service_name, desired_task_def_arn).results
+
+    def get_task_inventory(
+        self, cluster_name: str, service_name: str, desired_task_def_arn: str | None
+    ) -> BatchResult[TaskInfo]:
+        """Get task information in list_tasks order, along with describe_tasks chunks that failed to load."""
+        prefetched = self._prefetched.pop((cluster_name, service_name), None)
+        if prefetched is not None and time.monotonic() - prefetched[0] <= PREFETCH_MAX_AGE_SECONDS:
+            return BatchResult([_create_task_info(task, desired_task_def_arn) for task in prefetched[1]])
+
+        batch = self.describe_tasks(cluster_name, list(self.iter_task_arns(cluster_name, service_name)))
+        return BatchResult([_create_task_info(task, desired_task_def_arn) for task in batch.results], batch.failures)
+
+    def prefetch_service_tasks(self, cluster_name: str, service_name: str) -> list[TaskTypeDef]:
+        """Load a service's tasks ahead of time for the next get_task_info call."""
+        task_arns = list(self.iter_task_arns(cluster_name, service_name))
+        batch = self.describe_tasks(cluster_name, task_arns, max_workers=PREFETCH_MAX_WORKERS)
+        if not batch.failures:
+            self._prefetched[(cluster_name, service_name)] = (time.monotonic(), batch.results)
+        return batch.results
+
+    def iter_task_arns(
+        self, cluster_name: str, service_name: str | None = None, desired_status: DesiredStatusType | None = None
+    ) -> Iterator[str]:
+        """Yield task ARNs across every list_tasks page."""
+        params: dict[str, Any] = {"cluster": cluster_name}
+        if service_name:
+            params["serviceName"] = service_name
+        if desired_status:
+            params["desiredStatus"] = desired_status
+
+        while True:
+            response = self.ecs_client.list_tasks(**params)
+            yield from response.get("taskArns", [])
+            next_token = response.get("nextToken")
+            if not next_token:
+                return
+            params["nextToken"] = next_token
+
+    def describe_tasks(
+        self, cluster_name: str, task_arns: list[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BatchResult[TaskTypeDef]:
+        """Describe tasks in parallel chunks of 100, preserving the order of `task_arns`."""
+        return fetch_in_chunks(
+            task_arns, DESCRIBE_TASKS_CHUNK_SIZE, lambda chunk: self._describe_chunk(cluster_name, chunk), max_workers
+        )
+
+    def iter_described_tasks(self, cluster_name: str, task_arns: Iterable[str]) -> Iterator[TaskTypeDef]:
+        """Describe task ARNs in parallel chunks of 100, yielding tasks as each chunk arrives.
+
+        Tasks come in completion order and a failed chunk ends the stream, so this suits
+        NDJSON output; menus use describe_tasks.
+        """
+        chunks = chunked(task_arns, DESCRIBE_TASKS_CHUNK_SIZE)
+        return stream_chunks(chunks, lambda chunk: self._describe_chunk(cluster_name, chunk))
+
+    def _describe_chunk(self, cluster_name: str, task_arns: list[str]) -> list[TaskTypeDef]:
         response = self.ecs_client.describe_tasks(cluster=cluster_name, tasks=task_arns)
         tasks = response.get("tasks", [])
-        return [_create_task_info(task, desired_task_def_arn) for task in tasks]
+        for task in tasks:
+            self.task_definitions.remember_task(task)
+        return tasks
 
     def get_task_details(
-        self, cluster_name: str, task_arn: str, desired_task_def_arn: str | None
+        self, cluster_name: str, service_name: str, task_arn: str, desired_task_def_arn: str | None
     ) -> TaskDetails | None:
         """Get comprehensive task details."""
+        session = self.get_task_session(cluster_name, service_name, task_arn, desired_task_def_arn)
+        return session.details if session else None
+
+    def get_task_session(
+        self, cluster_name: str, service_name: str, task_arn: str, desired_task_def_arn: str | None
+    ) -> TaskSession | None:
+        """Load a task and its task definition once for reuse by every action on the task."""
         result = self.get_task_and_definition(cluster_name, task_arn)
         if not result:
             return None
 
         task, task_definition = result
         is_desired_version = task["taskDefinitionArn"] == desired_task_def_arn
-        return _build_task_details(task, task_definition, is_desired_version)
+        return TaskSession(
+            cluster_name=cluster_name,
+            service_name=service_name,
+            task=task,
+            task_definition=task_definition,
+            details=_build_task_details(task, task_definition, is_desired_version),
+        )
 
     def get_task_and_definition(
         self, cluster_name: str, task_arn: str
@@ -55,42 +147,38 @@ class TaskService(BaseAWSService):
             return None
 
         task = tasks[0]
-        task_def_arn = task["taskDefinitionArn"]
-        task_def_response = self.ecs_client.describe_task_definition(taskDefinition=task_def_arn)
-        task_definition = task_def_response["taskDefinition"]
+        self.task_definitions.remember_task(task)
+        task_definition = self.get_task_definition(task["taskDefinitionArn"])
 
         return task, task_definition
 
+    def get_task_definition(self, task_definition_arn: str) -> TaskDefinitionTypeDef:
+        """Get a task definition from memory, then disk, then ECS."""
+        task_definition = self.task_definitions.get(task_definition_arn)
+        if task_definition is not None:
+            return task_definition
+
+        cache_key = f"task-definition/{task_definition_arn}"
+        if self.disk_cache and is_revision_arn(task_definition_arn):
+            # Revisions are immutable, so disk entries never expire
+            task_definition = self.disk_cache.get(cache_key)
+            if task_definition is not None:
+                self.task_definitions.put(task_definition)
+                return task_definition
+
+        task_definition = self.task_definitions.get_or_fetch(self.ecs_client, task_definition_arn)
+        if self.disk_cache and is_revision_arn(task_definition_arn):
+            self.disk_cache.put(cache_key, task_definition)
+        return task_definition
+
     def get_task_history(self, cluster_name: str, service_name: str | None = None) -> list[TaskHistoryDetails]:
         """Get task history including stopped tasks with failure information."""
-        task_arns = []
-
-        # Get running tasks
-        if service_name:
-            running_response = self.ecs_client.list_tasks(
-                cluster=cluster_name, serviceName=service_name, desiredStatus="RUNNING"
-            )
-        else:
-            running_response = self.ecs_client.list_tasks(cluster=cluster_name, desiredStatus="RUNNING")
-        task_arns.extend(running_response.get("taskArns", []))
-
-        # Get stopped tasks
-        if service_name:
-            stopped_response = self.ecs_client.list_tasks(
-                cluster=cluster_name, serviceName=service_name, desiredStatus="STOPPED"
-            )
-        else:
-            stopped_response = self.ecs_client.list_tasks(cluster=cluster_name, desiredStatus="STOPPED")
-        task_arns.extend(stopped_response.get("taskArns", []))
-
-        if not task_arns:
-            return []
-
-        # Get detailed task information
-        response = self.ecs_client.describe_tasks(cluster=cluster_name, tasks=task_arns)
-        tasks = response.get("tasks", [])
-
-        return [self._parse_task_history(task) for task in tasks]
+        task_arns = chain(
+            self.iter_task_arns(cluster_name, service_name, desired_status="RUNNING"),
+            self.iter_task_arns(cluster_name, service_name, desired_status="STOPPED"),
+        )
+        batch = self.describe_tasks(cluster_name, list(task_arns))
+        return [self._parse_task_history(task) for task in batch.results]
 
     def get_task_failure_analysis(self, task_history: TaskHistoryDetails) -> str:
         """Analyze task failure and provide human-readable explanation."""
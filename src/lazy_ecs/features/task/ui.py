@@ -120,8 +120,16 @@ class TaskUI(BaseUIComponent):
             [
                 {"name": "Show task details", "value": "task_action:show_details"},
                 {"name": "Show task history and failures", "value": "task_action:show_history"},
+                {"name": "Refresh task status", "value": "task_action:refresh"},
             ]
         )
+        if len(containers) > 1:
+            choices.extend(
+                [
+                    {"name": "Show logs for all containers", "value": "task_action:show_logs"},
+                    {"name": "Follow logs for all containers (live)", "value": "task_action:follow_logs"},
+                ]
+            )
 
         for container in containers:
             container_name = container["name"]
@@ -131,6 +139,30 @@ class TaskUI(BaseUIComponent):
                         "name": f"Show logs for '{container_name}'",
                         "value": f"container_action:show_logs:{container_name}",
                     },
+                    {
+                        "name": f"Open logs for '{container_name}' in pager",
+                        "value": f"container_action:page_logs:{container_name}",
+                    },
+                    {
+                        "name": f"Follow logs for '{container_name}' (live)",
+                        "value": f"container_action:follow_logs:{container_name}",
+                    },
+                    {
+                        "name": f"Browse log history for '{container_name}'",
+                        "value": f"container_action:browse_logs:{container_name}",
+                    },
+                    {
+                        "name": f"Filter logs for '{container_name}'",
+                        "value": f"container_action:filter_logs:{container_name}",
+                    },
+                    {
+                        "name": f"Logs Insights query for '{container_name}'",
+                        "value": f"container_action:insights:{container_name}",
+                    },
+                    {
+                        "name": f"Export logs for '{container_name}'",
+                        "value": f"container_action:export_logs:{container_name}",
+                    },
                     {
                         "name": f"Show environment variables for '{container_name}'",
                         "value": f"container_action:show_env:{container_name}",
@@ -264,6 +296,10 @@ def _build_task_feature_choices(containers: list[dict[str, Any]]) -> list[dict[s
                 "name": "Show task history and failures",
                 "value": "task_action:show_history",
             },
+            {
+                "name": "Refresh task status",
+                "value": "task_action:refresh",
+            },
         ]
     )
 
@@ -277,6 +313,18 @@ def _build_task_feature_choices(containers: list[dict[str, Any]]) -> list[dict[s
                     "name": f"Show logs for '{container_name}'",
                     "value": f"container_action:show_logs:{container_name}",
                 },
+                {
+                    "name": f"Follow logs for '{container_name}' (live)",
+                    "value": f"container_action:follow_logs:{container_name}",
+                },
+                {
+                    "name": f"Browse log history for '{container_name}'",
+                    "value": f"container_action:browse_logs:{container_name}",
+                },
+                {
+                    "name": f"Filter logs for '{container_name}'",
+                    "value": f"container_action:filter_logs:{container_name}",
+                },
                 {
                     "name": f"Show environment variables for '{container_name}'",
                     "value": f"container_action:show_env:{container_name}",
@@ -2,32 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Any
+import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 
 from .aws_service import ECSService
 from .core.base import BaseUIComponent
-from .core.navigation import add_navigation_choices
+from .core.context import TaskSession
+from .core.navigation import add_navigation_choices, parse_selection
+from .core.prefetch import Prefetcher
 from .core.types import TaskDetails
-from .features.cluster.cluster import ClusterService
+from .core.utils import print_warning
 from .features.cluster.ui import ClusterUI
+from .features.container.export import ExportSource
+from .features.container.render import PAGER_LOG_LINES
 from .features.container.ui import ContainerUI
+from .features.service.service import ServiceSnapshot
 from .features.service.ui import ServiceUI
 from .features.task.ui import TaskUI
 
+if TYPE_CHECKING:
+    from .core.batching import ChunkFailure
+
 console = Console()
 
+# How many clusters from the top of the list get their services loaded while the menu is open
+PREFETCH_TOP_CLUSTERS = 3
+PREFETCH_API_BUDGET = {"describe_services": 2, "list_tasks": 2, "describe_task_definition": 4}
+
 
 class ECSNavigator(BaseUIComponent):
     """Navigator for interactive ECS exploration."""
 
-    def __init__(self, ecs_service: ECSService) -> None:
+    def __init__(
+        self,
+        ecs_service: ECSService,
+        prefetcher: Prefetcher | None = None,
+        on_first_menu: Callable[[], None] | None = None,
+    ) -> None:
         super().__init__()
         self.ecs_service = ecs_service
-        # Initialize feature UI components
-        cluster_service = ClusterService(ecs_service.ecs_client)
-        self._cluster_ui = ClusterUI(cluster_service)
+        self._prefetcher = prefetcher or Prefetcher(api_budget=PREFETCH_API_BUDGET)
+        # Called once, right before the first menu is shown, e.g. to report startup time
+        self._on_first_menu = on_first_menu
+        # Initialize feature UI components, sharing the service instances (and their caches) from ECSService
+        self._cluster_ui = ClusterUI(ecs_service._cluster)
 
         # Initialize service UI components using existing service instances from ECSService
         self._service_ui = ServiceUI(ecs_service._service, ecs_service._service_actions)
@@ -40,20 +61,39 @@ class ECSNavigator(BaseUIComponent):
 
     def select_cluster(self) -> str:
         """Interactive cluster selection."""
-        return self._cluster_ui.select_cluster()
+        return self._cluster_ui.select_cluster(on_choices=self._cluster_choices_ready)
+
+    def _cluster_choices_ready(self, cluster_names: list[str]) -> None:
+        if self._on_first_menu is not None:
+            on_first_menu, self._on_first_menu = self._on_first_menu, None
+            on_first_menu()
+        self.prefetch_clusters(cluster_names)
 
     def select_service(self, cluster_name: str) -> str | None:
         """Interactive service selection with status information and navigation."""
-        return self._service_ui.select_service(cluster_name)
-
-    def select_service_action(self, cluster_name: str, service_name: str) -> str | None:
+        self._prefetcher.cancel_outside(cluster_name)
+        self._prefetcher.settle(_services_key(cluster_name))
+        selection = self._service_ui.select_service(cluster_name)
+
+        selection_type, service_name, _ = parse_selection(selection)
+        if selection_type == "service":
+            self.prefetch_service(cluster_name, service_name)
+        return selection
+
+    def select_service_action(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> str | None:
         """Interactive selection combining tasks and service-level actions."""
-        task_info = self.ecs_service.get_task_info(cluster_name, service_name)
-        return self._service_ui.select_service_action(service_name, task_info)
+        self._prefetcher.settle(_tasks_key(cluster_name, service_name))
+        inventory = self.ecs_service.get_task_inventory(cluster_name, service_name, snapshot)
+        _report_task_failures(inventory.failures)
+        return self._service_ui.select_service_action(service_name, inventory.results)
 
     def select_task(self, cluster_name: str, service_name: str) -> str:
         """Interactive task selection - no auto-selection since users need to see service actions too."""
-        task_info = self.ecs_service.get_task_info(cluster_name, service_name)
+        inventory = self.ecs_service.get_task_inventory(cluster_name, service_name)
+        _report_task_failures(inventory.failures)
+        task_info = inventory.results
 
         if not task_info:
             console.print(f"❌ No tasks found for service '{service_name}'", style="red")
@@ -73,38 +113,200 @@ class ECSNavigator(BaseUIComponent):
         """Present feature menu for the selected task."""
         return self._task_ui.select_task_feature(task_details)
 
-    def show_container_logs(self, cluster_name: str, task_arn: str, container_name: str, lines: int = 50) -> None:
+    def show_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+    ) -> None:
         """Display the last N lines of logs for a container."""
-        return self._container_ui.show_container_logs(cluster_name, task_arn, container_name, lines)
-
-    def show_container_environment_variables(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+        return self._container_ui.show_container_logs(cluster_name, task_arn, container_name, lines, session)
+
+    def page_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = PAGER_LOG_LINES,
+        session: TaskSession | None = None,
+    ) -> None:
+        """Open a long tail of a container's logs in the system pager."""
+        return self._container_ui.show_container_logs(
+            cluster_name, task_arn, container_name, lines, session, pager=True
+        )
+
+    def follow_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+    ) -> None:
+        """Follow a container's logs live until ESC is pressed."""
+        return self._container_ui.follow_container_logs(cluster_name, task_arn, container_name, lines, session)
+
+    def browse_container_logs(
+        self,
+        cluster_name: str,
+        task_arn: str,
+        container_name: str,
+        lines: int = 50,
+        session: TaskSession | None = None,
+    ) -> None:
+        """Page backward through a container's log history."""
+        return self._container_ui.browse_container_logs(cluster_name, task_arn, container_name, lines, session)
+
+    def filter_container_logs(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Search a container's logs with a CloudWatch filter pattern."""
+        return self._container_ui.filter_container_logs(cluster_name, task_arn, container_name, session)
+
+    def filter_service_logs(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> None:
+        """Search the logs of every task of a service with a CloudWatch filter pattern."""
+        sources = self.ecs_service.get_service_log_sources(cluster_name, service_name, snapshot)
+        return self._container_ui.filter_logs(f"service '{service_name}'", sources)
+
+    def export_container_logs(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Export a container's logs to a compressed NDJSON file."""
+        return self._container_ui.export_container_logs(cluster_name, task_arn, container_name, session)
+
+    def export_service_logs(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> None:
+        """Export the logs of every task of a service, including stopped ones, to a compressed NDJSON file."""
+        sources = [
+            ExportSource(source["container_name"], source["log_group"], stream_prefix=source["stream_prefix"])
+            for source in self.ecs_service.get_service_log_sources(cluster_name, service_name, snapshot)
+        ]
+        return self._container_ui.export_logs(f"service '{service_name}'", sources, f"{service_name}-logs.ndjson.gz")
+
+    def run_container_insights(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
+        """Run a Logs Insights query over a container's logs."""
+        return self._container_ui.run_container_insights(cluster_name, task_arn, container_name, session)
+
+    def run_service_insights(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> None:
+        """Run a Logs Insights query over the logs of every task of a service."""
+        sources = self.ecs_service.get_service_log_sources(cluster_name, service_name, snapshot)
+        log_groups = list(dict.fromkeys(source["log_group"] for source in sources))
+        # Services often share a log group, so keep the query to this service's stream prefixes
+        stream_filter = " or ".join(f"@logStream like {json.dumps(source['stream_prefix'])}" for source in sources)
+        return self._container_ui.run_insights(
+            f"service '{service_name}'", log_groups, f"filter {stream_filter}" if sources else None
+        )
+
+    def show_service_logs(self, cluster_name: str, service_name: str, lines: int = 100) -> None:
+        """Display the latest log lines of every task of a service, merged by time."""
+        streams = self.ecs_service.get_service_log_streams(cluster_name, service_name)
+        return self._container_ui.show_merged_logs(f"service '{service_name}'", streams, lines)
+
+    def show_task_logs(self, session: TaskSession, lines: int = 50) -> None:
+        """Display the latest log lines of every container in a task, merged by time."""
+        return self._container_ui.show_task_logs(session, lines)
+
+    def follow_task_logs(self, session: TaskSession, lines: int = 50) -> None:
+        """Follow every container of a task live in one merged view."""
+        return self._container_ui.follow_task_logs(session, lines)
+
+    def show_container_environment_variables(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display environment variables for a container."""
-        return self._container_ui.show_container_environment_variables(cluster_name, task_arn, container_name)
+        return self._container_ui.show_container_environment_variables(cluster_name, task_arn, container_name, session)
 
-    def show_container_secrets(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_secrets(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display secrets configuration for a container."""
-        return self._container_ui.show_container_secrets(cluster_name, task_arn, container_name)
+        return self._container_ui.show_container_secrets(cluster_name, task_arn, container_name, session)
 
-    def show_container_port_mappings(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_port_mappings(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display port mappings for a container."""
-        return self._container_ui.show_container_port_mappings(cluster_name, task_arn, container_name)
+        return self._container_ui.show_container_port_mappings(cluster_name, task_arn, container_name, session)
 
-    def show_container_volume_mounts(self, cluster_name: str, task_arn: str, container_name: str) -> None:
+    def show_container_volume_mounts(
+        self, cluster_name: str, task_arn: str, container_name: str, session: TaskSession | None = None
+    ) -> None:
         """Display volume mounts for a container."""
-        return self._container_ui.show_container_volume_mounts(cluster_name, task_arn, container_name)
+        return self._container_ui.show_container_volume_mounts(cluster_name, task_arn, container_name, session)
 
-    def handle_force_deployment(self, cluster_name: str, service_name: str) -> None:
-        """Handle force new deployment action."""
+    def handle_force_deployment(self, cluster_name: str, service_name: str) -> bool:
+        """Handle force new deployment action. Returns True if a deployment was started."""
         return self._service_ui.handle_force_deployment(cluster_name, service_name)
 
-    def show_service_events(self, cluster_name: str, service_name: str) -> None:
+    def show_cluster_dashboard(self, cluster_name: str) -> None:
+        """Show a live, auto-refreshing table of every service in a cluster."""
+        return self._service_ui.show_dashboard(cluster_name)
+
+    def watch_service_rollout(self, cluster_name: str, service_name: str) -> int:
+        """Follow a service rollout until it is steady or failed, returning its exit status."""
+        return self._service_ui.watch_rollout(cluster_name, service_name)
+
+    def handle_bulk_force_deployment(self, cluster_name: str) -> None:
+        """Force new deployments for several services of a cluster."""
+        return self._service_ui.handle_bulk_force_deployment(cluster_name)
+
+    def show_service_events(
+        self, cluster_name: str, service_name: str, snapshot: ServiceSnapshot | None = None
+    ) -> None:
         """Display service events."""
-        return self._service_ui.display_service_events(cluster_name, service_name)
+        return self._service_ui.display_service_events(cluster_name, service_name, snapshot)
 
     def show_task_history(self, cluster_name: str, service_name: str) -> None:
         """Display task history with failure analysis."""
         self._task_ui.display_task_history(cluster_name, service_name)
 
+    def prefetch_clusters(self, cluster_names: list[str]) -> None:
+        """Warm the service lists of the clusters at the top of the cluster menu."""
+        for cluster_name in cluster_names[:PREFETCH_TOP_CLUSTERS]:
+            self._prefetcher.schedule(
+                _services_key(cluster_name),
+                "describe_services",
+                lambda cluster_name=cluster_name: self.ecs_service.prefetch_service_inventory(cluster_name),
+                scope=cluster_name,
+            )
+
+    def prefetch_service(self, cluster_name: str, service_name: str) -> None:
+        """Warm a selected service's task list, then the task definitions its tasks run."""
+        scope = f"{cluster_name}/{service_name}"
+        self._prefetcher.cancel_outside(scope)
+
+        def prefetch_tasks() -> None:
+            for task_definition_arn in self.ecs_service.prefetch_service_tasks(cluster_name, service_name):
+                self._prefetcher.schedule(
+                    f"task-definition:{task_definition_arn}",
+                    "describe_task_definition",
+                    lambda arn=task_definition_arn: self.ecs_service.prefetch_task_definition(arn),
+                    scope=scope,
+                )
+
+        self._prefetcher.schedule(_tasks_key(cluster_name, service_name), "list_tasks", prefetch_tasks, scope=scope)
+
+    def close(self) -> None:
+        """Stop background prefetching."""
+        self._prefetcher.shutdown()
+
+
+def _services_key(cluster_name: str) -> str:
+    return f"services:{cluster_name}"
+
+
+def _tasks_key(cluster_name: str, service_name: str) -> str:
+    return f"tasks:{cluster_name}/{service_name}"
+
 
 def _build_task_feature_choices(containers: list[dict[str, Any]]) -> list[dict[str, str]]:
     """Build feature menu choices for containers plus navigation options."""
@@ -131,3 +333,8 @@ def _build_task_feature_choices(containers: list[dict[str, Any]]) -> list[dict[s
 
     # Add navigation options
     return add_navigation_choices(choices, "Back to service selection")
+
+
+def _report_task_failures(failures: list[ChunkFailure]) -> None:
+    for failure in failures:
+        print_warning(f"Could not load {len(failure.items)} tasks: {failure.reason}")
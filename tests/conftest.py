@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from lazy_ecs.core.cache import task_definition_store
+
+
+@pytest.fixture(autouse=True)
+def clear_task_definition_store():
+    """Moto reuses task definition ARNs across tests, so the process-wide store must start empty."""
+    task_definition_store.clear()
+    yield
+    task_definition_store.clear()
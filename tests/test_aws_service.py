@@ -715,3 +715,105 @@ def test_get_service_events_no_events(ecs_client_with_service_events):
 
     # Moto doesn't create events by default, so we expect an empty list
     assert isinstance(events, list)
+
+
+def test_get_service_info_more_than_one_describe_chunk() -> None:
+    with mock_aws():
+        client = boto3.client("ecs", region_name="us-east-1")
+        client.create_cluster(clusterName="production")
+        client.register_task_definition(
+            family="web-task",
+            containerDefinitions=[{"name": "web", "image": "nginx", "memory": 256}],
+        )
+        service_names = [f"service-{i:02d}" for i in range(25)]
+        for name in service_names:
+            client.create_service(cluster="production", serviceName=name, taskDefinition="web-task")
+
+        service = ECSService(client)
+        service_info = service.get_service_info("production")
+
+        assert [info["name"].split(" ")[1] for info in service_info] == service_names
+
+
+def test_container_views_reuse_cached_task_definition(ecs_client_with_volume_mounts) -> None:
+    calls = []
+    ecs_client_with_volume_mounts.meta.events.register(
+        "before-call.ecs", lambda model, **_: calls.append(model.name), unique_id="count-calls"
+    )
+    service = ECSService(ecs_client_with_volume_mounts)
+    tasks = service.get_tasks("production", "app-service")
+    calls.clear()
+
+    service.get_container_environment_variables("production", tasks[0], "app")
+    service.get_container_secrets("production", tasks[0], "app")
+    service.get_container_port_mappings("production", tasks[0], "app")
+    service.get_container_volume_mounts("production", tasks[0], "sidecar")
+
+    assert calls == ["DescribeTasks", "DescribeTaskDefinition"]
+
+
+def test_service_screen_uses_single_describe_services(ecs_client_with_tasks) -> None:
+    calls = []
+    ecs_client_with_tasks.meta.events.register(
+        "before-call.ecs", lambda model, **_: calls.append(model.name), unique_id="count-calls"
+    )
+    service = ECSService(ecs_client_with_tasks)
+    service.get_service_info("production")
+    snapshot = service.get_service_snapshot("production", "web-api")
+    tasks = service.get_tasks("production", "web-api")
+
+    service.get_task_info("production", "web-api", snapshot)
+    service.get_task_details("production", "web-api", tasks[0], snapshot)
+
+    assert calls.count("DescribeServices") == 1
+
+
+def test_task_session_serves_container_views_without_api_calls(ecs_client_with_volume_mounts) -> None:
+    calls = []
+    ecs_client_with_volume_mounts.meta.events.register(
+        "before-call.ecs", lambda model, **_: calls.append(model.name), unique_id="count-calls"
+    )
+    service = ECSService(ecs_client_with_volume_mounts)
+    tasks = service.get_tasks("production", "app-service")
+    snapshot = service.get_service_snapshot("production", "app-service")
+
+    session = service.get_task_session("production", "app-service", tasks[0], snapshot)
+    calls.clear()
+
+    assert session is not None
+    assert session.task_arn == tasks[0]
+    assert session.details["is_desired_version"] is True
+    assert [container["name"] for container in session.details["containers"]] == ["app", "sidecar", "no-mounts"]
+
+    context = session.container_context("sidecar")
+    assert context is not None
+    assert context.service_name == "app-service"
+    assert service._container.get_volume_mounts(context)
+    assert session.container_context("missing") is None
+    assert calls == []
+
+
+def test_get_service_log_sources(ecs_client_with_tasks) -> None:
+    service = ECSService(ecs_client_with_tasks)
+
+    sources = service.get_service_log_sources("production", "web-api")
+
+    assert sources == [{"container_name": "web", "log_group": "/ecs/production/web", "stream_prefix": "ecs/web/"}]
+
+
+def test_get_service_log_streams_resolves_every_task(ecs_client_with_tasks) -> None:
+    service = ECSService(ecs_client_with_tasks)
+    task_arns = service.get_tasks("production", "web-api")
+    calls: list[str] = []
+    ecs_client_with_tasks.meta.events.register(
+        "before-call.ecs", lambda model, **_: calls.append(model.name), unique_id="count-calls"
+    )
+
+    streams = service.get_service_log_streams("production", "web-api")
+
+    task_ids = [arn.split("/")[-1] for arn in task_arns]
+    assert sorted(stream.log_stream for stream in streams) == sorted(f"ecs/web/{task_id}" for task_id in task_ids)
+    assert {stream.tag for stream in streams} == {task_id[:8] for task_id in task_ids}
+    assert {stream.log_group for stream in streams} == {"/ecs/production/web"}
+    # One list, one batched describe and one task definition, however many tasks there are
+    assert sorted(calls) == ["DescribeTaskDefinition", "DescribeTasks", "ListTasks"]
@@ -1,14 +1,15 @@
 import sys
 from unittest.mock import Mock, patch
 
-from lazy_ecs import _create_aws_client, main
+from lazy_ecs import main
+from lazy_ecs.cli import _create_disk_cache, _handle_task_features, _navigate_services
 
 
-@patch("lazy_ecs._create_logs_client")
-@patch("lazy_ecs._create_aws_client")
-@patch("lazy_ecs.ECSNavigator")
-@patch("lazy_ecs.console")
-def test_main_successful_flow(mock_console, mock_navigator_class, mock_create_client, mock_create_logs_client) -> None:
+@patch("lazy_ecs.cli._create_disk_cache", Mock(return_value=None))
+@patch("lazy_ecs.cli.AWSClientFactory")
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console")
+def test_main_successful_flow(mock_console, mock_navigator_class, mock_factory_class) -> None:
     """Test main function with successful cluster selection."""
     mock_navigator = Mock()
     mock_navigator.select_cluster.return_value = "production"
@@ -17,20 +18,18 @@ def test_main_successful_flow(mock_console, mock_navigator_class, mock_create_cl
     with patch.object(sys, "argv", ["lazy-ecs"]):
         main()
 
-    mock_create_client.assert_called_once_with(None)
-    mock_create_logs_client.assert_called_once_with(None)
+    mock_factory_class.assert_called_once_with(None)
+    mock_factory_class.return_value.ecs.assert_called_once()
     mock_navigator.select_cluster.assert_called_once()
     mock_console.print.assert_any_call("🚀 Welcome to lazy-ecs!", style="bold cyan")
     mock_console.print.assert_any_call("\n✅ Selected cluster: production", style="green")
 
 
-@patch("lazy_ecs._create_logs_client")
-@patch("lazy_ecs._create_aws_client")
-@patch("lazy_ecs.ECSNavigator")
-@patch("lazy_ecs.console")
-def test_main_no_cluster_selected(
-    mock_console, mock_navigator_class, _mock_create_client, _mock_create_logs_client
-) -> None:
+@patch("lazy_ecs.cli._create_disk_cache", Mock(return_value=None))
+@patch("lazy_ecs.cli.AWSClientFactory", Mock())
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console")
+def test_main_no_cluster_selected(mock_console, mock_navigator_class) -> None:
     """Test main function when no cluster is selected."""
     mock_navigator = Mock()
     mock_navigator.select_cluster.return_value = None
@@ -40,29 +39,27 @@ def test_main_no_cluster_selected(
         main()
 
     mock_console.print.assert_any_call("\n❌ No cluster selected. Goodbye!", style="yellow")
+    mock_navigator.close.assert_called_once()
 
 
-@patch("lazy_ecs._create_logs_client")
-@patch("lazy_ecs._create_aws_client")
-@patch("lazy_ecs.console")
-def test_main_aws_error(mock_console, mock_create_client, _mock_create_logs_client) -> None:
+@patch("lazy_ecs.cli.AWSClientFactory")
+@patch("lazy_ecs.cli.console")
+def test_main_aws_error(mock_console, mock_factory_class) -> None:
     """Test main function with AWS connection error."""
-    mock_create_client.side_effect = Exception("No credentials found")
+    mock_factory_class.return_value.ecs.side_effect = Exception("No credentials found")
 
-    with patch.object(sys, "argv", ["lazy-ecs"]):
+    with patch.object(sys, "argv", ["lazy-ecs", "--no-cache"]):
         main()
 
     mock_console.print.assert_any_call("\n❌ Error: No credentials found", style="red")
     mock_console.print.assert_any_call("Make sure your AWS credentials are configured.", style="dim")
 
 
-@patch("lazy_ecs._create_logs_client")
-@patch("lazy_ecs._create_aws_client")
-@patch("lazy_ecs.ECSNavigator")
-@patch("lazy_ecs.console")
-def test_main_with_profile_argument(
-    _mock_console, mock_navigator_class, mock_create_client, mock_create_logs_client
-) -> None:
+@patch("lazy_ecs.cli._create_disk_cache", Mock(return_value=None))
+@patch("lazy_ecs.cli.AWSClientFactory")
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console")
+def test_main_with_profile_argument(_mock_console, mock_navigator_class, mock_factory_class) -> None:
     """Test main function with --profile argument."""
     mock_navigator = Mock()
     mock_navigator.select_cluster.return_value = "production"
@@ -71,34 +68,135 @@ def test_main_with_profile_argument(
     with patch.object(sys, "argv", ["lazy-ecs", "--profile", "my-profile"]):
         main()
 
-    mock_create_client.assert_called_once_with("my-profile")
-    mock_create_logs_client.assert_called_once_with("my-profile")
-
-
-def test_create_aws_client_without_profile():
-    """Test _create_aws_client without profile returns default client."""
-    with patch("lazy_ecs.boto3.client") as mock_client:
-        _create_aws_client(None)
-        # Should be called with ECS and config for connection pooling
-        assert mock_client.call_count == 1
-        args, kwargs = mock_client.call_args
-        assert args[0] == "ecs"
-        assert "config" in kwargs
-
-
-def test_create_aws_client_with_profile():
-    """Test _create_aws_client with profile uses Session."""
-    mock_session = Mock()
-    mock_client = Mock()
-    mock_session.client.return_value = mock_client
-
-    with patch("lazy_ecs.boto3.Session", return_value=mock_session) as mock_session_class:
-        result = _create_aws_client("my-profile")
-
-        mock_session_class.assert_called_once_with(profile_name="my-profile")
-        # Should be called with ECS and config for connection pooling
-        assert mock_session.client.call_count == 1
-        args, kwargs = mock_session.client.call_args
-        assert args[0] == "ecs"
-        assert "config" in kwargs
-        assert result == mock_client
+    mock_factory_class.assert_called_once_with("my-profile")
+
+
+@patch("lazy_ecs.cli._create_disk_cache", Mock(return_value=None))
+@patch("lazy_ecs.cli.AWSClientFactory")
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console", Mock())
+def test_main_does_not_create_logs_client_up_front(mock_navigator_class, mock_factory_class) -> None:
+    """Test that the logs client is left to be created on first use."""
+    mock_navigator_class.return_value.select_cluster.return_value = None
+
+    with patch.object(sys, "argv", ["lazy-ecs"]):
+        main()
+
+    mock_factory_class.return_value.logs.assert_not_called()
+
+
+@patch("lazy_ecs.cli._create_disk_cache", Mock(return_value=None))
+@patch("lazy_ecs.cli.AWSClientFactory", Mock())
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console")
+def test_main_timings_reports_time_to_first_menu(mock_console, mock_navigator_class) -> None:
+    """Test that --timings reports startup time once the first menu is ready."""
+    mock_navigator_class.return_value.select_cluster.return_value = None
+
+    with patch.object(sys, "argv", ["lazy-ecs", "--timings"]):
+        main()
+
+    on_first_menu = mock_navigator_class.call_args.kwargs["on_first_menu"]
+    on_first_menu()
+    message = mock_console.print.call_args.args[0]
+    assert message.startswith("⏱️ First menu ready in ")
+
+
+@patch("lazy_ecs.cli._create_disk_cache")
+@patch("lazy_ecs.cli.AWSClientFactory", Mock())
+@patch("lazy_ecs.cli.ECSNavigator")
+@patch("lazy_ecs.cli.console", Mock())
+def test_main_no_cache_skips_disk_cache(mock_navigator_class, mock_create_disk_cache) -> None:
+    """Test that --no-cache runs without the on-disk metadata cache."""
+    mock_navigator_class.return_value.select_cluster.return_value = None
+
+    with patch.object(sys, "argv", ["lazy-ecs", "--no-cache"]):
+        main()
+
+    mock_create_disk_cache.assert_not_called()
+
+
+def _clients(profile_name: str | None, region_name: str | None) -> Mock:
+    clients = Mock(profile_name=profile_name, region_name=region_name)
+    clients.session.profile_name = profile_name
+    return clients
+
+
+def test_create_disk_cache_partitions_by_account(monkeypatch, tmp_path):
+    """Test _create_disk_cache resolves the account through the shared client factory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    clients = _clients("my-profile", "eu-west-1")
+    clients.account_id.return_value = "123456789012"
+
+    cache = _create_disk_cache(clients)
+
+    assert cache is not None
+    assert cache.directory.parts[-3:] == ("my-profile", "eu-west-1", "123456789012")
+
+
+def test_create_disk_cache_calls_sts_once_per_identity(monkeypatch, tmp_path):
+    """Test the account ID is remembered between launches and kept apart per credentials."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    clients = _clients("my-profile", "eu-west-1")
+    clients.account_id.return_value = "123456789012"
+
+    _create_disk_cache(clients)
+    cache = _create_disk_cache(_clients("my-profile", "eu-west-1"))
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIAOTHERACCOUNT")
+    other = _clients("my-profile", "eu-west-1")
+    other.account_id.return_value = "210987654321"
+    other_cache = _create_disk_cache(other)
+
+    clients.account_id.assert_called_once()
+    assert cache is not None and cache.directory.name == "123456789012"
+    assert other_cache is not None and other_cache.directory.name == "210987654321"
+
+
+def test_create_disk_cache_unavailable_without_credentials(monkeypatch, tmp_path):
+    """Test _create_disk_cache falls back to no cache when the account cannot be resolved."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    clients = _clients(None, None)
+    clients.account_id.side_effect = Exception("No credentials found")
+
+    assert _create_disk_cache(clients) is None
+
+
+def test_handle_task_features_reuses_session_until_refresh():
+    session = Mock(cluster_name="production", service_name="web-api", task_arn="task-arn")
+    refreshed = Mock(cluster_name="production", service_name="web-api", task_arn="task-arn")
+    navigator = Mock()
+    navigator.select_task_feature.side_effect = [
+        "container_action:show_env:web",
+        "container_action:show_logs:web",
+        "task_action:refresh",
+        "container_action:show_secrets:web",
+        "navigation:back",
+    ]
+    ecs_service = Mock()
+    ecs_service.get_task_session.return_value = refreshed
+
+    assert _handle_task_features(navigator, ecs_service, session) is True
+
+    navigator.show_container_environment_variables.assert_called_once_with(
+        "production", "task-arn", "web", session=session
+    )
+    navigator.show_container_logs.assert_called_once_with("production", "task-arn", "web", session=session)
+    ecs_service.get_task_session.assert_called_once_with("production", "web-api", "task-arn", None)
+    navigator.show_container_secrets.assert_called_once_with("production", "task-arn", "web", session=refreshed)
+
+
+@patch("lazy_ecs.cli.console", Mock())
+def test_show_events_describes_the_service_again():
+    """Test that service events come from a fresh description, not the one the menu opened with."""
+    navigator = Mock()
+    navigator.select_service.return_value = "service:web-api"
+    navigator.select_service_action.side_effect = ["action:show_events", "navigation:exit"]
+    ecs_service = Mock()
+
+    assert _navigate_services(navigator, ecs_service, "production") is False
+
+    ecs_service.refresh_service_snapshot.assert_called_once_with("production", "web-api")
+    navigator.show_service_events.assert_called_once_with(
+        "production", "web-api", ecs_service.refresh_service_snapshot.return_value
+    )
@@ -0,0 +1,82 @@
+"""Tests for ClusterUI class."""
+
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lazy_ecs.core.navigation import REFRESH_VALUE
+from lazy_ecs.features.cluster.ui import ClusterUI
+
+
+@pytest.fixture
+def cluster_service():
+    return Mock()
+
+
+def _resolved(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+@patch("lazy_ecs.features.cluster.ui.select_with_navigation")
+def test_select_cluster_without_snapshot_fetches(mock_select, cluster_service):
+    """Test that without a cached snapshot the cluster list is loaded before prompting."""
+    cluster_service.get_cached_cluster_names.return_value = None
+    cluster_service.get_cluster_names.return_value = ["production"]
+    mock_select.return_value = "production"
+
+    selected = ClusterUI(cluster_service).select_cluster()
+
+    assert selected == "production"
+    mock_select.assert_called_once_with(
+        "Select an ECS cluster:", [{"name": "production", "value": "production"}], None, None
+    )
+
+
+@patch("lazy_ecs.features.cluster.ui.select_with_navigation")
+def test_select_cluster_shows_snapshot_then_refreshes_on_request(mock_select, cluster_service):
+    """Test that a cached snapshot is shown immediately and 'r' switches to the fresh list."""
+    cluster_service.get_cached_cluster_names.return_value = ["production"]
+    mock_select.side_effect = [REFRESH_VALUE, "staging"]
+    cluster_ui = ClusterUI(cluster_service)
+    cluster_ui.run_in_background = Mock(
+        side_effect=[
+            _resolved([{"name": "production", "value": "production"}, {"name": "staging", "value": "staging"}]),
+            _resolved([]),
+        ]
+    )
+
+    selected = cluster_ui.select_cluster()
+
+    assert selected == "staging"
+    cluster_service.get_cluster_names.assert_not_called()
+    first_choices = mock_select.call_args_list[0][0][1]
+    second_choices = mock_select.call_args_list[1][0][1]
+    assert [choice["value"] for choice in first_choices] == ["production"]
+    assert [choice["value"] for choice in second_choices] == ["production", "staging"]
+
+
+@patch("lazy_ecs.features.cluster.ui.select_with_navigation")
+def test_select_cluster_refresh_failure_keeps_snapshot(mock_select, cluster_service):
+    """Test that a failed background refresh keeps showing the snapshot."""
+    cluster_service.get_cached_cluster_names.return_value = ["production"]
+    failed: Future = Future()
+    failed.set_exception(RuntimeError("ExpiredToken"))
+    mock_select.side_effect = [REFRESH_VALUE, "production"]
+    cluster_ui = ClusterUI(cluster_service)
+    cluster_ui.run_in_background = Mock(side_effect=[failed, _resolved([])])
+
+    selected = cluster_ui.select_cluster()
+
+    assert selected == "production"
+    assert mock_select.call_args_list[1][0][1] == [{"name": "production", "value": "production"}]
+
+
+def test_select_cluster_no_clusters(cluster_service):
+    """Test cluster selection with no clusters available."""
+    cluster_service.get_cached_cluster_names.return_value = None
+    cluster_service.get_cluster_names.return_value = []
+
+    assert ClusterUI(cluster_service).select_cluster() == ""
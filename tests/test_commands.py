@@ -0,0 +1,124 @@
+"""Tests for the non-interactive NDJSON commands."""
+
+import io
+import json
+import sys
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lazy_ecs import main
+from lazy_ecs.commands import iter_clusters, iter_events, iter_services, iter_tasks, write_records
+
+TASK_DEF = "arn:aws:ecs:us-east-1:123:task-definition/web:7"
+
+
+def _service(name, running=1) -> dict:
+    return {
+        "serviceName": name,
+        "runningCount": running,
+        "desiredCount": 2,
+        "pendingCount": 0,
+        "taskDefinition": TASK_DEF,
+        "deployments": [{"status": "PRIMARY", "taskDefinition": TASK_DEF}],
+        "events": [
+            {
+                "id": "e2",
+                "createdAt": datetime(2024, 1, 1, 12, 5),
+                "message": "(service web) has reached a steady state.",
+            },
+            {"id": "e1", "createdAt": datetime(2024, 1, 1, 12, 0), "message": "(service web) failed to launch a task"},
+        ],
+    }
+
+
+def test_clusters_follow_every_page():
+    client = Mock()
+    client.list_clusters.side_effect = [
+        {"clusterArns": ["arn:aws:ecs:us-east-1:123:cluster/prod"], "nextToken": "page-2"},
+        {"clusterArns": ["arn:aws:ecs:us-east-1:123:cluster/staging"]},
+    ]
+
+    assert list(iter_clusters(client)) == [{"cluster": "prod"}, {"cluster": "staging"}]
+
+
+def test_services_are_described_in_chunks_as_listing_pages_arrive():
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = iter(
+        [
+            {"serviceArns": [f"arn:aws:ecs:us-east-1:123:service/prod/svc-{i}" for i in range(10)]},
+            {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/svc-10"]},
+        ]
+    )
+    client.describe_services.side_effect = lambda **kwargs: {
+        "services": [_service(name, running=2) for name in kwargs["services"]]
+    }
+
+    records = list(iter_services(client, "prod"))
+
+    assert sorted(record["service"] for record in records) == sorted(f"svc-{i}" for i in range(11))
+    assert sorted(len(call.kwargs["services"]) for call in client.describe_services.call_args_list) == [1, 10]
+    assert records[0] == {
+        "cluster": "prod",
+        "service": records[0]["service"],
+        "status": "HEALTHY",
+        "running_count": 2,
+        "desired_count": 2,
+        "pending_count": 0,
+        "task_definition": TASK_DEF,
+    }
+
+
+def test_tasks_mark_the_desired_revision():
+    client = Mock()
+    client.describe_services.return_value = {"services": [_service("web")]}
+    client.list_tasks.return_value = {
+        "taskArns": ["arn:aws:ecs:us-east-1:123:task/prod/a", "arn:aws:ecs:us-east-1:123:task/prod/b"]
+    }
+    client.describe_tasks.return_value = {
+        "tasks": [
+            {
+                "taskArn": "arn:aws:ecs:us-east-1:123:task/prod/a",
+                "taskDefinitionArn": TASK_DEF,
+                "lastStatus": "RUNNING",
+            },
+            {
+                "taskArn": "arn:aws:ecs:us-east-1:123:task/prod/b",
+                "taskDefinitionArn": "arn:aws:ecs:us-east-1:123:task-definition/web:6",
+                "lastStatus": "STOPPING",
+            },
+        ]
+    }
+
+    records = list(iter_tasks(client, "prod", "web"))
+
+    assert [(record["task_arn"][-1], record["is_desired"], record["last_status"]) for record in records] == [
+        ("a", True, "RUNNING"),
+        ("b", False, "STOPPING"),
+    ]
+
+
+def test_events_are_serialized_with_iso_timestamps():
+    client = Mock()
+    client.describe_services.return_value = {"services": [_service("web")]}
+    out = io.StringIO()
+
+    write_records(iter_events(client, "prod", "web"), out)
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(line["id"], line["event_type"]) for line in lines] == [("e2", "scaling"), ("e1", "failure")]
+    assert lines[0]["created_at"] == "2024-01-01T12:05:00"
+
+
+@patch("lazy_ecs.commands.AWSClientFactory")
+def test_missing_service_exits_with_an_error(mock_factory, capsys):
+    mock_factory.return_value.ecs.return_value.describe_services.return_value = {"services": []}
+
+    with patch.object(sys, "argv", ["lazy-ecs", "tasks", "prod", "gone"]), pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "service 'gone' not found in cluster 'prod'" in captured.err
@@ -0,0 +1,123 @@
+"""Tests for streaming log export to gzip NDJSON."""
+
+import gzip
+import json
+from threading import Event
+
+from lazy_ecs.features.container.export import (
+    ExportSource,
+    checkpoint_path,
+    export_logs,
+    read_checkpoint_window,
+)
+
+
+class FakeExportClient:
+    """Serves get_log_events and filter_log_events pages keyed by nextToken."""
+
+    def __init__(self, stream_pages: dict[str | None, dict], filter_pages: dict[str | None, dict]) -> None:
+        self.stream_pages = stream_pages
+        self.filter_pages = filter_pages
+        self.calls: list[tuple[str, dict]] = []
+
+    def get_log_events(self, **kwargs: object) -> dict:
+        self.calls.append(("get_log_events", kwargs))
+        return self.stream_pages[kwargs.get("nextToken")]
+
+    def filter_log_events(self, **kwargs: object) -> dict:
+        self.calls.append(("filter_log_events", kwargs))
+        return self.filter_pages[kwargs.get("nextToken")]
+
+
+class InterruptingClient(FakeExportClient):
+    """Sets `stop` while serving the first page, as pressing ESC mid-export would."""
+
+    def __init__(self, stop: Event) -> None:
+        client = _client()
+        super().__init__(client.stream_pages, client.filter_pages)
+        self.stop = stop
+
+    def get_log_events(self, **kwargs: object) -> dict:
+        self.stop.set()
+        return super().get_log_events(**kwargs)
+
+
+def _client() -> FakeExportClient:
+    return FakeExportClient(
+        stream_pages={
+            None: {"events": [{"timestamp": 1, "message": "app 1\n"}], "nextForwardToken": "f/1"},
+            "f/1": {"events": [{"timestamp": 2, "message": "app 2\n"}], "nextForwardToken": "f/2"},
+            "f/2": {"events": [], "nextForwardToken": "f/2"},
+        },
+        filter_pages={
+            None: {"events": [{"timestamp": 1, "message": "w 1", "logStreamName": "ecs/web/a"}], "nextToken": "n/1"},
+            "n/1": {"events": [], "nextToken": "n/2"},
+            "n/2": {"events": [{"timestamp": 3, "message": "w 3", "logStreamName": "ecs/web/b"}]},
+        },
+    )
+
+
+SOURCES = [
+    ExportSource("app", "/ecs/app", log_stream="ecs/app/abc"),
+    ExportSource("web", "/ecs/web", stream_prefix="ecs/web/"),
+]
+
+
+def _read(path) -> list[dict]:
+    with gzip.open(path, "rt") as exported:
+        return [json.loads(line) for line in exported]
+
+
+def test_export_writes_every_source_as_ndjson(tmp_path):
+    path = tmp_path / "logs.ndjson.gz"
+    client = _client()
+
+    result = export_logs(client, SOURCES, path, 0, 10)
+
+    assert result.complete
+    assert result.events == 4
+    lines = _read(path)
+    assert sorted((line["source"], line["message"]) for line in lines) == [
+        ("app", "app 1"),
+        ("app", "app 2"),
+        ("web", "w 1"),
+        ("web", "w 3"),
+    ]
+    assert {line["log_stream"] for line in lines if line["source"] == "web"} == {"ecs/web/a", "ecs/web/b"}
+    filter_call = next(kwargs for name, kwargs in client.calls if name == "filter_log_events")
+    assert filter_call["logStreamNamePrefix"] == "ecs/web/"
+    assert (filter_call["startTime"], filter_call["endTime"]) == (0, 10)
+    assert not checkpoint_path(path).exists()
+
+
+def test_interrupted_export_resumes_without_duplicates(tmp_path):
+    path = tmp_path / "logs.ndjson.gz"
+    stop = Event()
+
+    first = export_logs(InterruptingClient(stop), SOURCES[:1], path, 0, 10, stop=stop)
+
+    assert not first.complete
+    assert read_checkpoint_window(path) == (0, 10)
+    # A member half written when the process died is dropped on resume
+    with path.open("ab") as output:
+        output.write(gzip.compress(b"partial\n")[:10])
+
+    client = _client()
+    second = export_logs(client, SOURCES[:1], path, 0, 10)
+
+    assert second.resumed
+    assert second.complete
+    assert [line["message"] for line in _read(path)] == ["app 1", "app 2"]
+    assert client.calls[0][1]["nextToken"] == "f/1"
+    assert read_checkpoint_window(path) is None
+
+
+def test_export_with_another_window_starts_over(tmp_path):
+    path = tmp_path / "logs.ndjson.gz"
+    stop = Event()
+    export_logs(InterruptingClient(stop), SOURCES[:1], path, 0, 10, stop=stop)
+
+    result = export_logs(_client(), SOURCES[:1], path, 0, 20)
+
+    assert not result.resumed
+    assert [line["message"] for line in _read(path)] == ["app 1", "app 2"]
@@ -0,0 +1,105 @@
+"""Tests for the Logs Insights query runner."""
+
+from threading import Event
+
+from lazy_ecs.core.polling import AdaptiveInterval
+from lazy_ecs.features.container.insights import InsightsResultCache, run_insights_query
+
+
+class StubInsightsClient:
+    """Answers get_query_results from a script of responses and records every call."""
+
+    def __init__(self, responses: list[dict]) -> None:
+        self.responses = responses
+        self.calls: list[tuple[str, dict]] = []
+
+    def start_query(self, **kwargs: object) -> dict:
+        self.calls.append(("start_query", kwargs))
+        return {"queryId": "q-1"}
+
+    def get_query_results(self, **kwargs: object) -> dict:
+        self.calls.append(("get_query_results", kwargs))
+        polls = sum(1 for name, _kwargs in self.calls if name == "get_query_results")
+        return self.responses[min(polls, len(self.responses)) - 1]
+
+    def stop_query(self, **kwargs: object) -> dict:
+        self.calls.append(("stop_query", kwargs))
+        return {"success": True}
+
+
+class RecordingStop(Event):
+    """Stop event that records the waits and never blocks."""
+
+    def __init__(self, stop_after: int | None = None) -> None:
+        super().__init__()
+        self.stop_after = stop_after
+        self.waits: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout or 0)
+        if self.stop_after is not None and len(self.waits) >= self.stop_after:
+            self.set()
+        return self.is_set()
+
+
+def _row(minute: str, errors: str) -> list[dict]:
+    return [
+        {"field": "bin(1m)", "value": minute},
+        {"field": "errors", "value": errors},
+        {"field": "@ptr", "value": "p"},
+    ]
+
+
+RUNNING_EMPTY = {"status": "Running", "results": []}
+RUNNING_ONE = {"status": "Running", "results": [_row("10:00", "3")]}
+COMPLETE = {
+    "status": "Complete",
+    "results": [_row("10:00", "3"), _row("10:01", "5")],
+    "statistics": {"recordsScanned": 120.0, "bytesScanned": 4096.0},
+}
+
+
+def test_query_yields_growing_results_and_backs_off_while_unchanged():
+    client = StubInsightsClient([RUNNING_EMPTY, RUNNING_EMPTY, RUNNING_ONE, RUNNING_ONE, COMPLETE])
+    stop = RecordingStop()
+
+    results = list(
+        run_insights_query(
+            client, ["/ecs/web"], "stats count(*)", 125, 3_725, stop=stop, interval=AdaptiveInterval(1, 4)
+        )
+    )
+
+    assert [(result.status, len(result.rows)) for result in results] == [
+        ("Running", 0),
+        ("Running", 1),
+        ("Complete", 2),
+    ]
+    assert results[-1].rows[1] == {"bin(1m)": "10:01", "errors": "5"}
+    assert results[-1].records_scanned == 120
+    assert stop.waits == [1, 2, 1, 2]
+    start = client.calls[0][1]
+    # Windows are aligned to the minute so a reopened query hits the cache
+    assert (start["startTime"], start["endTime"]) == (120, 3_720)
+
+
+def test_completed_query_is_served_from_cache():
+    cache = InsightsResultCache()
+    first_client = StubInsightsClient([COMPLETE])
+    list(run_insights_query(first_client, ["/ecs/web"], "stats count(*)", 120, 3_720, cache, RecordingStop()))
+
+    second_client = StubInsightsClient([COMPLETE])
+    results = list(run_insights_query(second_client, ["/ecs/web"], "stats count(*) ", 130, 3_750, cache))
+
+    assert len(results) == 1
+    assert results[0].cached
+    assert len(results[0].rows) == 2
+    assert second_client.calls == []
+
+
+def test_stopping_cancels_the_query():
+    client = StubInsightsClient([RUNNING_EMPTY])
+
+    results = list(run_insights_query(client, ["/ecs/web"], "fields @message", 0, 60, stop=RecordingStop(stop_after=2)))
+
+    assert len(results) == 1
+    assert client.calls[-1] == ("stop_query", {"queryId": "q-1"})
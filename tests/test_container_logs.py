@@ -0,0 +1,396 @@
+"""Tests for streaming CloudWatch Logs reads."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Event
+
+from lazy_ecs.core.polling import AdaptiveInterval
+from lazy_ecs.features.container.logs import (
+    LogPage,
+    LogPageCache,
+    LogPager,
+    TaggedStream,
+    follow_log_events,
+    follow_merged_log_events,
+    iter_filtered_log_events,
+    iter_merged_tail,
+)
+
+
+class FakeLogsClient:
+    """Serves canned get_log_events responses and records the requests."""
+
+    def __init__(self, responses: list[dict]) -> None:
+        self.responses = responses
+        self.calls: list[dict] = []
+
+    def get_log_events(self, **kwargs: object) -> dict:
+        self.calls.append(kwargs)
+        return self.responses[len(self.calls) - 1]
+
+
+class CountingStop(Event):
+    """Stop event that records each wait and trips after a fixed number of polls."""
+
+    def __init__(self, polls: int) -> None:
+        super().__init__()
+        self.polls = polls
+        self.waits: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout or 0)
+        if len(self.waits) > self.polls:
+            self.set()
+        return self.is_set()
+
+
+def _events(*messages: str) -> list[dict]:
+    return [{"timestamp": 1700000000000 + i, "message": message} for i, message in enumerate(messages)]
+
+
+def test_follow_yields_tail_then_only_new_events():
+    client = FakeLogsClient(
+        [
+            {"events": _events("old"), "nextForwardToken": "f/1"},
+            {"events": _events("new 1", "new 2"), "nextForwardToken": "f/2"},
+            {"events": [], "nextForwardToken": "f/2"},
+            {"events": _events("new 3"), "nextForwardToken": "f/3"},
+        ]
+    )
+
+    batches = list(follow_log_events(client, "/ecs/web", "ecs/web/abc", 20, CountingStop(3)))
+
+    assert [[event["message"] for event in batch] for batch in batches] == [["old"], ["new 1", "new 2"], ["new 3"]]
+    assert client.calls[0] == {
+        "logGroupName": "/ecs/web",
+        "logStreamName": "ecs/web/abc",
+        "limit": 20,
+        "startFromHead": False,
+    }
+    assert [call.get("nextToken") for call in client.calls[1:]] == ["f/1", "f/2", "f/2"]
+
+
+def test_follow_backs_off_while_idle_and_resets_on_events():
+    idle = {"events": [], "nextForwardToken": "f/1"}
+    client = FakeLogsClient([idle, idle, idle, idle, {"events": _events("wake"), "nextForwardToken": "f/2"}, idle])
+    stop = CountingStop(5)
+
+    list(follow_log_events(client, "g", "s", stop=stop, interval=AdaptiveInterval(1, 5)))
+
+    assert stop.waits == [1, 2, 4, 5, 1, 2]
+
+
+def test_follow_stops_before_polling_when_stopped():
+    client = FakeLogsClient([{"events": [], "nextForwardToken": "f/1"}])
+    stop = Event()
+    stop.set()
+
+    assert list(follow_log_events(client, "g", "s", stop=stop)) == []
+    assert len(client.calls) == 1
+
+
+class PagedLogsClient:
+    """Serves a stream of numbered events in pages, like get_log_events with backward tokens."""
+
+    def __init__(self, total: int) -> None:
+        self.messages = [f"line {i}" for i in range(total)]
+        self.calls: list[dict] = []
+
+    def get_log_events(self, **kwargs: object) -> dict:
+        self.calls.append(kwargs)
+        limit = int(kwargs["limit"])
+        token = kwargs.get("nextToken")
+        # Tokens encode the index the page ends at; the latest page ends at the end of the stream
+        end = int(str(token).split("/")[1]) if token else len(self.messages)
+        start = max(0, end - limit)
+        events = [{"timestamp": i, "message": self.messages[i]} for i in range(start, end)]
+        return {"events": events, "nextBackwardToken": f"b/{start}", "nextForwardToken": f"f/{end}"}
+
+
+def test_pager_walks_back_to_start_of_stream():
+    client = PagedLogsClient(25)
+    pager = LogPager(client, executor=ThreadPoolExecutor(max_workers=1))
+
+    latest = pager.get_page("g", "s", limit=10)
+    older = pager.get_page("g", "s", latest.older_token, limit=10)
+    oldest = pager.get_page("g", "s", older.older_token, limit=10)
+    beyond = pager.get_page("g", "s", oldest.older_token, limit=10)
+
+    assert latest.events[0]["message"] == "line 15"
+    assert older.events[0]["message"] == "line 5"
+    assert [e["message"] for e in oldest.events] == ["line 0", "line 1", "line 2", "line 3", "line 4"]
+    assert beyond.events == []
+    assert beyond.older_token is None
+
+
+def test_pager_reuses_cached_pages_and_prefetches_older():
+    client = PagedLogsClient(100)
+    pager = LogPager(client, executor=ThreadPoolExecutor(max_workers=1))
+
+    latest = pager.get_page("g", "s", limit=10, prefetch_older=True)
+    # The prefetch populates the cache in the background; wait for it before counting calls
+    for _ in range(100):
+        if len(pager.cache):
+            break
+        time.sleep(0.01)
+    calls_after_prefetch = len(client.calls)
+
+    older = pager.get_page("g", "s", latest.older_token, limit=10)
+    again = pager.get_page("g", "s", latest.older_token, limit=10)
+
+    assert calls_after_prefetch == 2
+    assert len(client.calls) == 2
+    assert older is again
+
+
+def test_page_cache_evicts_least_recently_used_by_size():
+    def page(message: str) -> LogPage:
+        return LogPage(events=[{"timestamp": 0, "message": message}], older_token=None, newer_token=None)
+
+    size = page("x" * 100).size_bytes
+    cache = LogPageCache(max_bytes=size * 2)
+    cache.put(("g", "s", "a", 10), page("a" * 100))
+    cache.put(("g", "s", "b", 10), page("b" * 100))
+    cache.get(("g", "s", "a", 10))
+    cache.put(("g", "s", "c", 10), page("c" * 100))
+
+    assert cache.get(("g", "s", "b", 10)) is None
+    assert cache.get(("g", "s", "a", 10)) is not None
+    assert cache.get(("g", "s", "c", 10)) is not None
+    assert cache.size_bytes == size * 2
+
+
+class FilterLogsClient:
+    """Serves canned filter_log_events pages keyed by nextToken."""
+
+    def __init__(self, pages: dict[str | None, dict]) -> None:
+        self.pages = pages
+        self.calls: list[dict] = []
+
+    def filter_log_events(self, **kwargs: object) -> dict:
+        self.calls.append(kwargs)
+        return self.pages[kwargs.get("nextToken")]
+
+
+def test_filter_pushes_pattern_and_window_to_cloudwatch():
+    client = FilterLogsClient({None: {"events": _events("ERROR boom")}})
+
+    pages = list(iter_filtered_log_events(client, "/ecs/web", "ERROR", 1000, 2000, "ecs/web/"))
+
+    assert [[event["message"] for event in page] for page in pages] == [["ERROR boom"]]
+    assert client.calls == [
+        {
+            "logGroupName": "/ecs/web",
+            "startTime": 1000,
+            "endTime": 2000,
+            "filterPattern": "ERROR",
+            "logStreamNamePrefix": "ecs/web/",
+        }
+    ]
+
+
+def test_filter_streams_pages_and_skips_empty_ones():
+    client = FilterLogsClient(
+        {
+            None: {"events": _events("a"), "nextToken": "t1"},
+            "t1": {"events": [], "nextToken": "t2"},
+            "t2": {"events": _events("b", "c")},
+        }
+    )
+
+    pages = iter_filtered_log_events(client, "g", "", 0)
+    first = next(pages)
+    rest = list(pages)
+
+    assert [event["message"] for event in first] == ["a"]
+    assert [[event["message"] for event in page] for page in rest] == [["b", "c"]]
+    assert "filterPattern" not in client.calls[0]
+
+
+def test_filter_stops_at_max_events():
+    client = FilterLogsClient(
+        {
+            None: {"events": _events("a", "b"), "nextToken": "t1"},
+            "t1": {"events": _events("c", "d"), "nextToken": "t2"},
+        }
+    )
+
+    pages = list(iter_filtered_log_events(client, "g", "x", 0, max_events=3))
+
+    assert sum(len(page) for page in pages) == 3
+    assert [call.get("nextToken") for call in client.calls] == [None, "t1"]
+
+
+def test_filter_with_stop_set_requests_nothing():
+    client = FilterLogsClient({None: {"events": [], "nextToken": "t1"}})
+    stop = Event()
+    stop.set()
+
+    assert list(iter_filtered_log_events(client, "g", "rare", 0, stop=stop)) == []
+    assert client.calls == []
+
+
+def test_stop_ends_a_run_of_empty_pages():
+    stop = Event()
+
+    class StoppingClient(FilterLogsClient):
+        def filter_log_events(self, **kwargs: object) -> dict:
+            if len(self.calls) == 2:
+                stop.set()
+            return super().filter_log_events(**kwargs)
+
+    client = StoppingClient(
+        {token: {"events": [], "nextToken": f"t{i + 1}"} for i, token in enumerate([None, "t1", "t2", "t3"])}
+    )
+
+    assert list(iter_filtered_log_events(client, "g", "rare", 0, stop=stop)) == []
+    # The page in flight when ESC was pressed is discarded and no further page is requested
+    assert [call.get("nextToken") for call in client.calls] == [None, "t1", "t2"]
+
+
+class FakeStreamsClient:
+    """Serves get_log_events pages per stream, keyed by nextToken, and counts requests."""
+
+    def __init__(self, pages: dict[str, dict[str | None, dict]]) -> None:
+        self.pages = pages
+        self.calls: list[tuple[str, str | None]] = []
+
+    def get_log_events(self, **kwargs: object) -> dict:
+        stream = str(kwargs["logStreamName"])
+        token = kwargs.get("nextToken")
+        self.calls.append((stream, token))
+        return self.pages[stream].get(token, {"events": [], "nextBackwardToken": token})
+
+
+def _at(*entries: tuple[int, str]) -> list[dict]:
+    return [{"timestamp": timestamp, "message": message} for timestamp, message in entries]
+
+
+def test_merged_tail_interleaves_streams_newest_first():
+    client = FakeStreamsClient(
+        {
+            "a": {
+                None: {"events": _at((3, "a3"), (5, "a5")), "nextBackwardToken": "b/a1"},
+                "b/a1": {"events": _at((1, "a0"), (1, "a1")), "nextBackwardToken": "b/a0"},
+            },
+            "b": {None: {"events": _at((2, "b2"), (4, "b4")), "nextBackwardToken": "b/b1"}},
+        }
+    )
+    streams = [TaggedStream("aaaa", "g", "a"), TaggedStream("bbbb", "g", "b")]
+
+    merged = list(iter_merged_tail(client, streams, page_size=2))
+
+    assert [(stream.tag, event["message"]) for stream, event in merged] == [
+        ("aaaa", "a5"),
+        ("bbbb", "b4"),
+        ("aaaa", "a3"),
+        ("bbbb", "b2"),
+        ("aaaa", "a1"),
+        ("aaaa", "a0"),
+    ]
+
+
+def test_merged_tail_reads_older_pages_only_when_reached():
+    client = FakeStreamsClient(
+        {
+            "quiet": {
+                None: {"events": _at((1, "q1"), (2, "q2")), "nextBackwardToken": "b/q0"},
+                "b/q0": {"events": _at((0, "q0")), "nextBackwardToken": "b/q-1"},
+            },
+            "busy": {None: {"events": _at((8, "b8"), (9, "b9")), "nextBackwardToken": "b/b7"}},
+        }
+    )
+    streams = [TaggedStream("q", "g", "quiet"), TaggedStream("b", "g", "busy")]
+
+    newest = [event["message"] for _stream, event in islice(iter_merged_tail(client, streams, page_size=2), 2)]
+
+    assert newest == ["b9", "b8"]
+    # Both latest pages are requested up front; the quiet stream's older page is never needed
+    assert ("quiet", "b/q0") not in client.calls
+    assert {call for call in client.calls if call[1] is None} == {("quiet", None), ("busy", None)}
+
+
+def test_follow_merged_uses_one_loop_with_a_token_per_stream():
+    client = FakeStreamsClient(
+        {
+            "app": {
+                None: {"events": _at((1, "app 1"), (4, "app 4")), "nextForwardToken": "f/app1"},
+                "f/app1": {"events": _at((6, "app 6")), "nextForwardToken": "f/app2"},
+                "f/app2": {"events": [], "nextForwardToken": "f/app2"},
+            },
+            "envoy": {
+                None: {"events": _at((2, "envoy 2")), "nextForwardToken": "f/envoy1"},
+                "f/envoy1": {"events": _at((5, "envoy 5")), "nextForwardToken": "f/envoy2"},
+                "f/envoy2": {"events": [], "nextForwardToken": "f/envoy2"},
+            },
+        }
+    )
+    streams = [TaggedStream("app", "g", "app"), TaggedStream("envoy", "g", "envoy")]
+    stop = CountingStop(2)
+
+    batches = list(follow_merged_log_events(client, streams, lines=2, stop=stop, interval=AdaptiveInterval(1, 8)))
+
+    assert [[event["message"] for _stream, event in batch] for batch in batches] == [
+        ["envoy 2", "app 4"],
+        ["envoy 5", "app 6"],
+    ]
+    # Each tick reads every stream from its own token, and the interval only backs off when all are idle
+    assert sorted(call for call in client.calls if call[1]) == [
+        ("app", "f/app1"),
+        ("app", "f/app2"),
+        ("envoy", "f/envoy1"),
+        ("envoy", "f/envoy2"),
+    ]
+    assert stop.waits == [1, 1, 2]
+
+
+class FakeLogGroupsClient:
+    """Serves describe_log_groups pages per name pattern, as CloudWatch filters them server-side."""
+
+    def __init__(self, pages: dict[str, list[list[str]]]) -> None:
+        self.pages = pages
+        self.calls: list[dict] = []
+
+    def describe_log_groups(self, **kwargs: object) -> dict:
+        self.calls.append(kwargs)
+        pages = self.pages.get(str(kwargs["logGroupNamePattern"]), [[]])
+        index = int(str(kwargs.get("nextToken", "0")))
+        response: dict = {"logGroups": [{"logGroupName": name} for name in pages[index]]}
+        if index + 1 < len(pages):
+            response["nextToken"] = str(index + 1)
+        return response
+
+
+def test_list_log_groups_searches_server_side_and_ranks_candidates(tmp_path):
+    from unittest.mock import Mock
+
+    from lazy_ecs.core.disk_cache import DiskCache
+    from lazy_ecs.features.container.container import ContainerService
+
+    client = FakeLogGroupsClient(
+        {
+            "web": [["/aws/lambda/webhook-handler", "/ecs/other-cluster/web-old"], ["/ecs/production/web"]],
+            "production": [["/ecs/production/web", "/production/audit"]],
+        }
+    )
+    service = ContainerService(Mock(), Mock(), client, disk_cache=DiskCache(tmp_path))
+
+    groups = service.list_log_groups("production", "web")
+
+    assert groups[0] == "/ecs/production/web"
+    assert set(groups) == {
+        "/aws/lambda/webhook-handler",
+        "/ecs/other-cluster/web-old",
+        "/ecs/production/web",
+        "/production/audit",
+    }
+    assert [(call["logGroupNamePattern"], call.get("nextToken")) for call in client.calls] == [
+        ("web", None),
+        ("web", "1"),
+        ("production", None),
+    ]
+
+    # A second lookup in the same account is answered from the cache
+    assert service.list_log_groups("production", "web") == groups
+    assert len(client.calls) == 3
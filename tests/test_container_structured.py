@@ -0,0 +1,113 @@
+"""Tests for JSON log detection, level coloring and field projection."""
+
+import json
+from unittest.mock import patch
+
+from lazy_ecs.features.container import structured
+from lazy_ecs.features.container.digest import collapse_repeats
+from lazy_ecs.features.container.logs import LogPage
+from lazy_ecs.features.container.render import (
+    REPEAT_SIGN,
+    render_collapsed_lines,
+    render_log_events,
+    render_projected_events,
+)
+from lazy_ecs.features.container.structured import common_fields, find_level, parse_json_message
+
+
+def _event(message: str, timestamp: int = 1700000000000) -> dict:
+    return {"timestamp": timestamp, "message": message}
+
+
+def test_parse_json_message_only_parses_objects():
+    with patch("lazy_ecs.features.container.structured.json.loads", wraps=json.loads) as loads:
+        assert parse_json_message("GET /health 200") is None
+        assert parse_json_message("[1, 2]") is None
+        assert loads.call_count == 0
+
+    assert parse_json_message(' {"level": "info", "msg": "ok"}\n') == {"level": "info", "msg": "ok"}
+    assert parse_json_message("{not json}") is None
+
+
+def test_find_level_in_json_and_plain_lines():
+    message = '{"msg": "level up", "level": "warn"}'
+    level, start, end = find_level(message, parse_json_message(message))
+    assert level == "WARN"
+    assert message[start:end] == "warn"
+
+    assert find_level("2024-01-01 ERROR boom", None) == ("ERROR", 11, 16)
+    assert find_level("some info for you", None) is None
+
+
+def test_render_colors_levels_without_markup():
+    events = [_event("INFO started"), _event("[red]ERROR[/red] failed")]
+
+    text = render_log_events(events)
+
+    styled = {text.plain[span.start : span.end]: span.style for span in text.spans}
+    assert styled == {"INFO": "green", "ERROR": "red"}
+    assert text.plain.splitlines()[1].endswith("[red]ERROR[/red] failed")
+
+
+def test_projection_shows_chosen_fields_in_columns():
+    messages = [
+        '{"level": "error", "msg": "payment failed", "trace_id": "t-1", "user": 7}',
+        '{"level": "info", "msg": "ok", "trace_id": "t-22"}',
+        "plain text line",
+    ]
+    page = LogPage(events=[_event(message) for message in messages], older_token=None, newer_token=None)
+
+    text = render_projected_events(page.events, page.records, ["level", "trace_id", "msg"])
+
+    lines = text.plain.splitlines()
+    assert lines[0].endswith("] error t-1  payment failed")
+    assert lines[1].endswith("] info  t-22 ok")
+    assert lines[2].endswith("] plain text line")
+    assert [span.style for span in text.spans] == ["red", "green"]
+    assert common_fields(page.records)[:3] == ["level", "msg", "trace_id"]
+
+
+def test_page_records_are_parsed_once():
+    page = LogPage(events=[_event('{"msg": "a"}'), _event('{"msg": "b"}')], older_token=None, newer_token=None)
+
+    with patch("lazy_ecs.features.container.structured.json.loads", wraps=json.loads) as loads:
+        render_projected_events(page.events, page.records, ["msg"])
+        render_projected_events(page.events, page.records, ["msg", "level"])
+        render_log_events(page.events, page.levels)
+
+    assert loads.call_count == 2
+
+
+def test_page_levels_are_found_once_for_every_render():
+    messages = ['{"level": "error", "msg": "a 1"}', '{"level": "error", "msg": "a 2"}', "INFO b"]
+    page = LogPage(events=[_event(message) for message in messages], older_token=None, newer_token=None)
+
+    with patch.object(structured, "find_level", wraps=structured.find_level) as find:
+        first = render_collapsed_lines(collapse_repeats(page.events), page.levels)
+        second = render_collapsed_lines(collapse_repeats(page.events), page.levels)
+        render_log_events(page.events, page.levels)
+
+    assert find.call_count == 3
+    assert first.plain == second.plain
+    styled = [(first.plain[span.start : span.end], span.style) for span in first.spans]
+    assert styled == [("error", "red"), (f" {REPEAT_SIGN}2", "bold magenta"), ("INFO", "green")]
+
+
+def test_collapse_and_event_rate():
+    from lazy_ecs.features.container.digest import EventRate, collapse_repeats, normalize_message
+
+    assert normalize_message("user 42 took 12.5ms id=550e8400-e29b-41d4-a716-446655440000") == normalize_message(
+        "user 7 took 3ms id=123e4567-e89b-12d3-a456-426614174000"
+    )
+    events = [_event("a 1"), _event("a 2"), _event("b"), _event("a 3")]
+    assert [(line.event["message"], line.count) for line in collapse_repeats(events)] == [
+        ("a 1", 2),
+        ("b", 1),
+        ("a 3", 1),
+    ]
+
+    rate = EventRate()
+    rate.add([_event("x", 0), _event("x", 1000), _event("x", 120_000)])
+    rate.add([_event("x", 125_000)] * 4)
+    assert rate.sparkline() == "▄ █"
+    assert rate.peak == 5
@@ -3,8 +3,10 @@
 from unittest.mock import Mock
 
 import pytest
+from rich.text import Text
 
 from lazy_ecs.features.container.container import ContainerService
+from lazy_ecs.features.container.logs import LogPage
 from lazy_ecs.features.container.ui import ContainerUI
 
 
@@ -18,6 +20,10 @@ def mock_task_service():
     return Mock()
 
 
+def _page(events: list[dict]) -> LogPage:
+    return LogPage(events=events, older_token=None, newer_token=None)
+
+
 @pytest.fixture
 def container_ui(mock_ecs_client, mock_task_service):
     container_service = ContainerService(mock_ecs_client, mock_task_service)
@@ -33,12 +39,12 @@ def test_show_container_logs_success(container_ui):
     ]
 
     container_ui.container_service.get_log_config = Mock(return_value=log_config)
-    container_ui.container_service.get_container_logs = Mock(return_value=events)
+    container_ui.container_service.get_log_page = Mock(return_value=_page(events))
 
     container_ui.show_container_logs("test-cluster", "task-arn", "web-container", 50)
 
     container_ui.container_service.get_log_config.assert_called_once_with("test-cluster", "task-arn", "web-container")
-    container_ui.container_service.get_container_logs.assert_called_once_with("test-log-group", "test-stream", 50)
+    container_ui.container_service.get_log_page.assert_called_once_with("test-log-group", "test-stream", lines=50)
 
 
 def test_show_container_logs_no_config(container_ui):
@@ -57,12 +63,12 @@ def test_show_container_logs_no_events(container_ui):
     log_config = {"log_group": "test-log-group", "log_stream": "test-stream"}
 
     container_ui.container_service.get_log_config = Mock(return_value=log_config)
-    container_ui.container_service.get_container_logs = Mock(return_value=[])
+    container_ui.container_service.get_log_page = Mock(return_value=_page([]))
 
     container_ui.show_container_logs("test-cluster", "task-arn", "web-container", 50)
 
     container_ui.container_service.get_log_config.assert_called_once_with("test-cluster", "task-arn", "web-container")
-    container_ui.container_service.get_container_logs.assert_called_once_with("test-log-group", "test-stream", 50)
+    container_ui.container_service.get_log_page.assert_called_once_with("test-log-group", "test-stream", lines=50)
 
 
 def test_show_container_environment_variables_success(container_ui):
@@ -236,3 +242,335 @@ def test_show_container_volume_mounts_empty(container_ui):
         "test-cluster", "task-arn", "web-container"
     )
     container_ui.container_service.get_volume_mounts.assert_called_once_with(context)
+
+
+def test_container_views_use_task_session_without_lookup(container_ui):
+    """Test that a task session answers container views without fetching the task again."""
+    from lazy_ecs.core.context import TaskSession
+
+    task_definition = {
+        "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:task-definition/web:1",
+        "containerDefinitions": [
+            {
+                "name": "web-container",
+                "image": "nginx",
+                "environment": [{"name": "ENV", "value": "prod"}],
+                "logConfiguration": {
+                    "logDriver": "awslogs",
+                    "options": {"awslogs-group": "/ecs/web", "awslogs-stream-prefix": "ecs"},
+                },
+            }
+        ],
+    }
+    task_arn = "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc123"
+    session = TaskSession(
+        cluster_name="test-cluster",
+        service_name="web",
+        task={"taskArn": task_arn, "taskDefinitionArn": task_definition["taskDefinitionArn"]},
+        task_definition=task_definition,
+        details=Mock(),
+    )
+    container_ui.container_service.get_container_context = Mock()
+    container_ui.container_service.get_log_config = Mock()
+    container_ui.container_service.get_log_page = Mock(return_value=_page([]))
+
+    container_ui.show_container_environment_variables("test-cluster", task_arn, "web-container", session)
+    container_ui.show_container_logs("test-cluster", task_arn, "web-container", 20, session)
+
+    container_ui.container_service.get_container_context.assert_not_called()
+    container_ui.container_service.get_log_config.assert_not_called()
+    container_ui.container_service.get_log_page.assert_called_once_with(
+        "/ecs/web", "ecs/web-container/abc123", lines=20
+    )
+
+
+def test_logs_client_created_on_first_use(mock_ecs_client, mock_task_service):
+    """Test that a logs client factory is only called once logs are actually read."""
+    logs_client = Mock()
+    logs_client.get_log_events.return_value = {"events": []}
+    factory = Mock(return_value=logs_client)
+    container_service = ContainerService(mock_ecs_client, mock_task_service, logs_client_factory=factory)
+
+    factory.assert_not_called()
+    container_service.get_container_logs("group", "stream")
+    container_service.get_container_logs("group", "stream")
+
+    factory.assert_called_once_with()
+
+
+def test_follow_container_logs_prints_each_batch_once(container_ui):
+    """Test that follow mode writes a whole batch of events in a single print."""
+    from unittest.mock import patch
+
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    batches = [
+        [{"timestamp": 1234567890000, "message": "first"}],
+        [{"timestamp": 1234567891000, "message": "second"}, {"timestamp": 1234567892000, "message": "third"}],
+    ]
+    container_ui.container_service.follow_container_logs = Mock(return_value=iter(batches))
+
+    with patch("lazy_ecs.features.container.ui.console") as mock_console:
+        container_ui.follow_container_logs("test-cluster", "task-arn", "web-container", 20)
+
+    printed = [call.args[0].plain for call in mock_console.print.call_args_list if isinstance(call.args[0], Text)]
+    assert len(printed) == 2
+    assert printed[1].splitlines()[0].endswith("second")
+    assert printed[1].splitlines()[1].endswith("third")
+    follow_args = container_ui.container_service.follow_container_logs.call_args.args
+    assert follow_args[:3] == ("g", "s", 20)
+
+
+def test_browse_container_logs_pages_back_and_forth(container_ui):
+    """Test that browsing log history follows older tokens and returns to newer pages."""
+    from unittest.mock import patch
+
+    from lazy_ecs.features.container.logs import LogPage
+
+    latest = LogPage(events=[{"timestamp": 1234567890000, "message": "new"}], older_token="b/1", newer_token="f/2")
+    older = LogPage(events=[{"timestamp": 1234567880000, "message": "old"}], older_token=None, newer_token="f/1")
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    container_ui.container_service.get_log_page = Mock(side_effect=[latest, older, latest])
+
+    with patch("lazy_ecs.features.container.ui.questionary.select") as mock_select:
+        mock_select.return_value.ask.side_effect = ["older", "newer", "done"]
+        container_ui.browse_container_logs("test-cluster", "task-arn", "web-container", 20)
+
+    tokens = [call.args[2] for call in container_ui.container_service.get_log_page.call_args_list]
+    assert tokens == [None, "b/1", None]
+    older_page_choices = [choice.value for choice in mock_select.call_args_list[1].kwargs["choices"]]
+    assert older_page_choices == ["newer", "done"]
+
+
+def test_filter_logs_streams_each_source(container_ui):
+    """Test that filtering prompts once and queries every log source with the chosen window."""
+    from unittest.mock import patch
+
+    sources = [
+        {"container_name": "web", "log_group": "/ecs/web", "stream_prefix": "ecs/web/"},
+        {"container_name": "worker", "log_group": "/ecs/worker", "stream_prefix": "ecs/worker/"},
+    ]
+    page = [{"timestamp": 1234567890000, "message": "ERROR boom", "logStreamName": "ecs/web/abcdef1234"}]
+    container_ui.container_service.filter_logs = Mock(side_effect=[iter([page]), iter([])])
+
+    with (
+        patch("lazy_ecs.features.container.ui.questionary") as mock_questionary,
+        patch("lazy_ecs.features.container.ui.console") as mock_console,
+    ):
+        mock_questionary.text.return_value.ask.return_value = "ERROR"
+        mock_questionary.select.return_value.ask.return_value = 3600
+        container_ui.filter_logs("service 'web'", sources)
+
+    calls = container_ui.container_service.filter_logs.call_args_list
+    assert [call.args[0] for call in calls] == ["/ecs/web", "/ecs/worker"]
+    _group, pattern, start_time, end_time, prefix, _stop = calls[0].args
+    assert (pattern, end_time - start_time, prefix) == ("ERROR", 3600 * 1000, "ecs/web/")
+    printed = [call.args[0].plain for call in mock_console.print.call_args_list if isinstance(call.args[0], Text)]
+    assert len(printed) == 1
+    assert printed[0].endswith("] web/abcdef12 ERROR boom")
+
+
+def test_filter_logs_cancelled_at_pattern_prompt(container_ui):
+    from unittest.mock import patch
+
+    container_ui.container_service.filter_logs = Mock()
+    sources = [{"container_name": "web", "log_group": "/ecs/web", "stream_prefix": "ecs/web/"}]
+
+    with patch("lazy_ecs.features.container.ui.questionary") as mock_questionary:
+        mock_questionary.text.return_value.ask.return_value = None
+        container_ui.filter_logs("service 'web'", sources)
+
+    container_ui.container_service.filter_logs.assert_not_called()
+
+
+def test_show_task_logs_merges_containers_with_a_color_each(container_ui):
+    """Test that the task log view resolves every container's stream and colors each container's tag."""
+    from unittest.mock import patch
+
+    from lazy_ecs.core.context import TaskSession
+
+    log_configuration = {"logDriver": "awslogs", "options": {"awslogs-group": "/ecs/web"}}
+    task_definition = {
+        "containerDefinitions": [
+            {"name": "app", "logConfiguration": log_configuration},
+            {"name": "envoy", "logConfiguration": log_configuration},
+            {"name": "no-logs"},
+        ],
+    }
+    task_arn = "arn:aws:ecs:us-east-1:123456789012:task/test-cluster/abc12345def"
+    session = TaskSession(
+        cluster_name="test-cluster",
+        service_name="web",
+        task={"taskArn": task_arn, "containers": [{"name": "app"}, {"name": "envoy"}, {"name": "no-logs"}]},
+        task_definition=task_definition,
+        details=Mock(),
+    )
+    streams = container_ui.container_service.get_task_log_streams(session)
+    assert [(stream.tag, stream.log_stream) for stream in streams] == [
+        ("app", "ecs/app/abc12345def"),
+        ("envoy", "ecs/envoy/abc12345def"),
+    ]
+
+    events = [
+        (streams[0], {"timestamp": 1234567890000, "message": "request"}),
+        (streams[1], {"timestamp": 1234567890500, "message": "upstream"}),
+    ]
+    container_ui.container_service.get_merged_logs = Mock(return_value=events)
+
+    with patch("lazy_ecs.features.container.ui.console") as mock_console:
+        container_ui.show_task_logs(session, 20)
+
+    container_ui.container_service.get_merged_logs.assert_called_once_with(streams, 20)
+    (text,) = [call.args[0] for call in mock_console.print.call_args_list if not isinstance(call.args[0], str)]
+    assert text.plain.splitlines()[1].endswith("envoy upstream")
+    tag_styles = {text.plain[span.start : span.end].strip(): span.style for span in text.spans}
+    assert tag_styles["app"] != tag_styles["envoy"]
+
+
+def test_show_container_logs_writes_page_in_one_print_without_markup(container_ui):
+    """Test that a page of logs is one renderable and bracketed text in messages survives."""
+    from unittest.mock import patch
+
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    # Alternating shapes, so no lines are collapsed as repeats
+    events = [
+        {"timestamp": 1234567890000 + i, "message": f"[bold]{'even' if i % 2 == 0 else 'odd'} line {i}[/bold]\n"}
+        for i in range(500)
+    ]
+    container_ui.container_service.get_log_page = Mock(return_value=_page(events))
+
+    with patch("lazy_ecs.features.container.ui.console") as mock_console:
+        container_ui.show_container_logs("test-cluster", "task-arn", "web-container", 500)
+
+    (text,) = [call.args[0] for call in mock_console.print.call_args_list if isinstance(call.args[0], Text)]
+    lines = text.plain.splitlines()
+    assert len(lines) == 500
+    assert lines[0].endswith("] [bold]even line 0[/bold]")
+    mock_console.pager.assert_not_called()
+
+
+def test_show_container_logs_in_pager(container_ui):
+    """Test that pager mode wraps the output in the console pager."""
+    from unittest.mock import patch
+
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    container_ui.container_service.get_log_page = Mock(return_value=_page([{"timestamp": 0, "message": "x"}]))
+
+    with patch("lazy_ecs.features.container.ui.console") as mock_console:
+        container_ui.show_container_logs("test-cluster", "task-arn", "web-container", 1000, pager=True)
+
+    mock_console.pager.assert_called_once_with(styles=True)
+
+
+def test_browse_container_logs_switches_to_chosen_json_fields(container_ui):
+    """Test that choosing fields redraws the same page as columns without fetching it again."""
+    from unittest.mock import patch
+
+    from lazy_ecs.features.container.logs import LogPage
+
+    page = LogPage(
+        events=[{"timestamp": 1234567890000, "message": '{"level": "info", "msg": "hello", "trace_id": "t-1"}'}],
+        older_token=None,
+        newer_token=None,
+    )
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    container_ui.container_service.get_log_page = Mock(return_value=page)
+
+    with (
+        patch("lazy_ecs.features.container.ui.console") as mock_console,
+        patch("lazy_ecs.features.container.ui.questionary") as mock_questionary,
+    ):
+        mock_questionary.select.return_value.ask.side_effect = ["fields", "done"]
+        mock_questionary.checkbox.return_value.ask.return_value = ["msg"]
+        container_ui.browse_container_logs("test-cluster", "task-arn", "web-container", 20)
+
+    suggested = [
+        choice.kwargs["checked"] for choice in mock_questionary.Choice.call_args_list if "checked" in choice.kwargs
+    ]
+    assert suggested == [True, True, True]
+    printed = [call.args[0].plain for call in mock_console.print.call_args_list if isinstance(call.args[0], Text)]
+    assert printed[0].endswith('"trace_id": "t-1"}')
+    assert printed[1].endswith("] hello")
+
+
+def test_follow_container_logs_collapses_repeats_across_batches(container_ui):
+    """Test that a run of same-shaped lines is shown once, even when it spans batches."""
+    from unittest.mock import patch
+
+    container_ui.container_service.get_log_config = Mock(return_value={"log_group": "g", "log_stream": "s"})
+    batches = [
+        [{"timestamp": 1234567890000, "message": "start"}]
+        + [{"timestamp": 1234567890000 + i, "message": f"retry {i} failed for req-{i:04d}"} for i in range(3)],
+        [{"timestamp": 1234567950000 + i, "message": f"retry {i} failed for req-{i:04d}"} for i in range(4)]
+        + [{"timestamp": 1234567951000, "message": "recovered"}],
+    ]
+    container_ui.container_service.follow_container_logs = Mock(return_value=iter(batches))
+
+    with patch("lazy_ecs.features.container.ui.console") as mock_console:
+        container_ui.follow_container_logs("test-cluster", "task-arn", "web-container", 20)
+
+    printed = [call.args[0].plain for call in mock_console.print.call_args_list if isinstance(call.args[0], Text)]
+    first, second = (text.splitlines() for text in printed)
+    assert first[1].endswith("retry 0 failed for req-0000 \u00d73")
+    assert second[0].endswith("previous line repeated \u00d74")
+    assert second[1].endswith("recovered")
+    rate_line = next(call.args[0] for call in mock_console.print.call_args_list if "per minute" in str(call.args[0]))
+    assert "peak 5/min" in rate_line
+
+
+@pytest.fixture
+def fake_terminal(monkeypatch):
+    """Make stdin look like a terminal whose key presses the test controls."""
+    from contextlib import nullcontext
+
+    import prompt_toolkit.input
+
+    terminal_input = Mock()
+    terminal_input.raw_mode.return_value = nullcontext()
+    terminal_input.read_keys.return_value = []
+    terminal_input.flush_keys.return_value = []
+    monkeypatch.setattr("sys.stdin", Mock(isatty=Mock(return_value=True)))
+    monkeypatch.setattr(prompt_toolkit.input, "create_input", Mock(return_value=terminal_input))
+    return terminal_input
+
+
+def test_run_insights_in_a_terminal_reports_the_finished_query(container_ui, fake_terminal):
+    """Test that leaving the key watcher after a finished query is not mistaken for a cancel."""
+    from unittest.mock import patch
+
+    from lazy_ecs.features.container.insights import InsightsResult
+
+    result = InsightsResult("Complete", rows=[{"count(*)": "3"}], records_scanned=42, bytes_scanned=2_000_000)
+    container_ui.container_service.run_insights_query = Mock(return_value=iter([result]))
+
+    with (
+        patch("lazy_ecs.features.container.ui.questionary") as mock_questionary,
+        patch("lazy_ecs.features.container.ui.console") as mock_console,
+        patch("lazy_ecs.features.container.ui.Live"),
+    ):
+        mock_questionary.select.return_value.ask.side_effect = ["stats count(*)", 3600]
+        container_ui.run_insights("container 'web'", ["/ecs/web"])
+
+    printed = [str(call.args[0]) for call in mock_console.print.call_args_list]
+    assert "📊 1 rows, 42 records (2.0 MB) scanned" in printed
+    assert "⏹️ Query cancelled" not in printed
+    fake_terminal.raw_mode.assert_called_once()
+
+
+def test_stop_on_escape_sets_stop_only_on_a_stop_key(fake_terminal):
+    from threading import Event
+
+    from prompt_toolkit.key_binding.key_processor import KeyPress
+    from prompt_toolkit.keys import Keys
+
+    from lazy_ecs.core.polling import stop_on_escape
+
+    finished = Event()
+    with stop_on_escape(finished):
+        pass
+    assert not finished.is_set()
+
+    fake_terminal.flush_keys.side_effect = [[KeyPress(Keys.Escape)]] + [[]] * 100
+    cancelled = Event()
+    with stop_on_escape(cancelled):
+        assert cancelled.wait(timeout=2)
+    assert cancelled.is_set()
@@ -0,0 +1,77 @@
+"""Tests for chunked, concurrent fetch helpers."""
+
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from lazy_ecs.core.batching import chunked, fetch_in_chunks, stream_chunks
+
+
+def test_chunked_splits_into_fixed_size_lists():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunked_empty():
+    assert list(chunked([], 10)) == []
+
+
+def test_fetch_in_chunks_preserves_input_order():
+    """Earlier chunks finishing last must not reorder results."""
+    items = [str(i) for i in range(30)]
+
+    def fetch(chunk) -> list[str]:
+        time.sleep(0.02 if chunk[0] == "0" else 0)
+        return [item.upper() for item in chunk]
+
+    result = fetch_in_chunks(items, 10, fetch)
+
+    assert result.results == items
+    assert result.failures == []
+
+
+def test_fetch_in_chunks_reports_failed_chunks():
+    items = [str(i) for i in range(25)]
+
+    def fetch(chunk) -> list[str]:
+        if "12" in chunk:
+            raise RuntimeError("ThrottlingException")
+        return chunk
+
+    result = fetch_in_chunks(items, 10, fetch)
+
+    assert result.results == [str(i) for i in range(10)] + [str(i) for i in range(20, 25)]
+    assert len(result.failures) == 1
+    assert result.failures[0].items == [str(i) for i in range(10, 20)]
+    assert result.failures[0].reason == "ThrottlingException"
+
+
+def test_fetch_in_chunks_no_items():
+    result = fetch_in_chunks([], 10, lambda chunk: chunk)
+
+    assert result.results == []
+    assert result.failures == []
+
+
+def test_stream_chunks_pulls_producer_lazily():
+    produced = []
+
+    def producer() -> Iterator[list[str]]:
+        for i in range(5):
+            produced.append(i)
+            yield [str(i)]
+
+    stream = stream_chunks(producer(), lambda chunk: chunk, max_workers=2)
+    first = next(stream)
+
+    assert first in {"0", "1"}
+    assert len(produced) < 5
+    assert sorted([first, *stream]) == ["0", "1", "2", "3", "4"]
+
+
+def test_stream_chunks_propagates_errors():
+    def fetch(chunk) -> list[str]:
+        raise RuntimeError(f"boom {chunk[0]}")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(stream_chunks([["a"]], fetch))
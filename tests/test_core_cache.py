@@ -0,0 +1,59 @@
+"""Tests for the in-process task definition store."""
+
+from unittest.mock import Mock
+
+from lazy_ecs.core.cache import TaskDefinitionStore, is_revision_arn
+
+REVISION_ARN = "arn:aws:ecs:us-east-1:123456789012:task-definition/web:7"
+
+
+def _definition(arn=REVISION_ARN) -> dict:
+    return {"taskDefinitionArn": arn, "family": "web", "containerDefinitions": []}
+
+
+def test_is_revision_arn():
+    assert is_revision_arn(REVISION_ARN)
+    assert not is_revision_arn("web")
+    assert not is_revision_arn("web:7")
+    assert not is_revision_arn("arn:aws:ecs:us-east-1:123456789012:task-definition/web")
+
+
+def test_get_or_fetch_only_calls_api_once_per_revision():
+    client = Mock()
+    client.describe_task_definition.return_value = {"taskDefinition": _definition()}
+    store = TaskDefinitionStore()
+
+    first = store.get_or_fetch(client, REVISION_ARN)
+    second = store.get_or_fetch(client, REVISION_ARN)
+
+    assert first is second
+    client.describe_task_definition.assert_called_once_with(taskDefinition=REVISION_ARN)
+
+
+def test_get_or_fetch_always_fetches_family_but_stores_revision():
+    client = Mock()
+    client.describe_task_definition.return_value = {"taskDefinition": _definition()}
+    store = TaskDefinitionStore()
+
+    store.get_or_fetch(client, "web")
+    store.get_or_fetch(client, "web")
+
+    assert client.describe_task_definition.call_count == 2
+    assert store.get(REVISION_ARN) == _definition()
+
+
+def test_get_for_task_uses_remembered_revision():
+    store = TaskDefinitionStore()
+    store.put(_definition())
+    store.remember_task({"taskArn": "task-1", "taskDefinitionArn": REVISION_ARN})
+
+    assert store.get_for_task("task-1") == _definition()
+    assert store.get_for_task("task-2") is None
+
+
+def test_clear():
+    store = TaskDefinitionStore()
+    store.put(_definition())
+    store.clear()
+
+    assert store.get(REVISION_ARN) is None
@@ -0,0 +1,42 @@
+"""Tests for the shared AWS client factory."""
+
+from unittest.mock import Mock, patch
+
+from lazy_ecs.core.clients import CLIENT_CONFIG, AWSClientFactory
+
+
+def test_clients_share_one_session():
+    """Test that every client comes from a single session, so credentials resolve once."""
+    mock_session = Mock()
+
+    with patch("lazy_ecs.core.clients.boto3.Session", return_value=mock_session) as mock_session_class:
+        factory = AWSClientFactory("my-profile")
+        factory.ecs()
+        factory.logs()
+
+    mock_session_class.assert_called_once_with(profile_name="my-profile")
+    assert [call.args[0] for call in mock_session.client.call_args_list] == ["ecs", "logs"]
+    assert all(call.kwargs["config"] is CLIENT_CONFIG for call in mock_session.client.call_args_list)
+
+
+def test_clients_created_once_and_on_first_use():
+    mock_session = Mock()
+
+    with patch("lazy_ecs.core.clients.boto3.Session", return_value=mock_session) as mock_session_class:
+        factory = AWSClientFactory(None)
+        mock_session_class.assert_not_called()
+
+        assert factory.ecs() is factory.ecs()
+
+    mock_session_class.assert_called_once_with()
+    mock_session.client.assert_called_once()
+
+
+def test_account_id_uses_sts():
+    mock_session = Mock()
+    mock_session.client.return_value.get_caller_identity.return_value = {"Account": "123456789012"}
+
+    with patch("lazy_ecs.core.clients.boto3.Session", return_value=mock_session):
+        assert AWSClientFactory(None).account_id() == "123456789012"
+
+    assert mock_session.client.call_args.args[0] == "sts"
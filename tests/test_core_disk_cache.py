@@ -0,0 +1,116 @@
+"""Tests for the persistent on-disk metadata cache."""
+
+import os
+import time
+from datetime import UTC, datetime
+from unittest.mock import Mock, patch
+
+from lazy_ecs.core.cache import TaskDefinitionStore
+from lazy_ecs.core.disk_cache import DiskCache, default_cache_root, deserialize, serialize
+from lazy_ecs.features.cluster.cluster import ClusterService
+from lazy_ecs.features.task.task import TaskService
+
+REVISION_ARN = "arn:aws:ecs:us-east-1:123456789012:task-definition/web:7"
+
+
+def test_serialize_round_trips_datetimes():
+    value = {"registeredAt": datetime(2024, 5, 1, 12, 0, tzinfo=UTC), "names": ["a", "b"]}
+
+    assert deserialize(serialize(value)) == value
+
+
+def test_default_cache_root_respects_xdg(tmp_path):
+    with patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)}):
+        assert default_cache_root() == tmp_path / "lazy-ecs"
+
+
+def test_for_account_partitions_by_profile_region_and_account(tmp_path):
+    cache = DiskCache.for_account("dev/admin", "eu-west-1", "123456789012", root=tmp_path)
+
+    assert cache.directory == tmp_path / "dev_admin" / "eu-west-1" / "123456789012"
+
+
+def test_get_returns_stored_value(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("cluster-names", ["production", "staging"])
+
+    assert cache.get("cluster-names") == ["production", "staging"]
+    assert cache.get("missing") is None
+
+
+def test_get_honours_max_age(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("cluster-names", ["production"])
+
+    with patch("lazy_ecs.core.disk_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("cluster-names", max_age=60) is None
+        assert cache.get("cluster-names", max_age=300) == ["production"]
+        assert cache.get("cluster-names") == ["production"]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("cluster-names", ["production"])
+    next(tmp_path.iterdir()).write_bytes(b"not compressed")
+
+    assert cache.get("cluster-names") is None
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path):
+    cache = DiskCache(tmp_path)
+    for i in range(5):
+        cache.put(f"key-{i}", os.urandom(200).hex())
+        os.utime(cache._path_for(f"key-{i}"), (1000 + i, 1000 + i))
+    entry_size = cache._path_for("key-0").stat().st_size
+    cache.max_bytes = int(entry_size * 5.5)
+    cache.get("key-0")  # Touch the oldest entry so it becomes the most recently used
+
+    cache.put("key-5", os.urandom(200).hex())
+
+    assert cache.get("key-0") is not None
+    assert cache.get("key-5") is not None
+    assert cache.get("key-1") is None
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= cache.max_bytes
+
+
+def test_put_scans_the_directory_only_when_the_cap_may_be_crossed(tmp_path):
+    cache = DiskCache(tmp_path)
+    scan = cache._evict_if_needed
+    cache._evict_if_needed = Mock(side_effect=scan)
+
+    for i in range(50):
+        cache.put(f"key-{i}", os.urandom(100).hex())
+
+    # One scan learns the directory size; later writes under the cap only add to the running estimate
+    assert cache._evict_if_needed.call_count == 1
+
+    cache.max_bytes = sum(path.stat().st_size for path in tmp_path.iterdir())
+    cache.put("key-50", os.urandom(100).hex())
+
+    assert cache._evict_if_needed.call_count == 2
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= cache.max_bytes
+
+
+def test_cluster_names_served_from_cache_when_fresh(tmp_path):
+    client = Mock()
+    client.list_clusters.return_value = {"clusterArns": ["arn:aws:ecs:us-east-1:123:cluster/production"]}
+    cache = DiskCache(tmp_path)
+
+    assert ClusterService(client, cache).get_cluster_names() == ["production"]
+    assert ClusterService(client, cache).get_cluster_names() == ["production"]
+
+    client.list_clusters.assert_called_once()
+
+
+def test_task_definition_served_from_disk_across_runs(tmp_path):
+    client = Mock()
+    definition = {"taskDefinitionArn": REVISION_ARN, "containerDefinitions": []}
+    client.describe_task_definition.return_value = {"taskDefinition": definition}
+    cache = DiskCache(tmp_path)
+
+    TaskService(client, disk_cache=cache).get_task_definition(REVISION_ARN)
+    # A new in-memory store stands in for a fresh process
+    result = TaskService(client, TaskDefinitionStore(), cache).get_task_definition(REVISION_ARN)
+
+    assert result == definition
+    client.describe_task_definition.assert_called_once()
@@ -138,3 +138,76 @@ def test_select_with_navigation_choices_expanded(mock_select):
     assert passed_choices[0].value == "opt1"
     assert passed_choices[1].value == "navigation:back"
     assert passed_choices[2].value == "navigation:exit"
+
+
+@patch("lazy_ecs.core.navigation.questionary.select")
+def test_select_with_navigation_refresh_relabels_when_list_changes(mock_select):
+    """Test that fresh choices differing from the snapshot relabel the refresh entry."""
+    from concurrent.futures import Future
+
+    from lazy_ecs.core.navigation import REFRESH_CHANGED_TEXT, REFRESH_TEXT, REFRESH_VALUE
+
+    mock_select.return_value.ask.return_value = "opt1"
+    refresh: Future = Future()
+    choices = [{"name": "Option 1", "value": "opt1"}]
+
+    select_with_navigation("Test prompt", choices, "Back", refresh)
+
+    passed_choices = mock_select.call_args[1]["choices"]
+    refresh_choice = passed_choices[1]
+    assert refresh_choice.value == REFRESH_VALUE
+    assert refresh_choice.title == REFRESH_TEXT
+
+    refresh.set_result([*choices, {"name": "Option 2", "value": "opt2"}])
+
+    assert refresh_choice.title == REFRESH_CHANGED_TEXT
+    mock_select.return_value.application.invalidate.assert_called_once()
+
+
+@patch("lazy_ecs.core.navigation.questionary.select")
+def test_select_with_navigation_refresh_unchanged_list(mock_select):
+    """Test that an unchanged fresh list leaves the refresh entry alone."""
+    from concurrent.futures import Future
+
+    from lazy_ecs.core.navigation import REFRESH_TEXT
+
+    refresh: Future = Future()
+    choices = [{"name": "Option 1", "value": "opt1"}]
+    select_with_navigation("Test prompt", choices, "Back", refresh)
+
+    refresh.set_result(list(choices))
+
+    assert mock_select.call_args[1]["choices"][1].title == REFRESH_TEXT
+    mock_select.return_value.application.invalidate.assert_not_called()
+
+
+@patch("lazy_ecs.core.navigation.questionary.select")
+def test_select_with_navigation_long_lists_disable_shortcuts(mock_select):
+    """Test that lists longer than questionary's shortcut keys still render."""
+    choices = [{"name": f"Option {i}", "value": f"opt{i}"} for i in range(50)]
+
+    select_with_navigation("Test prompt", choices, "Back")
+
+    assert mock_select.call_args[1]["use_shortcuts"] is False
+
+
+@patch("lazy_ecs.core.navigation.questionary.select")
+def test_select_with_navigation_long_lists_keep_navigation_keys(mock_select):
+    """Test that r, b and q still work on lists too long for questionary's shortcuts."""
+    from concurrent.futures import Future
+    from unittest.mock import Mock
+
+    from lazy_ecs.core.navigation import REFRESH_VALUE
+
+    choices = [{"name": f"Option {i}", "value": f"opt{i}"} for i in range(40)]
+    select_with_navigation("Test prompt", choices, "Back", Future())
+
+    bindings = mock_select.return_value.application.key_bindings.bindings
+    handlers = {binding.keys[0]: binding.handler for binding in bindings if binding.keys[0] in ("r", "b", "q")}
+    assert set(handlers) == {"r", "b", "q"}
+
+    event = Mock()
+    handlers["r"](event)
+    event.app.exit.assert_called_once_with(result=REFRESH_VALUE)
+    handlers["b"](event)
+    event.app.exit.assert_called_with(result="navigation:back")
@@ -0,0 +1,114 @@
+"""Tests for the background prefetch scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from lazy_ecs.core.prefetch import Prefetcher
+
+
+@pytest.fixture
+def prefetcher():
+    prefetcher = Prefetcher(max_workers=4, api_budget={"describe_services": 1})
+    yield prefetcher
+    prefetcher.shutdown()
+
+
+def test_schedule_runs_operation(prefetcher):
+    future = prefetcher.schedule("services:prod", "describe_services", lambda: "loaded")
+
+    assert future.result(timeout=1) == "loaded"
+
+
+def test_schedule_same_key_runs_once(prefetcher):
+    release = threading.Event()
+    calls = []
+
+    def operation() -> None:
+        calls.append(1)
+        release.wait(1)
+
+    first = prefetcher.schedule("services:prod", "describe_services", operation)
+    second = prefetcher.schedule("services:prod", "describe_services", operation)
+    release.set()
+    first.result(timeout=1)
+
+    assert first is second
+    assert calls == [1]
+
+
+def test_api_budget_limits_concurrency(prefetcher):
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def operation() -> None:
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+
+    futures = [prefetcher.schedule(f"services:{i}", "describe_services", operation) for i in range(4)]
+    for future in futures:
+        future.result(timeout=1)
+
+    assert max(peak) == 1
+
+
+def test_cancel_outside_drops_queued_jobs_from_other_scopes(prefetcher):
+    release = threading.Event()
+    running = prefetcher.schedule("services:prod", "describe_services", lambda: release.wait(1), scope="prod")
+    other = prefetcher.schedule("services:staging", "describe_services", lambda: "staging", scope="staging")
+    nested = prefetcher.schedule("tasks:prod/web", "describe_services", lambda: "web", scope="prod/web")
+
+    prefetcher.cancel_outside("prod")
+    release.set()
+
+    assert running.result(timeout=1) is True
+    assert other.cancelled()
+    assert nested.result(timeout=1) == "web"
+
+
+def test_settle_waits_for_running_job(prefetcher):
+    done = []
+
+    def operation() -> None:
+        time.sleep(0.05)
+        done.append(1)
+
+    prefetcher.schedule("services:prod", "describe_services", operation)
+    prefetcher.settle("services:prod")
+
+    assert done == [1]
+
+
+def test_settle_cancels_queued_job(prefetcher):
+    release = threading.Event()
+    prefetcher.schedule("services:prod", "describe_services", lambda: release.wait(1))
+    queued = prefetcher.schedule("services:staging", "describe_services", lambda: "staging")
+
+    prefetcher.settle("services:staging")
+    release.set()
+
+    assert queued.cancelled()
+
+
+def test_failed_job_does_not_block_queue(prefetcher):
+    def fail() -> None:
+        raise RuntimeError("AccessDenied")
+
+    failed = prefetcher.schedule("services:prod", "describe_services", fail)
+    after = prefetcher.schedule("services:staging", "describe_services", lambda: "ok")
+
+    assert after.result(timeout=1) == "ok"
+    assert isinstance(failed.exception(timeout=1), RuntimeError)
+
+
+def test_shutdown_rejects_new_jobs():
+    prefetcher = Prefetcher()
+    prefetcher.shutdown()
+
+    assert prefetcher.schedule("services:prod", "describe_services", lambda: "x").cancelled()
@@ -0,0 +1,50 @@
+"""Startup import budget: `lazy-ecs --help` must not pay for boto3, rich or questionary."""
+
+import subprocess
+import sys
+
+# Generous enough for slow CI runners; importing boto3 alone takes several times this
+IMPORT_BUDGET_US = 100_000
+HEAVY_MODULES = ("boto3", "botocore", "rich", "questionary", "prompt_toolkit")
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run `code` under -X importtime and return cumulative microseconds per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative_us)
+    return times
+
+
+def test_package_import_is_within_budget():
+    times = _import_times("import lazy_ecs")
+
+    assert times["lazy_ecs"] < IMPORT_BUDGET_US
+    assert not [module for module in times if module.split(".")[0] in HEAVY_MODULES]
+
+
+def test_help_does_not_import_heavy_dependencies():
+    times = _import_times(
+        "import sys; sys.argv = ['lazy-ecs', '--help']\n"
+        "import lazy_ecs\n"
+        "try:\n"
+        "    lazy_ecs.main()\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+
+    assert "lazy_ecs" in times
+    assert not [module for module in times if module.split(".")[0] in HEAVY_MODULES]
+
+
+def test_scripting_commands_do_not_import_the_interactive_ui():
+    times = _import_times("import lazy_ecs.commands")
+
+    assert "lazy_ecs.commands" in times
+    assert not [module for module in times if module.split(".")[0] in ("rich", "questionary", "prompt_toolkit")]
@@ -0,0 +1,189 @@
+"""Tests for ServiceService listing and describe batching."""
+
+import time
+from datetime import datetime
+from threading import Lock
+from unittest.mock import Mock
+
+from lazy_ecs.core.disk_cache import DiskCache
+from lazy_ecs.features.service.service import DESCRIPTION_MAX_AGE_SECONDS, ServiceService, ServiceSnapshot
+
+
+def _service(name) -> dict:
+    return {"serviceName": name, "runningCount": 1, "desiredCount": 1, "pendingCount": 0}
+
+
+def test_get_services_follows_all_pages():
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/a", "arn:aws:ecs:us-east-1:123:service/prod/b"]},
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/c"]},
+    ]
+
+    names = ServiceService(client).get_services("prod")
+
+    assert names == ["a", "b", "c"]
+    client.get_paginator.assert_called_once_with("list_services")
+
+
+def test_describe_services_chunks_requests_by_ten():
+    client = Mock()
+    client.describe_services.side_effect = lambda **kwargs: {
+        "services": [_service(name) for name in kwargs["services"]]
+    }
+    names = [f"svc-{i}" for i in range(23)]
+
+    result = ServiceService(client).describe_services("prod", names)
+
+    chunk_sizes = sorted(len(call.kwargs["services"]) for call in client.describe_services.call_args_list)
+    assert chunk_sizes == [3, 10, 10]
+    assert [info["name"] for info in result.results] == [f"✅ {name} (1/1)" for name in names]
+
+
+def test_describe_services_reports_services_the_response_lists_as_failures():
+    client = Mock()
+    client.describe_services.return_value = {
+        "services": [_service("a")],
+        "failures": [
+            {"arn": "arn:aws:ecs:us-east-1:123:service/prod/gone", "reason": "MISSING"},
+            {"arn": "arn:aws:ecs:us-east-1:123:service/prod/deleted", "reason": "MISSING"},
+        ],
+    }
+
+    result = ServiceService(client).describe_services("prod", ["a", "gone", "deleted"])
+
+    assert [info["name"] for info in result.results] == ["✅ a (1/1)"]
+    assert [(failure.items, failure.reason) for failure in result.failures] == [(["gone", "deleted"], "MISSING")]
+
+
+def test_service_inventory_snapshot_saved_only_when_complete(tmp_path):
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/a"]}
+    ]
+    client.describe_services.side_effect = [RuntimeError("ThrottlingException"), {"services": [_service("a")]}]
+    service = ServiceService(client, DiskCache(tmp_path))
+
+    service.refresh_service_inventory("prod")
+    assert service.get_cached_service_info("prod") is None
+
+    service.refresh_service_inventory("prod")
+    assert service.get_cached_service_info("prod") == [
+        {"name": "✅ a (1/1)", "status": "HEALTHY", "running_count": 1, "desired_count": 1, "pending_count": 0}
+    ]
+
+
+def test_service_snapshot_answers_from_one_description():
+    created = datetime(2024, 1, 1, 12, 0)
+    snapshot = ServiceSnapshot(
+        "prod",
+        {
+            "serviceName": "web",
+            "taskDefinition": "arn:aws:ecs:us-east-1:123:task-definition/web:3",
+            "runningCount": 1,
+            "desiredCount": 2,
+            "pendingCount": 1,
+            "deployments": [{"id": "ecs-svc/1", "rolloutState": "IN_PROGRESS"}],
+            "events": [
+                {"id": "1", "createdAt": created, "message": "(service web) has started 1 tasks"},
+                {"id": "2", "createdAt": created.replace(hour=13), "message": "(service web) failed to launch"},
+            ],
+        },
+    )
+
+    assert snapshot.service_name == "web"
+    assert snapshot.desired_task_definition_arn == "arn:aws:ecs:us-east-1:123:task-definition/web:3"
+    assert (snapshot.running_count, snapshot.desired_count, snapshot.pending_count) == (1, 2, 1)
+    assert snapshot.deployments[0]["rolloutState"] == "IN_PROGRESS"
+    assert [event["id"] for event in snapshot.events] == ["2", "1"]
+    assert snapshot.info["status"] == "SCALING"
+
+
+def test_get_service_snapshot_reuses_listing_description():
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/a"]}
+    ]
+    client.describe_services.return_value = {"services": [_service("a")]}
+    service = ServiceService(client)
+
+    service.get_service_info("prod")
+    snapshot = service.get_service_snapshot("prod", "a")
+
+    assert snapshot is not None
+    assert snapshot.service_name == "a"
+    client.describe_services.assert_called_once()
+
+
+def test_get_service_snapshot_describes_again_once_the_listing_is_old(monkeypatch):
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/a"]}
+    ]
+    client.describe_services.return_value = {"services": [_service("a")]}
+    service = ServiceService(client)
+    now = [1000.0]
+    monkeypatch.setattr("lazy_ecs.features.service.service.time.monotonic", lambda: now[0])
+
+    service.get_service_info("prod")
+    now[0] += DESCRIPTION_MAX_AGE_SECONDS + 1
+    service.get_service_snapshot("prod", "a")
+
+    assert client.describe_services.call_count == 2
+
+
+def test_refresh_service_snapshot_describes_again():
+    client = Mock()
+    client.describe_services.side_effect = [
+        {"services": [_service("a")]},
+        {"services": [{**_service("a"), "runningCount": 0}]},
+    ]
+    service = ServiceService(client)
+
+    first = service.get_service_snapshot("prod", "a")
+    refreshed = service.refresh_service_snapshot("prod", "a")
+
+    assert first is not None and first.running_count == 1
+    assert refreshed is not None and refreshed.running_count == 0
+    assert service.get_service_snapshot("prod", "a") == refreshed
+
+
+def test_prefetched_inventory_is_used_once():
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/web"]}
+    ]
+    client.describe_services.return_value = {"services": [_service("web")]}
+    service = ServiceService(client)
+
+    service.prefetch_service_inventory("prod")
+    assert service.get_service_inventory("prod").results[0]["name"] == "✅ web (1/1)"
+    assert client.describe_services.call_count == 1
+
+    service.get_service_inventory("prod")
+    assert client.describe_services.call_count == 2
+
+
+def test_prefetch_describes_one_chunk_at_a_time():
+    in_flight = [0, 0]  # current, peak
+    lock = Lock()
+
+    def describe_services(**kwargs: list[str]) -> dict:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return {"services": [_service(name) for name in kwargs["services"]]}
+
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": [f"arn:aws:ecs:us-east-1:123:service/prod/svc-{i}" for i in range(40)]}
+    ]
+    client.describe_services.side_effect = describe_services
+
+    ServiceService(client).prefetch_service_inventory("prod")
+
+    assert client.describe_services.call_count == 4
+    assert in_flight[1] == 1
@@ -0,0 +1,98 @@
+"""Tests for bulk forced deployments."""
+
+import threading
+import time
+from threading import Event
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lazy_ecs.features.service import actions
+from lazy_ecs.features.service.actions import ServiceActions
+
+
+def _client_error(code) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "UpdateService")
+
+
+class StubECSClient:
+    """Fails update_service from a per-service script of error codes, tracking concurrent calls."""
+
+    def __init__(self, errors: dict[str, list[str]] | None = None, delay: float = 0) -> None:
+        self.errors = errors or {}
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def update_service(self, **kwargs: object) -> dict:
+        service = str(kwargs["service"])
+        with self._lock:
+            self.calls.append(service)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        script = self.errors.get(service)
+        if script:
+            raise _client_error(script.pop(0))
+        return {"service": {"serviceName": service}}
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(actions, "RETRY_BASE_DELAY_SECONDS", 0)
+
+
+def test_deployments_respect_the_concurrency_cap():
+    client = StubECSClient(delay=0.02)
+    names = [f"svc-{i}" for i in range(12)]
+
+    outcomes = ServiceActions(client).force_new_deployments("prod", names, max_concurrency=3)
+
+    assert [outcome.service_name for outcome in outcomes] == names
+    assert all(outcome.status == "succeeded" for outcome in outcomes)
+    assert client.max_in_flight == 3
+
+
+def test_throttled_calls_are_retried_and_other_errors_fail_at_once():
+    client = StubECSClient(
+        {"api": ["ThrottlingException", "ThrottlingException"], "gone": ["ServiceNotFoundException"]}
+    )
+    updates = []
+
+    outcomes = ServiceActions(client).force_new_deployments(
+        "prod", ["api", "gone"], on_update=lambda outcome: updates.append((outcome.service_name, outcome.status))
+    )
+
+    api, gone = outcomes
+    assert (api.status, api.attempts) == ("succeeded", 3)
+    assert (gone.status, gone.attempts) == ("failed", 1)
+    assert "ServiceNotFoundException" in (gone.error or "")
+    assert [status for name, status in updates if name == "api"] == ["deploying", "retrying", "retrying", "succeeded"]
+
+
+def test_persistent_throttling_gives_up_after_max_attempts():
+    client = StubECSClient({"api": ["ThrottlingException"] * 10})
+
+    (outcome,) = ServiceActions(client).force_new_deployments("prod", ["api"])
+
+    assert (outcome.status, outcome.attempts) == ("failed", actions.DEPLOY_MAX_ATTEMPTS)
+
+
+def test_stopping_cancels_services_that_have_not_started():
+    client = StubECSClient()
+    stop = Event()
+
+    def stop_after_first(outcome) -> None:
+        if outcome.status == "succeeded":
+            stop.set()
+
+    outcomes = ServiceActions(client).force_new_deployments(
+        "prod", ["a", "b", "c"], max_concurrency=1, on_update=stop_after_first, stop=stop
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["succeeded", "cancelled", "cancelled"]
+    assert client.calls == ["a"]
@@ -0,0 +1,140 @@
+"""Tests for the live cluster dashboard."""
+
+from datetime import datetime, timedelta
+
+from lazy_ecs.features.service.dashboard import (
+    DASHBOARD_MIN_INTERVAL_SECONDS,
+    SERVICE_LIST_TTL_SECONDS,
+    ClusterDashboard,
+    dashboard_row,
+)
+from lazy_ecs.features.service.service import ServiceService, ServiceSnapshot
+from lazy_ecs.features.service.ui import _dashboard_cells, _DashboardRenderer
+
+
+def _service(name, running=2, pending=0, rollout_state="COMPLETED", events=()) -> dict:
+    return {
+        "serviceName": name,
+        "runningCount": running,
+        "desiredCount": 2,
+        "pendingCount": pending,
+        "deployments": [
+            {"id": f"{name}-1", "status": "PRIMARY", "rolloutState": rollout_state, "runningCount": running}
+        ],
+        "events": list(events),
+    }
+
+
+class StubECSClient:
+    """Describes services from a mutable name -> description map, counting calls."""
+
+    def __init__(self, services: dict[str, dict]) -> None:
+        self.services = services
+        self.calls: list[tuple[str, int]] = []
+
+    def get_paginator(self, operation: str) -> "StubECSClient":
+        assert operation == "list_services"
+        return self
+
+    def paginate(self, **_kwargs: object) -> list[dict]:
+        self.calls.append(("list_services", 0))
+        return [{"serviceArns": [f"arn:aws:ecs:us-east-1:123:service/prod/{name}" for name in self.services]}]
+
+    def describe_services(self, **kwargs: list[str]) -> dict:
+        self.calls.append(("describe_services", len(kwargs["services"])))
+        return {"services": [self.services[name] for name in kwargs["services"] if name in self.services]}
+
+
+def test_dashboard_row_tracks_rollout_and_recent_failures():
+    failure = {"id": "e1", "createdAt": datetime(2024, 1, 1, 12, 0), "message": "(service web) failed to launch"}
+    snapshot = ServiceSnapshot(
+        "prod", _service("web", running=1, pending=1, rollout_state="IN_PROGRESS", events=[failure])
+    )
+
+    row = dashboard_row(snapshot, now=datetime(2024, 1, 1, 12, 30))
+
+    assert (row.icon, row.status) == ("⚠️", "SCALING")
+    assert row.rollout_state == "IN_PROGRESS"
+    assert row.rolling_out
+    assert row.last_failure_at == datetime(2024, 1, 1, 12, 0)
+    assert row.recent_failure
+    assert row.needs_attention
+
+
+def test_failure_marker_clears_once_the_failure_ages_out():
+    failed_at = datetime(2024, 1, 1, 12, 0)
+    failure = {"id": "e1", "createdAt": failed_at, "message": "(service web) failed to launch"}
+    snapshot = ServiceSnapshot("prod", _service("web", events=[failure]))
+
+    fresh = dashboard_row(snapshot, now=failed_at + timedelta(minutes=59))
+    aged = dashboard_row(snapshot, now=failed_at + timedelta(minutes=61))
+
+    assert fresh.recent_failure
+    assert not aged.recent_failure
+    # The aged row differs from the fresh one, so a poll reports it changed and its cells are rebuilt
+    assert aged != fresh
+    assert "❗" in str(_dashboard_cells(fresh)[-1])
+    assert "❗" not in str(_dashboard_cells(aged)[-1])
+
+
+def test_polls_describe_in_batches_and_report_only_changed_rows():
+    services = {f"svc-{i:02d}": _service(f"svc-{i:02d}") for i in range(25)}
+    client = StubECSClient(services)
+    now = [0.0]
+    dashboard = ClusterDashboard(ServiceService(client), "prod", clock=lambda: now[0])
+
+    first = dashboard.poll()
+    services["svc-03"] = _service("svc-03", running=1, pending=1, rollout_state="IN_PROGRESS")
+    now[0] = 10
+    second = dashboard.poll()
+    third = dashboard.poll()
+
+    assert len(first.changed) == 25
+    assert second.changed == {"svc-03"}
+    assert not third
+    # The service list is fetched once; each of the 3 polls describes all 25 services in 3 calls
+    assert [name for name, _size in client.calls].count("list_services") == 1
+    describe_sizes = sorted(size for name, size in client.calls if name == "describe_services")
+    assert describe_sizes == [5] * 3 + [10] * 6
+    assert dashboard.sorted_rows()[0].service_name == "svc-03"
+
+
+def test_removed_services_disappear_once_the_list_is_refreshed():
+    services = {"a": _service("a"), "b": _service("b")}
+    now = [0.0]
+    dashboard = ClusterDashboard(ServiceService(StubECSClient(services)), "prod", clock=lambda: now[0])
+    dashboard.poll()
+
+    del services["b"]
+    now[0] = SERVICE_LIST_TTL_SECONDS
+    update = dashboard.poll()
+
+    assert update.removed == {"b"}
+    assert list(dashboard.rows) == ["a"]
+
+
+def test_interval_backs_off_while_quiet_and_resets_during_rollouts():
+    dashboard = ClusterDashboard(ServiceService(StubECSClient({"a": _service("a")})), "prod")
+    dashboard.poll()
+    quiet = dashboard.poll()
+
+    assert dashboard.next_interval(quiet) > DASHBOARD_MIN_INTERVAL_SECONDS
+
+    dashboard.rows["a"] = dashboard_row(ServiceSnapshot("prod", _service("a", rollout_state="IN_PROGRESS")))
+    assert dashboard.next_interval(quiet) == DASHBOARD_MIN_INTERVAL_SECONDS
+
+
+def test_renderer_reuses_cells_of_unchanged_rows():
+    services = {"a": _service("a"), "b": _service("b")}
+    dashboard = ClusterDashboard(ServiceService(StubECSClient(services)), "prod")
+    renderer = _DashboardRenderer("prod")
+    renderer.render(dashboard, dashboard.poll(), max_rows=10)
+    cells_a, cells_b = renderer._cells["a"], renderer._cells["b"]
+
+    services["b"] = _service("b", running=1)
+    table = renderer.render(dashboard, dashboard.poll(), max_rows=1)
+
+    assert renderer._cells["a"] is cells_a
+    assert renderer._cells["b"] is not cells_b
+    assert table.row_count == 1
+    assert "1 more not shown" in str(table.caption)
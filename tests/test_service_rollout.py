@@ -0,0 +1,191 @@
+"""Tests for watching a service rollout."""
+
+import io
+import json
+from datetime import datetime
+from threading import Event
+from unittest.mock import Mock
+
+from lazy_ecs.commands import wait_for_rollout
+from lazy_ecs.core.polling import AdaptiveInterval
+from lazy_ecs.features.service import rollout
+from lazy_ecs.features.service.rollout import (
+    FAILED,
+    IN_PROGRESS,
+    ROLLOUT_EXIT_STATUSES,
+    STEADY,
+    new_events_since,
+    watch_rollout,
+)
+from lazy_ecs.features.service.service import ServiceSnapshot
+
+
+def _event(event_id, minute, message) -> dict:
+    return {"id": event_id, "createdAt": datetime(2024, 1, 1, 12, minute), "message": f"(service web) {message}"}
+
+
+def _service(running, pending=0, deployments=None, events=()) -> dict:
+    return {
+        "serviceName": "web",
+        "runningCount": running,
+        "desiredCount": 2,
+        "pendingCount": pending,
+        "deployments": deployments or [{"id": "new", "status": "PRIMARY", "runningCount": running, "desiredCount": 2}],
+        # describe_services lists the most recent event first
+        "events": list(events)[::-1],
+    }
+
+
+def _rolling(new_running, rollout_state="IN_PROGRESS") -> list[dict]:
+    return [
+        {
+            "id": "new",
+            "status": "PRIMARY",
+            "rolloutState": rollout_state,
+            "runningCount": new_running,
+            "desiredCount": 2,
+        },
+        {"id": "old", "status": "ACTIVE", "rolloutState": "COMPLETED", "runningCount": 2, "desiredCount": 0},
+    ]
+
+
+class RecordingStop(Event):
+    """Stop event that records the waits and never blocks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.waits: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout or 0)
+        return self.is_set()
+
+
+def _service_service(*services: dict) -> Mock:
+    service_service = Mock()
+    service_service.refresh_service_snapshot.side_effect = [ServiceSnapshot("prod", service) for service in services]
+    return service_service
+
+
+STARTED = _event("e1", 0, "has started 2 tasks: (task a) (task b).")
+DRAINING = _event("e2", 1, "has stopped 2 running tasks: (task c) (task d).")
+STEADY_EVENT = _event("e3", 2, "has reached a steady state.")
+
+
+def test_watch_reports_only_new_events_until_steady():
+    first = ServiceSnapshot("prod", _service(2, 2, _rolling(0), [STARTED]))
+    service_service = _service_service(
+        _service(2, 2, _rolling(0), [STARTED]),
+        _service(4, 0, _rolling(2), [STARTED]),
+        _service(2, 0, _rolling(2, "COMPLETED")[:1], [STARTED, DRAINING, STEADY_EVENT]),
+    )
+    stop = RecordingStop()
+
+    progress = list(watch_rollout(service_service, first, stop, interval=AdaptiveInterval(1, 8)))
+
+    assert [(item.state, [event["id"] for event in item.new_events]) for item in progress] == [
+        (IN_PROGRESS, []),
+        (IN_PROGRESS, []),
+        (STEADY, ["e2", "e3"]),
+    ]
+    assert progress[-1].exit_status == 0
+    # Nothing changed after the first poll, so it backs off; once all new tasks run it polls at the minimum
+    assert stop.waits == [1, 2, 1]
+
+
+def test_failed_rollout_ends_the_watch():
+    first = ServiceSnapshot("prod", _service(2, 1, _rolling(0)))
+    service_service = _service_service(_service(2, 0, _rolling(0, "FAILED")))
+
+    progress = list(watch_rollout(service_service, first, RecordingStop()))
+
+    assert progress[-1].state == FAILED
+    assert progress[-1].exit_status == 1
+
+
+def _rolled_back(rollback_state="IN_PROGRESS", keep_failed=True) -> list[dict]:
+    rollback = {"id": "old", "status": "PRIMARY", "rolloutState": rollback_state, "runningCount": 2, "desiredCount": 2}
+    failed = {"id": "new", "status": "ACTIVE", "rolloutState": "FAILED", "runningCount": 0, "desiredCount": 0}
+    return [rollback, failed] if keep_failed else [rollback]
+
+
+def test_circuit_breaker_rollback_fails_the_watch():
+    first = ServiceSnapshot("prod", _service(2, 1, _rolling(0)))
+    service_service = _service_service(_service(2, 0, _rolled_back()))
+
+    progress = list(watch_rollout(service_service, first, RecordingStop()))
+
+    assert progress[-1].state == FAILED
+    assert progress[-1].exit_status == 1
+
+
+def test_settled_rollback_is_not_mistaken_for_a_steady_rollout(monkeypatch):
+    """The failed deployment may be gone by the next poll, leaving only the settled rollback."""
+    monkeypatch.setattr(rollout, "ROLLOUT_MIN_INTERVAL_SECONDS", 0)
+    client = Mock()
+    client.describe_services.side_effect = [
+        {"services": [_service(2, 1, _rolling(0))]},
+        {"services": [_service(2, 0, _rolled_back("COMPLETED", keep_failed=False))]},
+    ]
+
+    status = wait_for_rollout(client, "prod", "web", timeout=60, out=io.StringIO())
+
+    assert status == ROLLOUT_EXIT_STATUSES[FAILED]
+
+
+def test_timeout_leaves_the_rollout_in_progress():
+    now = [0.0]
+
+    def clock() -> float:
+        return now[0]
+
+    class AdvancingStop(RecordingStop):
+        def wait(self, timeout: float | None = None) -> bool:
+            now[0] += timeout or 0
+            return super().wait(timeout)
+
+    first = ServiceSnapshot("prod", _service(2, 1, _rolling(0)))
+    service_service = Mock()
+    service_service.refresh_service_snapshot.return_value = first
+
+    progress = list(watch_rollout(service_service, first, AdvancingStop(), timeout=30, clock=clock))
+
+    assert progress[-1].state == IN_PROGRESS
+    assert progress[-1].exit_status == 2
+    assert now[0] == 30
+
+
+def test_new_events_since_returns_oldest_first():
+    events = [{"id": "e3"}, {"id": "e2"}, {"id": "e1"}]
+
+    assert new_events_since(events, "e1") == [{"id": "e2"}, {"id": "e3"}]
+    assert new_events_since(events, "e3") == []
+
+
+def test_wait_command_streams_status_records_and_exit_status(monkeypatch):
+    monkeypatch.setattr(rollout, "ROLLOUT_MIN_INTERVAL_SECONDS", 0)
+    client = Mock()
+    client.describe_services.side_effect = [
+        {"services": [_service(2, 1, _rolling(1), [STARTED])]},
+        {"services": [_service(2, 0, None, [STARTED, STEADY_EVENT])]},
+    ]
+    out = io.StringIO()
+
+    status = wait_for_rollout(client, "prod", "web", timeout=60, out=out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert status == 0
+    assert [(record["kind"], record.get("state") or record["id"]) for record in records] == [
+        ("status", IN_PROGRESS),
+        ("event", "e3"),
+        ("status", STEADY),
+    ]
+    assert records[0]["deployments"][0]["rollout_state"] == "IN_PROGRESS"
+
+
+def test_wait_command_without_any_progress_exits_as_unfinished(monkeypatch):
+    client = Mock()
+    client.describe_services.return_value = {"services": [_service(2, 1, _rolling(0))]}
+    monkeypatch.setattr("lazy_ecs.commands.watch_rollout", lambda *_args, **_kwargs: iter(()))
+
+    assert wait_for_rollout(client, "prod", "web", timeout=60, out=io.StringIO()) == 2
@@ -1,12 +1,15 @@
 """Tests for ServiceUI class."""
 
+from concurrent.futures import Future
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 
+from lazy_ecs.core.batching import BatchResult, ChunkFailure
+from lazy_ecs.core.navigation import REFRESH_VALUE
 from lazy_ecs.features.service.actions import ServiceActions
-from lazy_ecs.features.service.service import ServiceService
+from lazy_ecs.features.service.service import ServiceService, ServiceSnapshot
 from lazy_ecs.features.service.ui import ServiceUI, _get_event_type_style
 
 
@@ -27,16 +30,18 @@ def service_ui(mock_ecs_client):
 @patch("lazy_ecs.features.service.ui.questionary.select")
 def test_select_service_with_services(mock_select, service_ui):
     """Test service selection with available services."""
-    service_ui.service_service.get_service_info = Mock(
-        return_value=[
-            {
-                "name": "✅ web-api (2/2)",
-                "status": "HEALTHY",
-                "running_count": 2,
-                "desired_count": 2,
-                "pending_count": 0,
-            }
-        ]
+    service_ui.service_service.get_service_inventory = Mock(
+        return_value=BatchResult(
+            results=[
+                {
+                    "name": "✅ web-api (2/2)",
+                    "status": "HEALTHY",
+                    "running_count": 2,
+                    "desired_count": 2,
+                    "pending_count": 0,
+                }
+            ]
+        )
     )
     mock_select.return_value.ask.return_value = "service:web-api"
 
@@ -48,7 +53,7 @@ def test_select_service_with_services(mock_select, service_ui):
 
 def test_select_service_no_services(service_ui):
     """Test service selection with no services available."""
-    service_ui.service_service.get_service_info = Mock(return_value=[])
+    service_ui.service_service.get_service_inventory = Mock(return_value=BatchResult())
 
     selected = service_ui.select_service("production")
 
@@ -58,16 +63,18 @@ def test_select_service_no_services(service_ui):
 @patch("lazy_ecs.features.service.ui.questionary.select")
 def test_select_service_navigation_back(mock_select, service_ui):
     """Test service selection navigation back."""
-    service_ui.service_service.get_service_info = Mock(
-        return_value=[
-            {
-                "name": "✅ web-api (2/2)",
-                "status": "HEALTHY",
-                "running_count": 2,
-                "desired_count": 2,
-                "pending_count": 0,
-            }
-        ]
+    service_ui.service_service.get_service_inventory = Mock(
+        return_value=BatchResult(
+            results=[
+                {
+                    "name": "✅ web-api (2/2)",
+                    "status": "HEALTHY",
+                    "running_count": 2,
+                    "desired_count": 2,
+                    "pending_count": 0,
+                }
+            ]
+        )
     )
     mock_select.return_value.ask.return_value = "navigation:back"
 
@@ -77,6 +84,61 @@ def test_select_service_navigation_back(mock_select, service_ui):
     mock_select.assert_called_once()
 
 
+@patch("lazy_ecs.features.service.ui.print_warning")
+def test_select_service_reports_failed_chunks(mock_warning, service_ui):
+    """Test that chunks which failed to load are reported while the rest remain selectable."""
+    service_ui.service_service.get_service_inventory = Mock(
+        return_value=BatchResult(failures=[ChunkFailure(items=["a", "b"], reason="ThrottlingException")])
+    )
+
+    selected = service_ui.select_service("production")
+
+    assert selected == "navigation:back"
+    mock_warning.assert_called_once_with("Could not load 2 services: ThrottlingException")
+
+
+@patch("lazy_ecs.core.base.select_with_navigation")
+def test_select_service_shows_snapshot_and_refreshes_on_request(mock_select, service_ui):
+    """Test that a cached service snapshot is shown while fresh status loads in the background."""
+    snapshot = [{"name": "✅ web-api (2/2)", "status": "HEALTHY", "running_count": 2, "desired_count": 2}]
+    fresh = [{"name": "⚠️ web-api (1/2)", "value": "service:web-api"}]
+    service_ui.service_service.get_cached_service_info = Mock(return_value=snapshot)
+    service_ui.service_service.get_service_inventory = Mock()
+    refreshed: Future = Future()
+    refreshed.set_result(fresh)
+    service_ui.run_in_background = Mock(side_effect=[refreshed, Future()])
+    mock_select.side_effect = [REFRESH_VALUE, "service:web-api"]
+
+    selected = service_ui.select_service("production")
+
+    assert selected == "service:web-api"
+    service_ui.service_service.get_service_inventory.assert_not_called()
+    assert mock_select.call_args_list[0][0][1] == [{"name": "✅ web-api (2/2)", "value": "service:web-api"}]
+    assert mock_select.call_args_list[1][0][1] == fresh
+
+
+@patch("lazy_ecs.core.base.select_with_navigation")
+def test_select_service_uses_prefetched_inventory_without_fetching_again(mock_select, service_ui, mock_ecs_client):
+    """Test that a fresh prefetched inventory is shown instead of the snapshot plus a second fetch."""
+    mock_ecs_client.get_paginator.return_value.paginate.return_value = [
+        {"serviceArns": ["arn:aws:ecs:us-east-1:123:service/prod/web-api"]}
+    ]
+    mock_ecs_client.describe_services.return_value = {
+        "services": [{"serviceName": "web-api", "runningCount": 1, "desiredCount": 2, "pendingCount": 0}]
+    }
+    service_ui.service_service.prefetch_service_inventory("production")
+    service_ui.service_service.get_cached_service_info = Mock(return_value=[{"name": "✅ web-api (2/2)"}])
+    service_ui.run_in_background = Mock()
+    mock_select.return_value = "service:web-api"
+
+    service_ui.select_service("production")
+
+    assert mock_ecs_client.describe_services.call_count == 1
+    service_ui.run_in_background.assert_not_called()
+    assert mock_select.call_args[0][1] == [{"name": "⚠️ web-api (1/2)", "value": "service:web-api"}]
+    assert mock_select.call_args[0][3] is None
+
+
 @patch("lazy_ecs.core.base.select_with_navigation")
 def test_select_service_action_with_tasks(mock_select, service_ui):
     """Test service action selection with tasks available."""
@@ -196,3 +258,49 @@ def test_service_name_truncation_shows_end(mock_print, service_ui):
     mock_print.assert_called_once()
     # We can't easily test the exact truncation without complex argument inspection,
     # but we know the logic truncates to show the last 15 chars with "..." prefix
+
+
+def test_display_service_events_from_snapshot(service_ui):
+    """Test that events come from the snapshot without another describe_services call."""
+    snapshot = ServiceSnapshot(
+        "test-cluster",
+        {"serviceName": "web-api", "events": [{"id": "1", "createdAt": datetime(2024, 1, 15), "message": "steady"}]},
+    )
+    service_ui.service_service.get_service_events = Mock()
+
+    service_ui.display_service_events("test-cluster", "web-api", snapshot)
+
+    service_ui.service_service.get_service_events.assert_not_called()
+
+
+@patch("lazy_ecs.features.service.ui.console")
+@patch("lazy_ecs.features.service.ui.questionary")
+def test_bulk_force_deployment_by_pattern(mock_questionary, _mock_console, service_ui, mock_ecs_client):
+    """Test that services matching a pattern are redeployed with the chosen concurrency."""
+    mock_ecs_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "serviceArns": [
+                f"arn:aws:ecs:us-east-1:123:service/production/{name}" for name in ("api-orders", "api-users", "worker")
+            ]
+        }
+    ]
+    mock_questionary.select.return_value.ask.return_value = "pattern"
+    mock_questionary.text.return_value.ask.side_effect = ["api-*", "8"]
+    mock_questionary.confirm.return_value.ask.return_value = True
+    service_ui.service_actions.force_new_deployments = Mock(return_value=[])
+
+    service_ui.handle_bulk_force_deployment("production")
+
+    args = service_ui.service_actions.force_new_deployments.call_args.args
+    assert args[:3] == ("production", ["api-orders", "api-users"], 8)
+    mock_ecs_client.describe_services.assert_not_called()
+
+
+def test_bulk_deploy_choice_is_offered_only_with_several_services():
+    from lazy_ecs.features.service.ui import BULK_DEPLOY_VALUE, _service_choices
+
+    one = _service_choices([{"name": "✅ web (1/1)"}])
+    two = _service_choices([{"name": "✅ web (1/1)"}, {"name": "✅ api (1/1)"}])
+
+    assert BULK_DEPLOY_VALUE not in [choice["value"] for choice in one]
+    assert two[-1]["value"] == BULK_DEPLOY_VALUE
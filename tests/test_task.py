@@ -0,0 +1,132 @@
+"""Tests for the TaskService list/describe pipeline."""
+
+import threading
+from unittest.mock import Mock
+
+from lazy_ecs.features.task.task import TaskService
+
+
+def _task(arn) -> dict:
+    return {
+        "taskArn": arn,
+        "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:task-definition/batch:3",
+        "lastStatus": "RUNNING",
+        "containers": [],
+    }
+
+
+def _task_arns(count, prefix="task") -> list[str]:
+    return [f"arn:aws:ecs:us-east-1:123456789012:task/batch/{prefix}-{i:03d}" for i in range(count)]
+
+
+def test_iter_task_arns_follows_next_token():
+    client = Mock()
+    client.list_tasks.side_effect = [
+        {"taskArns": _task_arns(100), "nextToken": "page-2"},
+        {"taskArns": _task_arns(50, "more")},
+    ]
+
+    arns = list(TaskService(client).iter_task_arns("batch", "worker"))
+
+    assert len(arns) == 150
+    assert client.list_tasks.call_args_list[0].kwargs == {"cluster": "batch", "serviceName": "worker"}
+    assert client.list_tasks.call_args_list[1].kwargs["nextToken"] == "page-2"
+
+
+def test_get_task_info_describes_in_chunks_of_100():
+    client = Mock()
+    client.list_tasks.side_effect = [
+        {"taskArns": _task_arns(100), "nextToken": "page-2"},
+        {"taskArns": _task_arns(100, "second"), "nextToken": "page-3"},
+        {"taskArns": _task_arns(50, "third")},
+    ]
+    client.describe_tasks.side_effect = lambda **kwargs: {"tasks": [_task(arn) for arn in kwargs["tasks"]]}
+
+    task_info = TaskService(client).get_task_info("batch", "worker", None)
+
+    assert len(task_info) == 250
+    chunk_sizes = sorted(len(call.kwargs["tasks"]) for call in client.describe_tasks.call_args_list)
+    assert chunk_sizes == [50, 100, 100]
+
+
+def test_get_task_inventory_keeps_list_order_and_reports_failed_chunks():
+    slow_chunk_release = threading.Event()
+    client = Mock()
+    client.list_tasks.return_value = {"taskArns": _task_arns(250)}
+
+    def describe_tasks(**kwargs: list[str]) -> dict:
+        first = kwargs["tasks"][0]
+        if first.endswith("task-000"):
+            # The first chunk finishes last, yet its tasks still come first
+            assert slow_chunk_release.wait(timeout=5)
+        if first.endswith("task-100"):
+            slow_chunk_release.set()
+            raise RuntimeError("ThrottlingException")
+        return {"tasks": [_task(arn) for arn in kwargs["tasks"]]}
+
+    client.describe_tasks.side_effect = describe_tasks
+
+    inventory = TaskService(client).get_task_inventory("batch", "worker", None)
+
+    arns = _task_arns(250)
+    assert [info["value"] for info in inventory.results] == arns[:100] + arns[200:]
+    assert len(inventory.failures) == 1
+    assert inventory.failures[0].items == arns[100:200]
+    assert inventory.failures[0].reason == "ThrottlingException"
+
+
+def test_iter_described_tasks_yields_before_slow_chunk_finishes():
+    slow_chunk_release = threading.Event()
+    client = Mock()
+
+    def describe_tasks(**kwargs: list[str]) -> dict:
+        if kwargs["tasks"][0].endswith("task-000"):
+            assert slow_chunk_release.wait(timeout=5)
+        return {"tasks": [_task(arn) for arn in kwargs["tasks"]]}
+
+    client.describe_tasks.side_effect = describe_tasks
+
+    stream = TaskService(client).iter_described_tasks("batch", _task_arns(150))
+    first = next(stream)
+    assert first["taskArn"].endswith("task-100")
+
+    slow_chunk_release.set()
+    assert len([first, *stream]) == 150
+
+
+def test_get_task_history_pages_running_and_stopped():
+    client = Mock()
+    client.list_tasks.side_effect = [
+        {"taskArns": _task_arns(2, "running")},
+        {"taskArns": _task_arns(1, "stopped")},
+    ]
+    client.describe_tasks.side_effect = lambda **kwargs: {"tasks": [_task(arn) for arn in kwargs["tasks"]]}
+
+    history = TaskService(client).get_task_history("batch", "worker")
+
+    assert len(history) == 3
+    statuses = [call.kwargs["desiredStatus"] for call in client.list_tasks.call_args_list]
+    assert statuses == ["RUNNING", "STOPPED"]
+
+
+def test_prefetched_tasks_are_used_once():
+    client = Mock()
+    client.list_tasks.return_value = {"taskArns": _task_arns(3)}
+    client.describe_tasks.side_effect = lambda **kwargs: {"tasks": [_task(arn) for arn in kwargs["tasks"]]}
+    service = TaskService(client)
+
+    service.prefetch_service_tasks("batch", "worker")
+    first = service.get_task_info("batch", "worker", "arn:aws:ecs:us-east-1:123456789012:task-definition/batch:3")
+    assert client.describe_tasks.call_count == 1
+    assert all(info["is_desired"] for info in first)
+
+    service.get_task_info("batch", "worker", None)
+    assert client.describe_tasks.call_count == 2
+
+
+def test_get_task_details_loads_the_session_for_the_real_service():
+    service = TaskService(Mock())
+    service.get_task_session = Mock(return_value=None)
+
+    assert service.get_task_details("batch", "worker", "task-arn", None) is None
+    service.get_task_session.assert_called_once_with("batch", "worker", "task-arn", None)
@@ -117,3 +117,17 @@ def test_select_task_feature_show_history_is_second(mock_select, task_ui):
     # Check that "Show task history" is the second option
     assert choices[1]["name"] == "Show task history and failures"
     assert choices[1]["value"] == "task_action:show_history"
+
+
+@patch("lazy_ecs.core.base.select_with_navigation")
+def test_select_task_feature_offers_merged_logs_for_multiple_containers(mock_select, task_ui):
+    """Test that tasks with sidecars get task-wide log actions and single-container tasks do not."""
+    mock_select.return_value = "task_action:show_logs"
+
+    task_ui.select_task_feature({"containers": [{"name": "app"}, {"name": "envoy"}]})
+    task_ui.select_task_feature({"containers": [{"name": "app"}]})
+
+    multi, single = ([choice["value"] for choice in call.args[1]] for call in mock_select.call_args_list)
+    assert "task_action:show_logs" in multi
+    assert "task_action:follow_logs" in multi
+    assert "task_action:show_logs" not in single
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from lazy_ecs.core.batching import BatchResult, ChunkFailure
 from lazy_ecs.ui import ECSNavigator
 
 
@@ -47,7 +48,7 @@ def test_select_service_delegates_to_service_ui(mock_ecs_service) -> None:
 
 def test_select_service_action_integration(mock_ecs_service) -> None:
     """Test that select_service_action integrates ECSService and ServiceUI."""
-    mock_ecs_service.get_task_info.return_value = [{"name": "task-1", "value": "task-arn-1"}]
+    mock_ecs_service.get_task_inventory.return_value = BatchResult([{"name": "task-1", "value": "task-arn-1"}])
 
     navigator = ECSNavigator(mock_ecs_service)
     navigator._service_ui.select_service_action = Mock(return_value="task:show_details:task-arn-1")
@@ -55,7 +56,7 @@ def test_select_service_action_integration(mock_ecs_service) -> None:
     result = navigator.select_service_action("production", "web-api")
 
     assert result == "task:show_details:task-arn-1"
-    mock_ecs_service.get_task_info.assert_called_once_with("production", "web-api")
+    mock_ecs_service.get_task_inventory.assert_called_once_with("production", "web-api", None)
     navigator._service_ui.select_service_action.assert_called_once_with(
         "web-api", [{"name": "task-1", "value": "task-arn-1"}]
     )
@@ -64,22 +65,36 @@ def test_select_service_action_integration(mock_ecs_service) -> None:
 @patch("lazy_ecs.core.base.select_with_navigation")
 def test_select_task_integration(mock_select, mock_ecs_service) -> None:
     """Test that select_task integrates with ECSService properly."""
-    mock_ecs_service.get_task_info.return_value = [
-        {"name": "task-1", "value": "task-arn-1"},
-        {"name": "task-2", "value": "task-arn-2"},
-    ]
+    mock_ecs_service.get_task_inventory.return_value = BatchResult(
+        [{"name": "task-1", "value": "task-arn-1"}, {"name": "task-2", "value": "task-arn-2"}]
+    )
     mock_select.return_value = "task-arn-1"
 
     navigator = ECSNavigator(mock_ecs_service)
     result = navigator.select_task("production", "web-api")
 
     assert result == "task-arn-1"
-    mock_ecs_service.get_task_info.assert_called_once_with("production", "web-api")
+    mock_ecs_service.get_task_inventory.assert_called_once_with("production", "web-api")
+
+
+@patch("lazy_ecs.ui.print_warning")
+@patch("lazy_ecs.core.base.select_with_navigation")
+def test_select_task_reports_failed_chunks(mock_select, mock_warning, mock_ecs_service) -> None:
+    """Test that tasks from chunks that loaded are listed and failed chunks are reported."""
+    mock_ecs_service.get_task_inventory.return_value = BatchResult(
+        [{"name": "task-1", "value": "task-arn-1"}], [ChunkFailure(["task-arn-2", "task-arn-3"], "Throttled")]
+    )
+    mock_select.return_value = "task-arn-1"
+
+    navigator = ECSNavigator(mock_ecs_service)
+
+    assert navigator.select_task("production", "web-api") == "task-arn-1"
+    mock_warning.assert_called_once_with("Could not load 2 tasks: Throttled")
 
 
 def test_select_task_no_tasks(mock_ecs_service) -> None:
     """Test select_task with no tasks available."""
-    mock_ecs_service.get_task_info.return_value = []
+    mock_ecs_service.get_task_inventory.return_value = BatchResult()
 
     navigator = ECSNavigator(mock_ecs_service)
     result = navigator.select_task("production", "web-api")
@@ -162,11 +177,13 @@ def test_container_methods_delegate_to_container_ui(mock_ecs_service) -> None:
     navigator.show_container_volume_mounts("cluster", "task", "container")
 
     # Verify delegation
-    navigator._container_ui.show_container_logs.assert_called_once_with("cluster", "task", "container", 100)
-    navigator._container_ui.show_container_environment_variables.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_secrets.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_port_mappings.assert_called_once_with("cluster", "task", "container")
-    navigator._container_ui.show_container_volume_mounts.assert_called_once_with("cluster", "task", "container")
+    navigator._container_ui.show_container_logs.assert_called_once_with("cluster", "task", "container", 100, None)
+    navigator._container_ui.show_container_environment_variables.assert_called_once_with(
+        "cluster", "task", "container", None
+    )
+    navigator._container_ui.show_container_secrets.assert_called_once_with("cluster", "task", "container", None)
+    navigator._container_ui.show_container_port_mappings.assert_called_once_with("cluster", "task", "container", None)
+    navigator._container_ui.show_container_volume_mounts.assert_called_once_with("cluster", "task", "container", None)
 
 
 def test_handle_force_deployment_delegates_to_service_ui(mock_ecs_service) -> None:
@@ -215,3 +232,34 @@ def test_build_task_feature_choices() -> None:
 
     # Total: 5 actions x 2 containers + 2 navigation = 12
     assert len(choices) == 12
+
+
+def test_select_service_prefetches_selected_service_tasks(mock_ecs_service) -> None:
+    """Test that choosing a service warms its task list and task definitions in the background."""
+    task_definition_arn = "arn:aws:ecs:us-east-1:123456789012:task-definition/web:3"
+    mock_ecs_service.prefetch_service_tasks.return_value = [task_definition_arn]
+    navigator = ECSNavigator(mock_ecs_service)
+    navigator._service_ui.select_service = Mock(return_value="service:web-api")
+
+    navigator.select_service("production")
+    navigator._prefetcher.settle("tasks:production/web-api")
+    navigator._prefetcher.settle(f"task-definition:{task_definition_arn}")
+    navigator.close()
+
+    mock_ecs_service.prefetch_service_tasks.assert_called_once_with("production", "web-api")
+    mock_ecs_service.prefetch_task_definition.assert_called_once_with(task_definition_arn)
+
+
+def test_prefetch_clusters_warms_top_clusters_only(mock_ecs_service) -> None:
+    """Test that only the clusters at the top of the menu are prefetched."""
+    from lazy_ecs.core.prefetch import Prefetcher
+
+    navigator = ECSNavigator(mock_ecs_service, Prefetcher(api_budget={"describe_services": 5}))
+
+    navigator.prefetch_clusters(["a", "b", "c", "d", "e"])
+    for cluster_name in "abcde":
+        navigator._prefetcher.settle(f"services:{cluster_name}")
+    navigator.close()
+
+    warmed = sorted(call.args[0] for call in mock_ecs_service.prefetch_service_inventory.call_args_list)
+    assert warmed == ["a", "b", "c"]